@@ -6,18 +6,19 @@ Usage:
     python run_api.py                    # Development mode
     python run_api.py --env production   # Production mode
     python run_api.py --port 8080        # Custom port
+    python run_api.py --version          # Print version and exit
 """
 
 import argparse
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-import uvicorn
-from app.config import load_config
+__version__ = "1.0.0"
 
 
 def main():
@@ -53,9 +54,18 @@ def main():
         default=None,
         help="Number of worker processes (production only)"
     )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
     
+    # --help/--version exit here, before any heavy imports
     args = parser.parse_args()
     
+    import uvicorn
+    from app.config import load_config
+    
     # Override environment if specified
     if args.env:
         os.environ["ENVIRONMENT"] = args.env
@@ -70,16 +80,32 @@ def main():
     workers = args.workers or config.api.workers
     
     # Validate configuration
-    if not any([
-        config.llm.openai_api_key,
-        config.llm.gemini_api_key,
-        config.llm.groq_api_key
-    ]):
+    if not config.llm.available_providers:
         print("ERROR: No LLM API keys configured!")
         print("Please set at least one of: OPENAI_API_KEY, GEMINI_API_KEY, GROQ_API_KEY")
         print("See .env.example for configuration template")
         sys.exit(1)
     
+    # Fail loudly instead of letting uvicorn fall back to asyncio/h11
+    for setting, module in (("loop", config.api.loop), ("http", config.api.http)):
+        if module in ("uvloop", "httptools") and find_spec(module) is None:
+            print(f"ERROR: API {setting} is set to '{module}' but it is not installed!")
+            print(f"Install it with: pip install {module}")
+            print("Or set API_LOOP/API_HTTP to 'auto' to use the default implementation")
+            sys.exit(1)
+    
+    # Each worker keeps its own in-process state (e.g. caches)
+    if not reload and workers > 1 and not config.api.shared_cache_url:
+        print(f"WARNING: Running {workers} workers without SHARED_CACHE_URL; "
+              "caches will not be shared between workers")
+    
+    if config.api.access_log:
+        access_log_mode = "on"
+    elif config.api.access_log_sample:
+        access_log_mode = f"sampled (1 in {config.api.access_log_sample})"
+    else:
+        access_log_mode = "off"
+    
     # Print startup information
     print("=" * 80)
     print("Operation Ditwah Crisis Intelligence API")
@@ -88,8 +114,13 @@ def main():
     print(f"Host: {host}")
     print(f"Port: {port}")
     print(f"Default Provider: {config.llm.default_provider}")
+    print(f"Configured Providers: {', '.join(sorted(config.llm.available_providers))}")
     print(f"Auto-reload: {reload}")
     print(f"Workers: {workers if not reload else 1}")
+    print(f"Event Loop: {config.api.loop}")
+    print(f"HTTP Parser: {config.api.http}")
+    print(f"Log Level: {config.api.log_level}")
+    print(f"Access Log: {access_log_mode}")
     print("=" * 80)
     print(f"\nAPI Documentation: http://{host}:{port}/docs")
     print(f"ReDoc: http://{host}:{port}/redoc")
@@ -97,6 +128,9 @@ def main():
     print("\nPress CTRL+C to stop the server")
     print("=" * 80)
     
+    # Worker processes read the count back (rate limits are split across them)
+    os.environ["API_WORKERS"] = str(1 if reload else workers)
+    
     # Run server
     uvicorn.run(
         "app.main:app",
@@ -105,6 +139,9 @@ def main():
         reload=reload,
         workers=1 if reload else workers,
         log_level=config.api.log_level,
+        access_log=config.api.access_log,
+        loop=config.api.loop,
+        http=config.api.http,
         app_dir="src"
     )
 
@@ -3,8 +3,16 @@ Message classification API endpoints (Part 1).
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 import logging
 
+from ..schemas.common import construct_trusted
+from ..schemas.fast import (
+    BatchClassificationResponseS,
+    ClassificationResultS,
+    encode_json,
+    to_struct,
+)
 from ..schemas.classification import (
     MessageClassificationRequest,
     MessageClassificationResponse,
@@ -15,7 +23,7 @@ from ..services.classification_service import ClassificationService
 from ..utils.config_loader import get_config
 from ..utils.file_utils import (
     read_messages_from_file,
-    save_classification_results_to_excel,
+    save_classification_results_to_excel_async,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,7 +64,9 @@ async def classify_message(request: MessageClassificationRequest):
             provider_config=request.provider_config
         )
         
-        return MessageClassificationResponse(
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            MessageClassificationResponse,
             result=result,
             latency_ms=latency_ms,
             tokens_used=tokens_used
@@ -124,24 +134,33 @@ async def classify_messages_batch(request: BatchClassificationRequest):
         # Initialize service
         service = ClassificationService(provider=default_provider)
 
-        # Classify batch
-        results, total_latency_ms, total_tokens_used = service.classify_batch(
-            messages=messages,
-            provider_config=request.provider_config
-        )
+        # Classify batch (packed: several messages per LLM call)
+        if request.pack_size:
+            results, total_latency_ms, total_tokens_used = await service.aclassify_batch_packed(
+                messages=messages,
+                pack_size=request.pack_size,
+                provider_config=request.provider_config
+            )
+        else:
+            results, total_latency_ms, total_tokens_used = await service.aclassify_batch(
+                messages=messages,
+                provider_config=request.provider_config
+            )
 
         # Convert results to dictionaries for file output
         results_dicts = [result.model_dump() for result in results]
 
-        # Save and Excel
-        excel_path = save_classification_results_to_excel(results_dicts)
+        # Save Excel (written on the report writer thread, off the event loop)
+        excel_path = await save_classification_results_to_excel_async(results_dicts)
 
         logger.info(f"Saved classification results to {excel_path}")
 
         # Get preview (first 5 results)
-        preview_results = results[:5]
+        preview_results = [
+            to_struct(ClassificationResultS, result) for result in results[:5]
+        ]
 
-        return BatchClassificationResponse(
+        response = BatchClassificationResponseS(
             excel_file_path=excel_path,
             preview_results=preview_results,
             total_processed=len(results),
@@ -149,6 +168,10 @@ async def classify_messages_batch(request: BatchClassificationRequest):
             total_tokens_used=total_tokens_used
         )
 
+        # Trusted service output: encode the msgspec mirror of
+        # BatchClassificationResponse, skipping pydantic entirely
+        return Response(content=encode_json(response), media_type="application/json")
+
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
@@ -3,8 +3,16 @@ News processing API endpoints (Part 5).
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 import logging
 
+from ..schemas.common import construct_trusted
+from ..schemas.fast import (
+    BatchNewsProcessingResponseS,
+    CrisisEventS,
+    encode_json,
+    to_struct,
+)
 from ..schemas.news_processing import (
     NewsProcessingRequest,
     NewsProcessingResponse,
@@ -16,7 +24,7 @@ from ..services.news_processing_service import NewsProcessingService
 from ..utils.config_loader import get_config
 from ..utils.file_utils import (
     read_news_from_file,
-    save_crisis_events_to_excel,
+    save_crisis_events_to_excel_async,
 )
 
 logger = logging.getLogger(__name__)
@@ -58,7 +66,9 @@ async def process_news_item(request: NewsProcessingRequest):
             provider_config=request.provider_config
         )
         
-        return NewsProcessingResponse(
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            NewsProcessingResponse,
             event=event,
             success=success,
             error=error,
@@ -131,26 +141,27 @@ async def process_news_batch(request: BatchNewsProcessingRequest):
         service = NewsProcessingService(provider=default_provider)
 
         (events, total_processed, successful, failed,
-         success_rate, total_latency, total_tokens) = service.process_news_batch(
+         success_rate, total_latency, total_tokens) = await service.aprocess_news_batch(
             news_items=news_items,
             provider_config=request.provider_config
         )
 
-        # Save successfully extracted events to Excel
+        # Save successfully extracted events to Excel (written on the report
+        # writer thread, off the event loop)
         if events:
             # Convert events to dictionaries for file output
             events_dicts = [event.model_dump() for event in events]
-            excel_path = save_crisis_events_to_excel(events_dicts)
+            excel_path = await save_crisis_events_to_excel_async(events_dicts)
             logger.info(f"Saved {len(events)} crisis events to {excel_path}")
         else:
             # Create empty file if no events extracted
-            excel_path = save_crisis_events_to_excel([])
+            excel_path = await save_crisis_events_to_excel_async([])
             logger.warning("No crisis events extracted, created empty Excel file")
 
         # Get preview (first 5 events)
-        preview_events = events[:5]
+        preview_events = [to_struct(CrisisEventS, event) for event in events[:5]]
 
-        return BatchNewsProcessingResponse(
+        response = BatchNewsProcessingResponseS(
             excel_file_path=excel_path,
             preview_events=preview_events,
             total_processed=total_processed,
@@ -161,6 +172,10 @@ async def process_news_batch(request: BatchNewsProcessingRequest):
             total_tokens_used=total_tokens
         )
 
+        # Trusted service output: encode the msgspec mirror of
+        # BatchNewsProcessingResponse, skipping pydantic entirely
+        return Response(content=encode_json(response), media_type="application/json")
+
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
@@ -3,8 +3,10 @@ Resource allocation API endpoints (Part 3).
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 import logging
 
+from ..schemas.common import construct_trusted
 from ..schemas.resource_allocation import (
     PriorityScoreRequest,
     PriorityScoreResponse,
@@ -25,7 +27,10 @@ router = APIRouter()
 @router.post("/priority-score", response_model=PriorityScoreResponse)
 async def score_incident_priority(request: PriorityScoreRequest):
     """
-    Score incident priority using Chain-of-Thought reasoning.
+    Score incident priority.
+    
+    The scoring rule is applied directly; Chain-of-Thought reasoning is used
+    for incidents it can't interpret (or for all of them with `use_llm`).
     
     **Scoring Logic:**
     - Base Score: 5
@@ -58,12 +63,15 @@ async def score_incident_priority(request: PriorityScoreRequest):
         
         service = ResourceAllocationService(provider=default_provider)
         
-        scored_incidents, total_latency, total_tokens = service.score_incidents_batch(
+        scored_incidents, total_latency, total_tokens = await service.ascore_incidents_batch(
             incidents=request.incidents,
-            provider_config=request.provider_config
+            provider_config=request.provider_config,
+            use_llm=request.use_llm
         )
         
-        return PriorityScoreResponse(
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            PriorityScoreResponse,
             scored_incidents=scored_incidents,
             total_latency_ms=total_latency,
             total_tokens_used=total_tokens
@@ -80,9 +88,10 @@ async def score_incident_priority(request: PriorityScoreRequest):
 @router.post("/optimize-route", response_model=RouteOptimizationResponse)
 async def optimize_rescue_route(request: RouteOptimizationRequest):
     """
-    Optimize rescue route using Tree-of-Thought reasoning.
+    Optimize rescue route over the Tree-of-Thought strategies.
     
-    Explores 3 strategies:
+    Evaluates 3 strategies deterministically (no LLM call), plus an
+    exhaustive search for up to 8 incidents:
     1. Highest priority first (greedy)
     2. Closest location first (minimize travel)
     3. Furthest location first (logistics)
@@ -120,10 +129,13 @@ async def optimize_rescue_route(request: RouteOptimizationRequest):
             scored_incidents=request.scored_incidents,
             starting_location=request.starting_location,
             travel_times=request.travel_times,
-            provider_config=request.provider_config
+            provider_config=request.provider_config,
+            travel_matrix=request.travel_matrix
         )
         
-        return RouteOptimizationResponse(
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            RouteOptimizationResponse,
             optimal_route=optimal_route,
             strategy_used=strategy,
             reasoning=reasoning,
@@ -148,8 +160,8 @@ async def process_incidents_batch(request: BatchResourceAllocationRequest):
 
     **Automatic File Processing:**
     - Reads incidents from `data/Incidents.txt`
-    - Scores each incident using CoT reasoning (Base:5, +2 age, +3 rescue, +1 medicine)
-    - Optimizes rescue route using ToT reasoning (3 strategies)
+    - Scores each incident (Base:5, +2 age, +3 rescue, +1 medicine), with CoT reasoning when ambiguous
+    - Optimizes rescue route over the 3 ToT strategies (computed, no LLM call)
     - Default starting location: Ragama
     - Travel times: Ragama→Ja-Ela (10m), Ja-Ela→Gampaha (40m), Ragama→Gampaha (30m)
 
@@ -182,23 +194,37 @@ async def process_incidents_batch(request: BatchResourceAllocationRequest):
             )
 
         # Parse incident texts into IncidentData objects
-        # Format: "Location: X | Description: Y | People: Z | Need: W | Age: A"
+        # Format: table "ID | Time | Area | People | Ages | Main Need | Message"
+        # with a header row, or "Location: X | People: Z | Need: W | Age: A" lines
+        header = None
+        if incident_texts and "area" in incident_texts[0].lower() and ":" not in incident_texts[0]:
+            header = [column.strip().lower() for column in incident_texts.pop(0).split("|")]
+
         incidents = []
         for text in incident_texts:
-            # Simple parsing - extract key information
             parts = {}
-            for part in text.split("|"):
-                if ":" in part:
-                    key, value = part.split(":", 1)
-                    parts[key.strip().lower()] = value.strip()
+            if header:
+                row = dict(zip(header, (cell.strip() for cell in text.split("|"))))
+                parts = {
+                    "location": row.get("area"),
+                    "people": row.get("people", ""),
+                    "need": row.get("main need"),
+                    "age": row.get("ages"),
+                }
+            else:
+                # Simple parsing - extract key information
+                for part in text.split("|"):
+                    if ":" in part:
+                        key, value = part.split(":", 1)
+                        parts[key.strip().lower()] = value.strip()
 
             # Create IncidentData
             incident = IncidentData(
-                location=parts.get("location", "Unknown"),
+                location=parts.get("location") or "Unknown",
                 description=text,  # Use full text as description
                 people_affected=int(parts.get("people", 0)) if parts.get("people", "").isdigit() else None,
-                need_type=parts.get("need"),
-                age_info=parts.get("age")
+                need_type=parts.get("need") or None,
+                age_info=parts.get("age") or None
             )
             incidents.append(incident)
 
@@ -209,30 +235,17 @@ async def process_incidents_batch(request: BatchResourceAllocationRequest):
         # Initialize service
         service = ResourceAllocationService(provider=default_provider)
 
-        # Score all incidents
-        scored_incidents, scoring_latency, scoring_tokens = service.score_incidents_batch(
+        # Score all incidents and optimize the route (default travel times)
+        (scored_incidents, optimal_route, strategy, reasoning, est_time,
+         total_score, total_latency, total_tokens) = await service.aprioritize_and_route(
             incidents=incidents,
-            provider_config=request.provider_config
-        )
-
-        # Optimize route
-        (optimal_route, strategy, reasoning, est_time,
-         total_score, route_latency, route_tokens) = service.optimize_route_with_tot(
-            scored_incidents=scored_incidents,
             starting_location=request.starting_location,
-            travel_times=None,  # Use default travel times
-            provider_config=request.provider_config
+            provider_config=request.provider_config,
+            use_llm=request.use_llm
         )
 
-        # Aggregate metrics
-        total_latency = scoring_latency + route_latency
-        total_tokens = {
-            "prompt_tokens": scoring_tokens.get("prompt_tokens", 0) + route_tokens.get("prompt_tokens", 0),
-            "completion_tokens": scoring_tokens.get("completion_tokens", 0) + route_tokens.get("completion_tokens", 0),
-            "total_tokens": scoring_tokens.get("total_tokens", 0) + route_tokens.get("total_tokens", 0)
-        }
-
-        return BatchResourceAllocationResponse(
+        response = construct_trusted(
+            BatchResourceAllocationResponse,
             scored_incidents=scored_incidents,
             optimal_route=optimal_route,
             strategy_used=strategy,
@@ -242,6 +255,9 @@ async def process_incidents_batch(request: BatchResourceAllocationRequest):
             total_tokens_used=total_tokens
         )
 
+        # Trusted service output: skip response_model re-validation
+        return ORJSONResponse(content=response.model_dump(mode="json"))
+
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
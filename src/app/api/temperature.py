@@ -3,8 +3,10 @@ Temperature stability analysis API endpoints (Part 2).
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 import logging
 
+from ..schemas.common import construct_trusted
 from ..schemas.temperature import (
     TemperatureAnalysisRequest,
     TemperatureAnalysisResponse,
@@ -60,7 +62,9 @@ async def analyze_temperature_stability(request: TemperatureAnalysisRequest):
             provider_config=request.provider_config
         )
         
-        return TemperatureAnalysisResponse(
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            TemperatureAnalysisResponse,
             results=results,
             analysis=analysis,
             recommendation=recommendation,
@@ -130,7 +134,8 @@ async def analyze_temperature_stability_batch(request: BatchTemperatureAnalysisR
         response_results = []
         for results, analysis, recommendation, latency, tokens in results_per_scenario:
             response_results.append(
-                TemperatureAnalysisResponse(
+                construct_trusted(
+                    TemperatureAnalysisResponse,
                     results=results,
                     analysis=analysis,
                     recommendation=recommendation,
@@ -139,7 +144,8 @@ async def analyze_temperature_stability_batch(request: BatchTemperatureAnalysisR
                 )
             )
 
-        return BatchTemperatureAnalysisResponse(
+        response = construct_trusted(
+            BatchTemperatureAnalysisResponse,
             scenarios_analyzed=scenarios_count,
             results_per_scenario=response_results,
             overall_recommendation=overall_recommendation,
@@ -147,6 +153,9 @@ async def analyze_temperature_stability_batch(request: BatchTemperatureAnalysisR
             total_tokens_used=total_tokens
         )
 
+        # Trusted service output: skip response_model re-validation
+        return ORJSONResponse(content=response.model_dump(mode="json"))
+
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
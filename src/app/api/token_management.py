@@ -3,11 +3,15 @@ Token management API endpoints (Part 4).
 """
 
 from fastapi import APIRouter, HTTPException
+import asyncio
 import logging
 
+from ..schemas.common import construct_trusted
 from ..schemas.token_management import (
     TokenCheckRequest,
     TokenCheckResponse,
+    BatchTokenCheckRequest,
+    BatchTokenCheckResponse,
 )
 from ..services.token_management_service import TokenManagementService
 from ..utils.config_loader import get_config
@@ -56,7 +60,9 @@ async def check_message_tokens(request: TokenCheckRequest):
             provider_config=request.provider_config
         )
         
-        return TokenCheckResponse(
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            TokenCheckResponse,
             result=result,
             latency_ms=latency_ms
         )
@@ -68,3 +74,61 @@ async def check_message_tokens(request: TokenCheckRequest):
             detail=f"Token check failed: {str(e)}"
         )
 
+
+
+@router.post("/check/batch", response_model=BatchTokenCheckResponse)
+async def check_message_tokens_batch(request: BatchTokenCheckRequest):
+    """
+    Check and filter many messages in one request.
+    
+    Same strategies and per-message results as `/check`; token counts for
+    the whole batch come from one batched tokenizer call.
+    
+    **Example Request:**
+    ```json
+    {
+        "messages": [
+            "URGENT HELP NEEDED! Please forward this message...",
+            "Need water in Gampaha"
+        ],
+        "max_tokens": 150,
+        "strategy": "truncate",
+        "provider_config": {
+            "provider": "groq"
+        }
+    }
+    ```
+    
+    **Returns:**
+    - One filter result per message, in input order
+    - Total processing time
+    """
+    try:
+        config = get_config()
+        default_provider = config.get("providers", {}).get("default", "groq")
+        
+        service = TokenManagementService(provider=default_provider)
+        
+        # Off the event loop: tokenizing (and summarize's LLM calls) for a
+        # whole batch would otherwise hold up other requests
+        results, latency_ms = await asyncio.to_thread(
+            service.check_and_filter_spam_batch,
+            messages=request.messages,
+            max_tokens=request.max_tokens,
+            strategy=request.strategy,
+            provider_config=request.provider_config
+        )
+        
+        # Built from validated service output; response_model does the one check
+        return construct_trusted(
+            BatchTokenCheckResponse,
+            results=results,
+            latency_ms=latency_ms
+        )
+    
+    except Exception as e:
+        logger.error(f"Batch token check error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch token check failed: {str(e)}"
+        )
@@ -5,8 +5,9 @@ Supports multiple environments (development, staging, production).
 """
 
 import os
+from functools import lru_cache
 from typing import Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,6 +22,24 @@ class APIConfig(BaseModel):
     reload: bool = Field(default=False, description="Enable auto-reload (dev only)")
     workers: int = Field(default=1, description="Number of worker processes")
     log_level: str = Field(default="info", description="Logging level")
+    access_log: bool = Field(default=True, description="Log every request (uvicorn access log)")
+    access_log_sample: int = Field(
+        default=100,
+        ge=0,
+        description="With access_log off, log 1 in N requests from the app (0 disables)"
+    )
+    shared_cache_url: str = Field(
+        default="",
+        description="Cache shared by all workers (e.g. redis://...); empty for per-process"
+    )
+    loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="auto",
+        description="Event loop implementation passed to uvicorn"
+    )
+    http: Literal["auto", "h11", "httptools"] = Field(
+        default="auto",
+        description="HTTP protocol implementation passed to uvicorn"
+    )
 
 
 class LLMConfig(BaseModel):
@@ -33,13 +52,28 @@ class LLMConfig(BaseModel):
     openai_api_key: str = Field(default="", description="OpenAI API key")
     gemini_api_key: str = Field(default="", description="Google Gemini API key")
     groq_api_key: str = Field(default="", description="Groq API key")
+    available_providers: frozenset[str] = Field(
+        default=frozenset(),
+        description="Providers with an API key configured (computed)"
+    )
+    
+    @model_validator(mode="after")
+    def _compute_available_providers(self):
+        """Record which providers have a key so callers don't re-check each one."""
+        keys = {
+            "openai": self.openai_api_key,
+            "google": self.gemini_api_key,
+            "groq": self.groq_api_key,
+        }
+        self.available_providers = frozenset(name for name, key in keys.items() if key)
+        return self
 
 
 class SecurityConfig(BaseModel):
     """Security configuration."""
     
-    cors_origins: list[str] = Field(
-        default=["*"],
+    cors_origins: frozenset[str] = Field(
+        default=frozenset({"*"}),
         description="Allowed CORS origins"
     )
     api_key_enabled: bool = Field(
@@ -55,6 +89,14 @@ class SecurityConfig(BaseModel):
         default=100,
         description="Max requests per minute"
     )
+    
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_origins(cls, value):
+        """Accept a comma-separated string or any iterable of origins."""
+        if isinstance(value, str):
+            value = value.split(",")
+        return frozenset(origin.strip() for origin in value if origin.strip())
 
 
 class AppConfig(BaseModel):
@@ -69,40 +111,90 @@ class AppConfig(BaseModel):
     security: SecurityConfig = Field(default_factory=SecurityConfig)
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def parse_bool(value: str) -> bool:
+    """Parse an environment flag ("1", "true", "yes", "on" are truthy)."""
+    return value.strip().casefold() in _TRUE_VALUES
+
+
+# Environment variables read by load_config(), with their defaults.
+# Keys defaulting to None get an environment-dependent default below.
+_ENV_DEFAULTS: dict[str, str | None] = {
+    "ENVIRONMENT": "development",
+    "API_HOST": "0.0.0.0",
+    "API_PORT": "8000",
+    "API_RELOAD": "false",
+    "API_WORKERS": None,
+    "WEB_CONCURRENCY": None,
+    "LOG_LEVEL": None,
+    "API_ACCESS_LOG": None,
+    "API_ACCESS_LOG_SAMPLE": "100",
+    "API_LOOP": None,
+    "API_HTTP": None,
+    "SHARED_CACHE_URL": "",
+    "DEFAULT_PROVIDER": "groq",
+    "OPENAI_API_KEY": "",
+    "GEMINI_API_KEY": "",
+    "GROQ_API_KEY": "",
+    "CORS_ORIGINS": "*",
+    "API_KEY_ENABLED": "false",
+    "API_KEY": "",
+    "RATE_LIMIT_ENABLED": "false",
+    "RATE_LIMIT_REQUESTS": "100",
+}
+
+
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """
     Load configuration from environment variables.
     
+    The result is cached for the life of the process; call
+    ``load_config.cache_clear()`` after changing the environment.
+    
     Returns:
         AppConfig instance
     """
-    environment = os.getenv("ENVIRONMENT", "development")
+    env = {key: os.getenv(key, default) for key, default in _ENV_DEFAULTS.items()}
+    environment = env["ENVIRONMENT"]
+    
+    # Production pins the fast loop/parser, runs several workers and keeps
+    # per-request logging off; other environments keep uvicorn's defaults
+    is_production = environment == "production"
+    default_workers = min(os.cpu_count() or 1, 4) if is_production else 1
+    workers = env["API_WORKERS"] or env["WEB_CONCURRENCY"] or default_workers
     
     # API configuration
     api_config = APIConfig(
-        host=os.getenv("API_HOST", "0.0.0.0"),
-        port=int(os.getenv("API_PORT", "8000")),
-        reload=os.getenv("API_RELOAD", "false").lower() == "true",
-        workers=int(os.getenv("API_WORKERS", "1")),
-        log_level=os.getenv("LOG_LEVEL", "info")
+        host=env["API_HOST"],
+        port=int(env["API_PORT"]),
+        reload=parse_bool(env["API_RELOAD"]),
+        workers=int(workers),
+        log_level=env["LOG_LEVEL"] or ("warning" if is_production else "info"),
+        access_log=parse_bool(env["API_ACCESS_LOG"]) if env["API_ACCESS_LOG"] else not is_production,
+        access_log_sample=int(env["API_ACCESS_LOG_SAMPLE"]),
+        shared_cache_url=env["SHARED_CACHE_URL"],
+        loop=env["API_LOOP"] or ("uvloop" if is_production else "auto"),  # type: ignore
+        http=env["API_HTTP"] or ("httptools" if is_production else "auto")  # type: ignore
     )
     
     # LLM configuration
     llm_config = LLMConfig(
-        default_provider=os.getenv("DEFAULT_PROVIDER", "groq"),  # type: ignore
-        openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-        gemini_api_key=os.getenv("GEMINI_API_KEY", ""),
-        groq_api_key=os.getenv("GROQ_API_KEY", "")
+        default_provider=env["DEFAULT_PROVIDER"],  # type: ignore
+        openai_api_key=env["OPENAI_API_KEY"],
+        gemini_api_key=env["GEMINI_API_KEY"],
+        groq_api_key=env["GROQ_API_KEY"]
     )
     
     # Security configuration
-    cors_origins = os.getenv("CORS_ORIGINS", "*").split(",")
     security_config = SecurityConfig(
-        cors_origins=cors_origins,
-        api_key_enabled=os.getenv("API_KEY_ENABLED", "false").lower() == "true",
-        api_key=os.getenv("API_KEY", ""),
-        rate_limit_enabled=os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true",
-        rate_limit_requests=int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
+        cors_origins=env["CORS_ORIGINS"],
+        api_key_enabled=parse_bool(env["API_KEY_ENABLED"]),
+        api_key=env["API_KEY"],
+        rate_limit_enabled=parse_bool(env["RATE_LIMIT_ENABLED"]),
+        rate_limit_requests=int(env["RATE_LIMIT_REQUESTS"])
     )
     
     return AppConfig(
@@ -111,8 +203,3 @@ def load_config() -> AppConfig:
         llm=llm_config,
         security=security_config
     )
-
-
-# Global config instance
-config = load_config()
-
@@ -6,10 +6,13 @@ Converts the Jupyter notebook pipeline into REST endpoints.
 """
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+from itertools import count
 import time
+import asyncio
 import logging
 
 from .api import (
@@ -19,8 +22,13 @@ from .api import (
     token_management_router,
     news_processing_router,
 )
+from .config import load_config
 from .schemas.common import HealthResponse, ErrorResponse
 from .utils.config_loader import get_config
+from .utils.file_utils import read_all_inputs, wait_for_pending_writes
+from .utils.llm_client import aclose_clients
+from .utils.rate_limit import rate_limit_stats
+from .utils.scoring_kernel import warm_up as warm_up_scoring_kernel
 
 # Configure logging
 logging.basicConfig(
@@ -41,9 +49,30 @@ async def lifespan(app: FastAPI):
     logger.info(f"Default provider: {config.get('providers', {}).get('default', 'groq')}")
     logger.info(f"Enabled providers: {config.get('providers', {}).get('enabled', [])}")
     
+    # JIT-compile the scoring kernel now rather than on the first request
+    warm_up_scoring_kernel()
+    
+    # Read the default input files in parallel now; requests that use them
+    # then get the cached parse instead of hitting the disk
+    try:
+        inputs = await asyncio.to_thread(read_all_inputs)
+        logger.info(f"Prefetched inputs: { {name: len(items) for name, items in inputs.items()} }")
+    except FileNotFoundError as e:
+        logger.warning(f"Input prefetch skipped: {e}")
+    
     yield
     
     logger.info("Shutting down Operation Ditwah Crisis Intelligence API")
+    
+    # Rate-limit saturation, for tuning rate_limits in config.yaml
+    for provider, stats in rate_limit_stats().items():
+        logger.info(f"Rate limit stats for {provider}: {stats}")
+    
+    # Finish report files still being written in the background
+    await asyncio.to_thread(wait_for_pending_writes)
+    
+    # Release pooled provider connections
+    await aclose_clients()
 
 
 # Create FastAPI app
@@ -63,19 +92,30 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
 
-# Add CORS middleware
+# Add CORS middleware (Starlette expects a list; config keeps a frozenset)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=sorted(load_config().security.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger responses (batch previews); small ones aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# Sampled access log: when uvicorn's per-request access log is off,
+# log 1 in N requests here so traffic stays visible at low cost
+api_config = load_config().api
+access_log_sample = 0 if api_config.access_log else api_config.access_log_sample
+request_counter = count()
+
 
 # Request timing middleware
 @app.middleware("http")
@@ -85,6 +125,11 @@ async def add_process_time_header(request: Request, call_next):
     response = await call_next(request)
     process_time = time.time() - start_time
     response.headers["X-Process-Time"] = str(process_time)
+    if access_log_sample and next(request_counter) % access_log_sample == 0:
+        logger.info(
+            f"{request.method} {request.url.path} {response.status_code} "
+            f"{process_time * 1000:.1f}ms (sampled 1/{access_log_sample})"
+        )
     return response
 
 
@@ -93,7 +138,7 @@ async def add_process_time_header(request: Request, call_next):
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=ErrorResponse(
             error="InternalServerError",
@@ -30,6 +30,8 @@ from .resource_allocation import (
 from .token_management import (
     TokenCheckRequest,
     TokenCheckResponse,
+    BatchTokenCheckRequest,
+    BatchTokenCheckResponse,
     SpamFilterResult,
 )
 
@@ -46,6 +48,14 @@ from .common import (
     HealthResponse,
     ErrorResponse,
     ProviderConfig,
+    ProviderConfigField,
+    ProviderEnum,
+    IntentEnum,
+    PriorityEnum,
+    DistrictEnum,
+    StatusEnum,
+    FilterStatusEnum,
+    construct_trusted,
 )
 
 __all__ = [
@@ -69,6 +79,8 @@ __all__ = [
     # Token Management
     "TokenCheckRequest",
     "TokenCheckResponse",
+    "BatchTokenCheckRequest",
+    "BatchTokenCheckResponse",
     "SpamFilterResult",
     # News Processing
     "CrisisEvent",
@@ -81,5 +93,13 @@ __all__ = [
     "HealthResponse",
     "ErrorResponse",
     "ProviderConfig",
+    "ProviderConfigField",
+    "ProviderEnum",
+    "IntentEnum",
+    "PriorityEnum",
+    "DistrictEnum",
+    "StatusEnum",
+    "FilterStatusEnum",
+    "construct_trusted",
 ]
 
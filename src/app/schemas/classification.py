@@ -2,21 +2,23 @@
 Schemas for message classification API (Part 1).
 """
 
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 
-from .common import ProviderConfig
+from .common import DEFER_BUILD, IntentEnum, PriorityEnum, ProviderConfig, ProviderConfigField
 
 
 class ClassificationResult(BaseModel):
     """Result of classifying a single message."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD, use_enum_values=True)
     
     message: str = Field(description="Original message text")
     district: str = Field(description="Identified district or 'None'")
-    intent: Literal["Rescue", "Supply", "Info", "Other"] = Field(
+    intent: IntentEnum = Field(
         description="Message intent category"
     )
-    priority: Literal["High", "Low"] = Field(description="Priority level")
+    priority: PriorityEnum = Field(description="Priority level")
     raw_output: str = Field(description="Raw LLM classification output")
     confidence: Optional[float] = Field(
         default=None,
@@ -28,20 +30,21 @@ class ClassificationResult(BaseModel):
 
 class MessageClassificationRequest(BaseModel):
     """Request to classify a single crisis message."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     message: str = Field(
         description="Crisis message to classify",
         min_length=1,
         max_length=5000
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    provider_config: ProviderConfigField
 
 
 class MessageClassificationResponse(BaseModel):
     """Response from message classification."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     result: ClassificationResult = Field(description="Classification result")
     latency_ms: int = Field(description="Processing latency in milliseconds")
@@ -56,19 +59,31 @@ class BatchClassificationRequest(BaseModel):
     You can optionally specify a custom file path.
     """
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     file_path: Optional[str] = Field(
         default=None,
         description="Optional custom file path (absolute or relative to project root). "
                     "If not provided, defaults to 'data/Sample Messages.txt'"
     )
-    provider_config: Optional[ProviderConfig] = Field(
+    pack_size: Optional[int] = Field(
         default=None,
-        description="Optional provider configuration override"
+        ge=1,
+        le=50,
+        description="Classify this many messages per LLM call (one call per message if omitted)"
     )
+    provider_config: ProviderConfigField
 
 
 class BatchClassificationResponse(BaseModel):
-    """Response from batch classification with file outputs."""
+    """
+    Response from batch classification with file outputs.
+
+    Trusted internal schema: built from service output and returned without
+    response-model validation.
+    """
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
 
     excel_file_path: str = Field(description="Path to generated Excel file")
     preview_results: list[ClassificationResult] = Field(
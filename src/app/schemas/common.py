@@ -2,14 +2,111 @@
 Common schemas used across the API.
 """
 
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+import os
+from enum import StrEnum
+from typing import Annotated, Any, Optional, TypeVar
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..config import parse_bool
+
+# Build pydantic-core validators on first use instead of at import time.
+# Set SCHEMAS_DEFER_BUILD=false to build eagerly (e.g. to surface schema errors).
+DEFER_BUILD = parse_bool(os.getenv("SCHEMAS_DEFER_BUILD", "true"))
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+# Shared choice sets. Models using these set use_enum_values=True, so fields
+# hold the plain string value and compare equal to the old Literal strings.
+
+class ProviderEnum(StrEnum):
+    """Supported LLM providers."""
+
+    OPENAI = "openai"
+    GOOGLE = "google"
+    GROQ = "groq"
+
+
+class IntentEnum(StrEnum):
+    """Crisis message intent categories."""
+
+    RESCUE = "Rescue"
+    SUPPLY = "Supply"
+    INFO = "Info"
+    OTHER = "Other"
+
+
+class PriorityEnum(StrEnum):
+    """Crisis message priority levels."""
+
+    HIGH = "High"
+    LOW = "Low"
+
+
+class DistrictEnum(StrEnum):
+    """Districts covered by crisis event extraction."""
+
+    COLOMBO = "Colombo"
+    GAMPAHA = "Gampaha"
+    KANDY = "Kandy"
+    KALUTARA = "Kalutara"
+    GALLE = "Galle"
+    MATARA = "Matara"
+    RATNAPURA = "Ratnapura"
+    OTHER = "Other"
+
+
+class StatusEnum(StrEnum):
+    """Crisis event severity."""
+
+    CRITICAL = "Critical"
+    WARNING = "Warning"
+    STABLE = "Stable"
+
+
+class FilterStatusEnum(StrEnum):
+    """Spam filter decisions."""
+
+    ACCEPTED = "ACCEPTED"
+    TRUNCATED = "BLOCKED/TRUNCATED"
+    SUMMARIZED = "SUMMARIZED"
+
+
+def construct_trusted(cls: type[ModelT], **data: Any) -> ModelT:
+    """
+    Build a schema instance from trusted data without re-validating it.
+
+    Wraps ``model_construct``, which skips pydantic-core validation entirely.
+    Trusted data only: use this for values our own services have already
+    normalized (parsed LLM fields, clamped scores, counters). Anything that
+    comes from HTTP input or raw LLM JSON must use the validating constructor.
+
+    Args:
+        cls: Pydantic model class to build
+        **data: Field values
+
+    Returns:
+        Model instance
+    """
+    return cls.model_construct(**data)
 
 
 class ProviderConfig(BaseModel):
-    """LLM provider configuration."""
+    """
+    LLM provider configuration.
+
+    Immutable and hashable, so nested instances are shared rather than
+    copied when a parent request is validated.
+    """
+
+    model_config = ConfigDict(
+        defer_build=DEFER_BUILD,
+        use_enum_values=True,
+        frozen=True,
+        revalidate_instances="never",
+    )
     
-    provider: Literal["openai", "google", "groq"] = Field(
+    provider: ProviderEnum = Field(
         default="groq",
         description="LLM provider to use"
     )
@@ -26,8 +123,18 @@ class ProviderConfig(BaseModel):
     )
 
 
+# Shared annotation for the optional provider_config field on request models.
+# Reusing one object keeps the field definition identical across routes.
+ProviderConfigField = Annotated[
+    Optional[ProviderConfig],
+    Field(default=None, description="Optional provider configuration override"),
+]
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     status: str = Field(default="healthy", description="Service status")
     version: str = Field(description="API version")
@@ -36,6 +143,8 @@ class HealthResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standard error response."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     error: str = Field(description="Error type")
     message: str = Field(description="Human-readable error message")
@@ -0,0 +1,80 @@
+"""
+msgspec mirrors of the batch response schemas.
+
+The pydantic models in this package stay the source of truth for request
+validation and OpenAPI docs. Batch routes that return large previews encode
+these structs with msgspec instead, which skips pydantic-core on the way out.
+Field order matches the pydantic models so the JSON is identical.
+"""
+
+from typing import Any, Optional, TypeVar
+
+import msgspec
+from pydantic import BaseModel
+
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+
+_encoder = msgspec.json.Encoder()
+
+
+class ClassificationResultS(msgspec.Struct, kw_only=True):
+    """Struct mirror of ClassificationResult."""
+
+    message: str
+    district: str
+    intent: str
+    priority: str
+    raw_output: str
+    confidence: Optional[float] = None
+
+
+class CrisisEventS(msgspec.Struct, kw_only=True):
+    """Struct mirror of CrisisEvent."""
+
+    district: str
+    flood_level_meters: Optional[float] = None
+    victim_count: int = 0
+    main_need: str
+    status: str
+
+
+class BatchClassificationResponseS(msgspec.Struct, kw_only=True):
+    """Struct mirror of BatchClassificationResponse."""
+
+    excel_file_path: str
+    preview_results: list[ClassificationResultS]
+    total_processed: int
+    total_latency_ms: int
+    total_tokens_used: dict[str, Any]
+
+
+class BatchNewsProcessingResponseS(msgspec.Struct, kw_only=True):
+    """Struct mirror of BatchNewsProcessingResponse."""
+
+    excel_file_path: str
+    preview_events: list[CrisisEventS]
+    total_processed: int
+    successful_extractions: int
+    failed_extractions: int
+    success_rate: float
+    total_latency_ms: int
+    total_tokens_used: dict[str, Any]
+
+
+def to_struct(struct_type: type[StructT], model: BaseModel) -> StructT:
+    """
+    Copy a pydantic row into its struct mirror without re-validating.
+
+    Args:
+        struct_type: Target msgspec struct class
+        model: Pydantic model instance with the same fields
+
+    Returns:
+        Struct instance
+    """
+    return struct_type(**dict(model))
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a struct (or builtin container) to JSON bytes."""
+    return _encoder.encode(value)
@@ -2,16 +2,23 @@
 Schemas for news processing API (Part 5).
 """
 
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 
-from .common import ProviderConfig
+from .common import DEFER_BUILD, DistrictEnum, ProviderConfig, ProviderConfigField, StatusEnum
 
 
 class CrisisEvent(BaseModel):
-    """Structured crisis event data model."""
+    """
+    Structured crisis event data model.
+
+    Extra keys are ignored rather than forbidden: this model validates raw
+    LLM JSON, which may carry fields beyond the schema.
+    """
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD, use_enum_values=True)
 
-    district: Literal["Colombo", "Gampaha", "Kandy", "Kalutara", "Galle", "Matara", "Ratnapura", "Other"] = Field(
+    district: DistrictEnum = Field(
         description="District where event occurred"
     )
     flood_level_meters: Optional[float] = Field(
@@ -24,13 +31,15 @@ class CrisisEvent(BaseModel):
         description="Number of victims/people affected"
     )
     main_need: str = Field(description="Primary need or emergency type")
-    status: Literal["Critical", "Warning", "Stable"] = Field(
+    status: StatusEnum = Field(
         description="Event status/severity"
     )
 
 
 class NewsItem(BaseModel):
     """Single news item to process."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     text: str = Field(
         description="News item text",
@@ -43,16 +52,17 @@ class NewsItem(BaseModel):
 
 class NewsProcessingRequest(BaseModel):
     """Request to process a single news item."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     news_item: NewsItem = Field(description="News item to process")
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    provider_config: ProviderConfigField
 
 
 class NewsProcessingResponse(BaseModel):
     """Response from processing a single news item."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     event: Optional[CrisisEvent] = Field(
         default=None,
@@ -72,19 +82,25 @@ class BatchNewsProcessingRequest(BaseModel):
     You can optionally specify a custom file path.
     """
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     file_path: Optional[str] = Field(
         default=None,
         description="Optional custom file path (absolute or relative to project root). "
                     "If not provided, defaults to 'data/News Feed.txt'"
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    provider_config: ProviderConfigField
 
 
 class BatchNewsProcessingResponse(BaseModel):
-    """Response from batch news processing with file output."""
+    """
+    Response from batch news processing with file output.
+
+    Trusted internal schema: built from service output and returned without
+    response-model validation.
+    """
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
 
     excel_file_path: str = Field(description="Path to generated Excel file")
     preview_events: list[CrisisEvent] = Field(
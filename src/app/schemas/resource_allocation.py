@@ -3,13 +3,20 @@ Schemas for resource allocation API (Part 3).
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
-from .common import ProviderConfig
+from .common import DEFER_BUILD, ProviderConfig, ProviderConfigField
+from ..utils.travel_matrix import TravelMatrix, build_travel_matrix
 
 
 class IncidentData(BaseModel):
-    """Crisis incident data."""
+    """Crisis incident data (immutable and hashable)."""
+
+    model_config = ConfigDict(
+        defer_build=DEFER_BUILD,
+        frozen=True,
+        revalidate_instances="never",
+    )
     
     location: str = Field(description="Incident location")
     description: str = Field(description="Incident description")
@@ -19,7 +26,14 @@ class IncidentData(BaseModel):
 
 
 class ScoredIncident(BaseModel):
-    """Incident with priority score."""
+    """
+    Incident with priority score.
+
+    Also the /optimize-route request body, where unknown keys are rejected
+    (services build it with construct_trusted, which doesn't check extras).
+    """
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD, extra="forbid")
     
     incident: IncidentData = Field(description="Original incident data")
     score: int = Field(ge=0, le=10, description="Priority score (0-10)")
@@ -28,20 +42,25 @@ class ScoredIncident(BaseModel):
 
 class PriorityScoreRequest(BaseModel):
     """Request to score incident priority using CoT."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     incidents: list[IncidentData] = Field(
         description="List of incidents to score",
         min_length=1,
         max_length=20
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
+    use_llm: bool = Field(
+        default=False,
+        description="Score every incident with CoT LLM reasoning instead of the scoring rule"
     )
+    provider_config: ProviderConfigField
 
 
 class PriorityScoreResponse(BaseModel):
     """Response from priority scoring."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     scored_incidents: list[ScoredIncident] = Field(description="Incidents with priority scores")
     total_latency_ms: int = Field(description="Total processing time")
@@ -50,6 +69,8 @@ class PriorityScoreResponse(BaseModel):
 
 class RouteOptimizationRequest(BaseModel):
     """Request to optimize rescue route using ToT."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     scored_incidents: list[ScoredIncident] = Field(
         description="Pre-scored incidents to optimize route for",
@@ -64,15 +85,28 @@ class RouteOptimizationRequest(BaseModel):
         default=None,
         description="Travel time matrix (location -> location -> minutes)"
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    provider_config: ProviderConfigField
+
+    _travel_matrix: Optional[TravelMatrix] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _build_travel_matrix(self):
+        """Materialize travel_times as a dense matrix once per request."""
+        if self.travel_times:
+            self._travel_matrix = build_travel_matrix(self.travel_times)
+        return self
+
+    @property
+    def travel_matrix(self) -> Optional[TravelMatrix]:
+        """Dense form of travel_times (None if not provided)."""
+        return self._travel_matrix
 
 
 class RouteOptimizationResponse(BaseModel):
     """Response from route optimization."""
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     optimal_route: list[str] = Field(description="Optimized sequence of locations")
     strategy_used: str = Field(description="Strategy selected (e.g., 'Highest priority first')")
     reasoning: str = Field(description="ToT reasoning for route selection")
@@ -90,22 +124,32 @@ class BatchResourceAllocationRequest(BaseModel):
     Request to process incidents from file.
 
     Automatically reads incidents from data/Incidents.txt and:
-    - Scores each incident using CoT reasoning
+    - Scores each incident (rule-based, CoT reasoning when ambiguous)
     - Optimizes rescue route using ToT reasoning
     """
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     starting_location: str = Field(
         default="Ragama",
         description="Starting location for rescue team"
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
+    use_llm: bool = Field(
+        default=False,
+        description="Score every incident with CoT LLM reasoning instead of the scoring rule"
     )
+    provider_config: ProviderConfigField
 
 
 class BatchResourceAllocationResponse(BaseModel):
-    """Response from batch resource allocation."""
+    """
+    Response from batch resource allocation.
+
+    Trusted internal schema: built from service output and returned without
+    response-model validation.
+    """
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
 
     scored_incidents: list[ScoredIncident] = Field(
         description="All incidents with priority scores"
@@ -2,14 +2,15 @@
 Schemas for temperature analysis API (Part 2).
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .common import ProviderConfig
+from .common import DEFER_BUILD, ProviderConfig, ProviderConfigField
 
 
 class TemperatureTestResult(BaseModel):
     """Result from a single temperature test iteration."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     temperature: float = Field(description="Temperature value used")
     iteration: int = Field(description="Iteration number")
@@ -20,6 +21,8 @@ class TemperatureTestResult(BaseModel):
 
 class TemperatureAnalysisRequest(BaseModel):
     """Request to analyze temperature stability."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     scenario: str = Field(
         description="Crisis scenario to analyze",
@@ -38,15 +41,14 @@ class TemperatureAnalysisRequest(BaseModel):
         le=10,
         description="Number of iterations per temperature value"
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    provider_config: ProviderConfigField
 
 
 class TemperatureAnalysisResponse(BaseModel):
     """Response from temperature analysis."""
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     results: list[TemperatureTestResult] = Field(
         description="Test results for all temperature/iteration combinations"
     )
@@ -69,14 +71,20 @@ class BatchTemperatureAnalysisRequest(BaseModel):
     - 1 run at temperature=0.0 (deterministic)
     """
 
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
+    provider_config: ProviderConfigField
 
 
 class BatchTemperatureAnalysisResponse(BaseModel):
-    """Response from batch temperature analysis."""
+    """
+    Response from batch temperature analysis.
+
+    Trusted internal schema: built from service output and returned without
+    response-model validation.
+    """
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
 
     scenarios_analyzed: int = Field(description="Number of scenarios analyzed")
     results_per_scenario: list[TemperatureAnalysisResponse] = Field(
@@ -2,16 +2,18 @@
 Schemas for token management API (Part 4).
 """
 
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
 
-from .common import ProviderConfig
+from .common import DEFER_BUILD, FilterStatusEnum, ProviderConfig, ProviderConfigField
 
 
 class SpamFilterResult(BaseModel):
     """Result of spam filtering."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD, use_enum_values=True)
     
-    status: Literal["ACCEPTED", "BLOCKED/TRUNCATED", "SUMMARIZED"] = Field(
+    status: FilterStatusEnum = Field(
         description="Filter decision"
     )
     original_token_count: int = Field(description="Original message token count")
@@ -23,6 +25,8 @@ class SpamFilterResult(BaseModel):
 
 class TokenCheckRequest(BaseModel):
     """Request to check and filter message tokens."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     message: str = Field(
         description="Message to check",
@@ -39,15 +43,46 @@ class TokenCheckRequest(BaseModel):
         default="truncate",
         description="Strategy for handling overflow"
     )
-    provider_config: Optional[ProviderConfig] = Field(
-        default=None,
-        description="Optional provider configuration override"
-    )
+    provider_config: ProviderConfigField
 
 
 class TokenCheckResponse(BaseModel):
     """Response from token check."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
     
     result: SpamFilterResult = Field(description="Spam filter result")
     latency_ms: int = Field(description="Processing time in milliseconds")
 
+
+
+class BatchTokenCheckRequest(BaseModel):
+    """Request to check and filter many messages at once."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+    
+    messages: list[str] = Field(
+        description="Messages to check",
+        min_length=1,
+        max_length=1000
+    )
+    max_tokens: int = Field(
+        default=150,
+        ge=10,
+        le=10000,
+        description="Maximum allowed tokens per message"
+    )
+    strategy: Literal["truncate", "summarize"] = Field(
+        default="truncate",
+        description="Strategy for handling overflow"
+    )
+    provider_config: ProviderConfigField
+
+
+class BatchTokenCheckResponse(BaseModel):
+    """Response from batch token check."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+    
+    results: list[SpamFilterResult] = Field(description="Spam filter results, in input order")
+    latency_ms: int = Field(description="Processing time in milliseconds")
@@ -4,13 +4,20 @@ Message classification service (Part 1 - Few-Shot Learning).
 Converts the notebook's classify_message() function into a service class.
 """
 
-import time
+import re
 from typing import Optional
 
-from ..utils.prompts import render
-from ..utils.llm_client import LLMClient
+import numpy as np
+
+from ..utils.prompts import render, render_system
+from ..utils.llm_client import get_client, run_sync
+from ..utils.concurrency import gather_bounded
+from ..utils.config_loader import get_max_concurrency
 from ..utils.logging_utils import log_llm_call
 from ..utils.router import pick_model
+from ..utils.semantic_cache import get_semantic_cache
+from ..utils.token_utils import aggregate_usage, merge_usage, reconcile_usage
+from ..schemas.common import construct_trusted
 from ..schemas.classification import ClassificationResult, ProviderConfig
 
 
@@ -27,6 +34,84 @@ Output: District: Colombo | Intent: Info | Priority: Low
 Input: "Please share this post to help the victims."
 Output: District: None | Intent: Other | Priority: Low"""
 
+TECHNIQUE = "few_shot_classification"
+
+# "Field: value" pairs in the model output; values stop at "|" or end of line
+_FIELDS_RE = re.compile(r"\b(District|Intent|Priority):[ \t]*([^|\n]*)", re.IGNORECASE)
+
+# Normalized intent/priority values (anything else maps to Other/Low)
+_INTENT_MAP = {
+    "rescue": "Rescue", "救援": "Rescue",
+    "supply": "Supply", "supplies": "Supply", "物资": "Supply",
+    "info": "Info", "information": "Info", "信息": "Info",
+}
+_PRIORITY_MAP = {"high": "High", "low": "Low"}
+
+
+def _field_names(text: str, finished: bool = False) -> set[str]:
+    """
+    Lowercased names of the fields that have a value.
+
+    With finished=True a value only counts once "|" or a newline follows
+    it (so a value still being streamed isn't taken as complete).
+    """
+    return {
+        match.group(1).lower()
+        for match in _FIELDS_RE.finditer(text)
+        if match.group(2).strip() and (not finished or match.end() < len(text))
+    }
+
+
+def _fields_complete(text: str) -> bool:
+    """True once District, Intent and Priority each have a finished value."""
+    return len(_field_names(text, finished=True)) == 3
+
+
+# Below this completion budget there's no padding worth cutting off, so
+# the response isn't streamed
+STREAM_MIN_MAX_TOKENS = 50
+
+
+def _should_stream(max_tokens: Optional[int]) -> bool:
+    """Whether to stream with early stop for this completion budget."""
+    return max_tokens is None or max_tokens >= STREAM_MIN_MAX_TOKENS
+
+
+def _first_word(value: str) -> str:
+    """Lowercased first word of a field value ("" if empty)."""
+    words = value.split(maxsplit=1)
+    return words[0].lower() if words else ""
+
+
+# "<n>. <answer>" lines in a packed (multi-message) response
+_PACKED_LINE_RE = re.compile(r"^\s*(\d+)[.)]\s*(.*)$", re.MULTILINE)
+
+
+def _parse_fields(output: str) -> tuple[str, str, str]:
+    """Extract (district, intent, priority) from one answer."""
+    # One regex pass; the first occurrence of each field wins
+    fields = {}
+    for match in _FIELDS_RE.finditer(output):
+        fields.setdefault(match.group(1).lower(), match.group(2).strip())
+
+    district = fields.get("district") or "None"
+    intent = _INTENT_MAP.get(_first_word(fields.get("intent", "")), "Other")
+    priority = _PRIORITY_MAP.get(_first_word(fields.get("priority", "")), "Low")
+    return district, intent, priority
+
+
+PROMPT_VARS = {
+    "role": "Crisis Message Classifier for Sri Lanka Disaster Management Center",
+    "examples": FEW_SHOT_EXAMPLES,
+    "constraints": "Classify based on location (district), intent (Rescue/Supply/Info/Other), and priority (High/Low)",
+    "format": "District: [Name or None] | Intent: [Category] | Priority: [High/Low]",
+}
+
+# Static prefixes (role, examples, constraints, format), rendered once so
+# they're byte-identical across calls and providers can cache them
+SYSTEM_PROMPT = render_system("few_shot_chat.v1", **PROMPT_VARS)
+PACKED_SYSTEM_PROMPT = render_system("few_shot_batch_chat.v1", **PROMPT_VARS)
+
 
 class ClassificationService:
     """Service for classifying crisis messages using few-shot learning."""
@@ -40,119 +125,229 @@ class ClassificationService:
         """
         self.provider = provider
     
-    def classify_message(
+    def _build_request(
         self,
         message: str,
-        provider_config: Optional[ProviderConfig] = None
-    ) -> tuple[ClassificationResult, int, dict]:
+        provider_config: Optional[ProviderConfig]
+    ) -> tuple[str, str, list[dict], dict]:
         """
-        Classify a crisis message using few-shot learning.
-        
-        Args:
-            message: Crisis message to classify
-            provider_config: Optional provider configuration override
+        Resolve provider/model and render the few-shot prompt.
         
         Returns:
-            Tuple of (ClassificationResult, latency_ms, token_usage)
+            Tuple of (provider, model, messages, chat_kwargs)
         """
         # Determine provider and settings
         provider = provider_config.provider if provider_config else self.provider
         temperature = provider_config.temperature if provider_config else None
         max_tokens = provider_config.max_tokens if provider_config else None
         
-        # Select model for general task
-        model = pick_model(provider, "few_shot", tier="general")
+        # Three labels is simple enough for the tiny tier (answers that
+        # don't parse are escalated to the general tier)
+        model = pick_model(provider, "few_shot", tier="tiny")
         
-        # Render few-shot prompt
-        prompt_text, spec = render(
-            "few_shot.v1",
-            role="Crisis Message Classifier for Sri Lanka Disaster Management Center",
-            examples=FEW_SHOT_EXAMPLES,
-            query=message,
-            constraints="Classify based on location (district), intent (Rescue/Supply/Info/Other), and priority (High/Low)",
-            format="District: [Name or None] | Intent: [Category] | Priority: [High/Low]"
-        )
+        # Render few-shot prompt (only the query varies per call)
+        prompt_text, spec = render("few_shot_chat.v1", query=message)
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt_text},
+        ]
         
-        # Create client and call
-        start_time = time.time()
-        client = LLMClient(provider, model)
-        response = client.chat(
-            messages=[{"role": "user", "content": prompt_text}],
-            temperature=temperature if temperature is not None else spec.temperature,
-            max_tokens=max_tokens if max_tokens is not None else spec.max_tokens
-        )
+        chat_kwargs = {
+            "temperature": temperature if temperature is not None else spec.temperature,
+            "max_tokens": max_tokens if max_tokens is not None else spec.max_tokens,
+        }
+        return provider, model, messages, chat_kwargs
+    
+    def _semantic_lookup(
+        self,
+        message: str,
+        provider: str,
+        model: str,
+        temperature: Optional[float]
+    ) -> tuple[Optional[tuple[ClassificationResult, int, dict]], Optional[np.ndarray]]:
+        """
+        Look up a near-duplicate message in the semantic cache.
+        
+        Like the exact-match response cache, only deterministic calls
+        (temperature 0) read or fill it: a sampled answer shouldn't be
+        replayed, or stand in for one made with other settings.
         
-        # Log the call
+        Returns:
+            Tuple of (cached classify_message() result or None, message
+            embedding or None if the cache is disabled or not used)
+        """
+        if temperature != 0:
+            return None, None
+        
+        cache = get_semantic_cache(TECHNIQUE, provider, model)
+        if cache is None:
+            return None, None
+        
+        embedding = cache.embed(message)
+        cached, _ = cache.search(embedding)
+        if cached is None:
+            return None, embedding
+        
+        result = construct_trusted(ClassificationResult, message=message, **cached)
+        usage = reconcile_usage({}, {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0})
+        return (result, 0, usage), embedding
+    
+    def _log_call(self, provider: str, model: str, response: dict) -> None:
+        """Log one classification call."""
         log_llm_call(
             provider=provider,
             model=model,
-            technique="few_shot_classification",
+            technique=TECHNIQUE,
             latency_ms=response["latency_ms"],
             usage=response["usage"],
             retry_count=response["meta"]["retry_count"],
             backoff_ms_total=response["meta"]["backoff_ms_total"],
-            overflow_handled=response["meta"]["overflow_handled"]
+            overflow_handled=response["meta"]["overflow_handled"],
+            notes=" ".join(
+                flag for flag in ("cache_hit", "stopped_early") if response["meta"].get(flag)
+            ),
         )
+    
+    def _chat(self, provider: str, model: str, messages: list[dict], chat_kwargs: dict) -> dict:
+        """Call the model and log it; stream and stop once all three fields are in."""
+        client = get_client(provider, model)
+        if _should_stream(chat_kwargs["max_tokens"]):
+            response = client.chat_until(messages, _fields_complete, **chat_kwargs)
+        else:
+            response = client.chat(messages=messages, **chat_kwargs)
+        self._log_call(provider, model, response)
+        return response
+    
+    async def _achat(self, provider: str, model: str, messages: list[dict], chat_kwargs: dict) -> dict:
+        """Async variant of _chat()."""
+        client = get_client(provider, model)
+        if _should_stream(chat_kwargs["max_tokens"]):
+            response = await client.achat_until(messages, _fields_complete, **chat_kwargs)
+        else:
+            response = await client.achat(messages=messages, **chat_kwargs)
+        self._log_call(provider, model, response)
+        return response
+    
+    @staticmethod
+    def _escalation_model(provider: str, model: str, response: dict) -> Optional[str]:
+        """
+        Model to retry on when the answer is missing a field.
         
+        Returns:
+            The general-tier model, or None to accept the answer (it parsed,
+            or model already is the general tier)
+        """
+        if len(_field_names(response["text"])) == 3:
+            return None
+        general_model = pick_model(provider, "few_shot", tier="general")
+        return None if general_model == model else general_model
+    
+    @staticmethod
+    def _escalated(first: dict, second: dict) -> dict:
+        """The escalated response, with latency and usage covering both calls."""
+        return {
+            **second,
+            "latency_ms": first["latency_ms"] + second["latency_ms"],
+            "usage": merge_usage(first["usage"], second["usage"]),
+        }
+    
+    def _handle_response(
+        self,
+        message: str,
+        provider: str,
+        model: str,
+        response: dict,
+        embedding: Optional[np.ndarray] = None
+    ) -> tuple[ClassificationResult, int, dict]:
+        """Parse the classification and store it in model's semantic cache."""
         # Parse output
         output = response["text"].strip()
 
-        # Extract fields using simple parsing
-        district = "None"
-        intent = "Other"
-        priority = "Low"
-
-        if "District:" in output:
-            district_raw = output.split("District:")[1].split("|")[0].strip()
-            # Clean district (take first word/line)
-            district = district_raw.split("\n")[0].strip()
-
-        if "Intent:" in output:
-            intent_raw = output.split("Intent:")[1].split("|")[0].strip()
-            # Clean intent (take first word/line and normalize)
-            intent_clean = intent_raw.split()[0].split("\n")[0].strip()
-            # Map to valid intent values
-            intent_lower = intent_clean.lower()
-            if intent_lower in ["rescue", "救援"]:
-                intent = "Rescue"
-            elif intent_lower in ["supply", "supplies", "物资"]:
-                intent = "Supply"
-            elif intent_lower in ["info", "information", "信息"]:
-                intent = "Info"
-            else:
-                intent = "Other"
-
-        if "Priority:" in output:
-            # Extract priority and clean it (remove any text after the value)
-            priority_raw = output.split("Priority:")[1].strip()
-            # Take only the first word/line and normalize
-            priority_clean = priority_raw.split()[0].split("\n")[0].strip()
-            # Ensure it's exactly "High" or "Low"
-            if priority_clean.lower() == "high":
-                priority = "High"
-            elif priority_clean.lower() == "low":
-                priority = "Low"
-            else:
-                priority = "Low"  # Default to Low if unclear
+        district, intent, priority = _parse_fields(output)
 
         # Create result
-        result = ClassificationResult(
+        result = construct_trusted(
+            ClassificationResult,
             message=message,
             district=district,
-            intent=intent,  # type: ignore
-            priority=priority,  # type: ignore
+            intent=intent,
+            priority=priority,
             raw_output=output
         )
         
+        if embedding is not None:
+            get_semantic_cache(TECHNIQUE, provider, model).add(
+                embedding,
+                {"district": district, "intent": intent, "priority": priority, "raw_output": output}
+            )
+        
         return result, response["latency_ms"], response["usage"]
     
-    def classify_batch(
+    def classify_message(
+        self,
+        message: str,
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[ClassificationResult, int, dict]:
+        """
+        Classify a crisis message using few-shot learning.
+        
+        Args:
+            message: Crisis message to classify
+            provider_config: Optional provider configuration override
+        
+        Returns:
+            Tuple of (ClassificationResult, latency_ms, token_usage)
+        """
+        provider, model, messages, chat_kwargs = self._build_request(message, provider_config)
+        
+        # Near-duplicate of an already classified message?
+        cached, embedding = self._semantic_lookup(message, provider, model, chat_kwargs["temperature"])
+        if cached is not None:
+            return cached
+        
+        response = self._chat(provider, model, messages, chat_kwargs)
+        # Answer missing a field? Retry once on the general tier
+        general_model = self._escalation_model(provider, model, response)
+        if general_model is not None:
+            response = self._escalated(
+                response, self._chat(provider, general_model, messages, chat_kwargs)
+            )
+        
+        return self._handle_response(message, provider, model, response, embedding)
+    
+    async def aclassify_message(
+        self,
+        message: str,
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[ClassificationResult, int, dict]:
+        """Async variant of classify_message()."""
+        provider, model, messages, chat_kwargs = self._build_request(message, provider_config)
+        
+        # Near-duplicate of an already classified message?
+        cached, embedding = self._semantic_lookup(message, provider, model, chat_kwargs["temperature"])
+        if cached is not None:
+            return cached
+        
+        response = await self._achat(provider, model, messages, chat_kwargs)
+        # Answer missing a field? Retry once on the general tier
+        general_model = self._escalation_model(provider, model, response)
+        if general_model is not None:
+            response = self._escalated(
+                response, await self._achat(provider, general_model, messages, chat_kwargs)
+            )
+        
+        return self._handle_response(message, provider, model, response, embedding)
+    
+    async def aclassify_batch(
         self,
         messages: list[str],
         provider_config: Optional[ProviderConfig] = None
     ) -> tuple[list[ClassificationResult], int, dict]:
         """
-        Classify multiple messages.
+        Classify multiple messages concurrently.
+        
+        Calls run in parallel, bounded by the provider's concurrency limit
+        in config.yaml. Results keep the input order.
         
         Args:
             messages: List of crisis messages to classify
@@ -161,19 +356,188 @@ class ClassificationService:
         Returns:
             Tuple of (results, total_latency_ms, total_token_usage)
         """
+        provider = provider_config.provider if provider_config else self.provider
+        outcomes = await gather_bounded(
+            (self.aclassify_message(message, provider_config) for message in messages),
+            limit=get_max_concurrency(provider)
+        )
+        
         results = []
         total_latency = 0
-        total_tokens = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         
-        for message in messages:
-            result, latency, usage = self.classify_message(message, provider_config)
+        for result, latency, _ in outcomes:
             results.append(result)
             total_latency += latency
-            
-            # Aggregate token usage
-            for key in total_tokens:
-                if key in usage:
-                    total_tokens[key] += usage.get(key, 0) or 0
         
+        total_tokens = aggregate_usage(usage for _, _, usage in outcomes)
         return results, total_latency, total_tokens
+    
+    def classify_batch(
+        self,
+        messages: list[str],
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[list[ClassificationResult], int, dict]:
+        """
+        Classify multiple messages (sync wrapper around aclassify_batch).
+        
+        Not for use inside a running event loop; async callers should
+        await aclassify_batch() directly.
+        
+        Args:
+            messages: List of crisis messages to classify
+            provider_config: Optional provider configuration override
+        
+        Returns:
+            Tuple of (results, total_latency_ms, total_token_usage)
+        """
+        return run_sync(self.aclassify_batch(messages, provider_config))
 
+    def _build_packed_request(
+        self,
+        messages: list[str],
+        provider_config: Optional[ProviderConfig]
+    ) -> tuple[str, str, list[dict], dict]:
+        """
+        Resolve provider/model and render one prompt for a numbered pack.
+        
+        Returns:
+            Tuple of (provider, model, messages, chat_kwargs)
+        """
+        provider = provider_config.provider if provider_config else self.provider
+        temperature = provider_config.temperature if provider_config else None
+        max_tokens = provider_config.max_tokens if provider_config else None
+        
+        model = pick_model(provider, "few_shot", tier="general")
+        
+        # One input per line, so newlines inside a message are flattened
+        items = "\n".join(
+            f"{i}. {' '.join(message.split())}" for i, message in enumerate(messages, 1)
+        )
+        prompt_text, spec = render("few_shot_batch_chat.v1", items=items)
+        chat_messages = [
+            {"role": "system", "content": PACKED_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt_text},
+        ]
+        
+        chat_kwargs = {
+            "temperature": temperature if temperature is not None else spec.temperature,
+            "max_tokens": max_tokens if max_tokens is not None else spec.max_tokens,
+        }
+        return provider, model, chat_messages, chat_kwargs
+    
+    async def _aclassify_pack(
+        self,
+        messages: list[str],
+        provider_config: Optional[ProviderConfig]
+    ) -> tuple[list[ClassificationResult], int, dict]:
+        """Classify one pack in a single call; unanswered or partial items fall back to one call each."""
+        provider, model, chat_messages, chat_kwargs = self._build_packed_request(messages, provider_config)
+        
+        client = get_client(provider, model)
+        response = await client.achat(messages=chat_messages, **chat_kwargs)
+        
+        log_llm_call(
+            provider=provider,
+            model=model,
+            technique=f"{TECHNIQUE}_packed",
+            latency_ms=response["latency_ms"],
+            usage=response["usage"],
+            retry_count=response["meta"]["retry_count"],
+            backoff_ms_total=response["meta"]["backoff_ms_total"],
+            overflow_handled=response["meta"]["overflow_handled"],
+            notes=f"pack_size={len(messages)}" + (" cache_hit" if response["meta"].get("cache_hit") else ""),
+        )
+        
+        # Only answers with all three fields count: like an unparsed single
+        # answer (see _escalation_model), anything less is asked again
+        # rather than defaulting to Other/Low
+        answers = {}
+        for match in _PACKED_LINE_RE.finditer(response["text"]):
+            answer = match.group(2).strip()
+            if len(_field_names(answer)) == 3:
+                answers.setdefault(int(match.group(1)), answer)
+        
+        results = []
+        latency = response["latency_ms"]
+        usages = [response["usage"]]
+        for i, message in enumerate(messages, 1):
+            answer = answers.get(i)
+            if answer is None:
+                result, item_latency, item_usage = await self.aclassify_message(message, provider_config)
+                latency += item_latency
+                usages.append(item_usage)
+            else:
+                district, intent, priority = _parse_fields(answer)
+                result = construct_trusted(
+                    ClassificationResult,
+                    message=message,
+                    district=district,
+                    intent=intent,
+                    priority=priority,
+                    raw_output=answer
+                )
+            results.append(result)
+        
+        return results, latency, aggregate_usage(usages)
+    
+    async def aclassify_batch_packed(
+        self,
+        messages: list[str],
+        pack_size: int = 16,
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[list[ClassificationResult], int, dict]:
+        """
+        Classify messages in packs of `pack_size` per LLM call.
+        
+        The static few-shot prefix is sent once per pack instead of once per
+        message. Packs run concurrently, bounded like aclassify_batch().
+        Messages the model doesn't answer in full are classified individually.
+        
+        Args:
+            messages: List of crisis messages to classify
+            pack_size: Messages per LLM call
+            provider_config: Optional provider configuration override
+        
+        Returns:
+            Tuple of (results, total_latency_ms, total_token_usage)
+        """
+        provider = provider_config.provider if provider_config else self.provider
+        pack_size = max(1, pack_size)
+        outcomes = await gather_bounded(
+            (
+                self._aclassify_pack(messages[start:start + pack_size], provider_config)
+                for start in range(0, len(messages), pack_size)
+            ),
+            limit=get_max_concurrency(provider)
+        )
+        
+        results = []
+        total_latency = 0
+        
+        for pack_results, latency, _ in outcomes:
+            results.extend(pack_results)
+            total_latency += latency
+        
+        total_tokens = aggregate_usage(usage for _, _, usage in outcomes)
+        return results, total_latency, total_tokens
+    
+    def classify_batch_packed(
+        self,
+        messages: list[str],
+        pack_size: int = 16,
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[list[ClassificationResult], int, dict]:
+        """
+        Classify messages in packs (sync wrapper around aclassify_batch_packed).
+        
+        Not for use inside a running event loop.
+        
+        Args:
+            messages: List of crisis messages to classify
+            pack_size: Messages per LLM call
+            provider_config: Optional provider configuration override
+        
+        Returns:
+            Tuple of (results, total_latency_ms, total_token_usage)
+        """
+        return run_sync(self.aclassify_batch_packed(messages, pack_size, provider_config))
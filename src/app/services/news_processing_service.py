@@ -4,17 +4,42 @@ News processing service (Part 5 - Structured Extraction).
 Extracts structured crisis events from news feed using JSON extraction.
 """
 
-import json
+import re
+from functools import lru_cache
 from typing import Optional
 
-from ..utils.prompts import render
-from ..utils.llm_client import LLMClient
+import orjson
+
+from ..utils.prompts import render, render_system
+from ..utils.llm_client import get_client, run_sync
+from ..utils.concurrency import gather_bounded
+from ..utils.config_loader import get_max_concurrency
 from ..utils.logging_utils import log_llm_call
 from ..utils.router import pick_model
 from ..utils.json_utils import pydantic_to_json_schema
+from ..utils.token_utils import aggregate_usage
 from ..schemas.news_processing import CrisisEvent, NewsItem, ProviderConfig
 
 
+# Body of a ```json ... ``` (or bare ```) code block
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _extraction_prompt() -> tuple[str, str]:
+    """
+    Build the CrisisEvent schema JSON and the extraction system prompt.
+    
+    Lazy rather than at import, so the schema build stays deferred until
+    the first extraction.
+    
+    Returns:
+        Tuple of (schema_json, system_prompt)
+    """
+    schema_json = orjson.dumps(pydantic_to_json_schema(CrisisEvent), option=orjson.OPT_INDENT_2).decode()
+    return schema_json, render_system("json_extract_chat.v1", schema=schema_json)
+
+
 class NewsProcessingService:
     """Service for processing news items into structured crisis events."""
     
@@ -26,8 +51,68 @@ class NewsProcessingService:
             provider: Default LLM provider to use
         """
         self.provider = provider
-        # Generate schema once
-        self.schema_json = json.dumps(pydantic_to_json_schema(CrisisEvent), indent=2)
+        # Schema and system prefix are built once per process and shared
+        self.schema_json, self.system_prompt = _extraction_prompt()
+    
+    def _build_request(
+        self,
+        news_item: NewsItem,
+        provider_config: Optional[ProviderConfig]
+    ) -> tuple[str, str, list[dict], dict]:
+        """
+        Resolve provider/model and render the JSON extraction prompt.
+        
+        Returns:
+            Tuple of (provider, model, messages, chat_kwargs)
+        """
+        # Determine provider
+        provider = provider_config.provider if provider_config else self.provider
+        
+        # Select model for JSON extraction
+        model = pick_model(provider, "json_extract", tier="general")
+        
+        # Render json_extract prompt (schema lives in the system prefix)
+        prompt_text, spec = render("json_extract_chat.v1", text=news_item.text)
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": prompt_text},
+        ]
+        
+        chat_kwargs = {"temperature": spec.temperature, "max_tokens": spec.max_tokens}
+        return provider, model, messages, chat_kwargs
+    
+    def _handle_response(
+        self,
+        provider: str,
+        model: str,
+        response: dict
+    ) -> tuple[Optional[CrisisEvent], bool, Optional[str], int, dict]:
+        """Log the call and validate the extracted JSON into a CrisisEvent."""
+        # Log the call
+        log_llm_call(
+            provider=provider,
+            model=model,
+            technique="json_extraction",
+            latency_ms=response["latency_ms"],
+            usage=response["usage"],
+            retry_count=response["meta"]["retry_count"],
+            backoff_ms_total=response["meta"]["backoff_ms_total"],
+            overflow_handled=response["meta"]["overflow_handled"],
+            notes="cache_hit" if response["meta"].get("cache_hit") else "",
+        )
+        
+        # Parse and validate JSON
+        json_text = response["text"].strip()
+        
+        # Unwrap a markdown code block (fast path: no backticks at all)
+        if "```" in json_text:
+            fence = _FENCE_RE.search(json_text)
+            if fence:
+                json_text = fence.group(1)
+        
+        # Validate with Pydantic
+        event = CrisisEvent.model_validate_json(json_text)
+        return event, True, None, response["latency_ms"], response["usage"]
     
     def extract_crisis_event(
         self,
@@ -44,69 +129,48 @@ class NewsProcessingService:
         Returns:
             Tuple of (event, success, error, latency_ms, token_usage)
         """
-        # Determine provider
-        provider = provider_config.provider if provider_config else self.provider
+        provider, model, messages, chat_kwargs = self._build_request(news_item, provider_config)
         
-        # Select model for JSON extraction
-        model = pick_model(provider, "json_extract", tier="general")
+        try:
+            # Create client and call
+            client = get_client(provider, model)
+            response = client.json_chat(messages=messages, **chat_kwargs)
+            return self._handle_response(provider, model, response)
         
-        # Render json_extract prompt
-        prompt_text, spec = render(
-            "json_extract.v1",
-            schema=self.schema_json,
-            text=news_item.text
-        )
+        except Exception as e:
+            error_msg = f"Failed to extract event: {str(e)}"
+            # Return error but still log the attempt
+            return None, False, error_msg, 0, {}
+    
+    async def aextract_crisis_event(
+        self,
+        news_item: NewsItem,
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[Optional[CrisisEvent], bool, Optional[str], int, dict]:
+        """Async variant of extract_crisis_event()."""
+        provider, model, messages, chat_kwargs = self._build_request(news_item, provider_config)
         
         try:
             # Create client and call
-            client = LLMClient(provider, model)
-            response = client.json_chat(
-                messages=[{"role": "user", "content": prompt_text}],
-                temperature=spec.temperature,
-                max_tokens=spec.max_tokens
-            )
-            
-            # Log the call
-            log_llm_call(
-                provider=provider,
-                model=model,
-                technique="json_extraction",
-                latency_ms=response["latency_ms"],
-                usage=response["usage"],
-                retry_count=response["meta"]["retry_count"],
-                backoff_ms_total=response["meta"]["backoff_ms_total"],
-                overflow_handled=response["meta"]["overflow_handled"]
-            )
-            
-            # Parse and validate JSON
-            json_text = response["text"].strip()
-            
-            # Clean up potential markdown code blocks
-            if json_text.startswith("```"):
-                json_text = json_text.split("```")[1]
-                if json_text.startswith("json"):
-                    json_text = json_text[4:]
-                # Remove trailing ```
-                if json_text.endswith("```"):
-                    json_text = json_text[:-3]
-                json_text = json_text.strip()
-            
-            # Validate with Pydantic
-            event = CrisisEvent.model_validate_json(json_text)
-            return event, True, None, response["latency_ms"], response["usage"]
+            client = get_client(provider, model)
+            response = await client.ajson_chat(messages=messages, **chat_kwargs)
+            return self._handle_response(provider, model, response)
         
         except Exception as e:
             error_msg = f"Failed to extract event: {str(e)}"
             # Return error but still log the attempt
             return None, False, error_msg, 0, {}
     
-    def process_news_batch(
+    async def aprocess_news_batch(
         self,
         news_items: list[NewsItem],
         provider_config: Optional[ProviderConfig] = None
     ) -> tuple[list[CrisisEvent], int, int, int, float, int, dict]:
         """
-        Process multiple news items.
+        Process multiple news items concurrently.
+        
+        Calls run in parallel, bounded by the provider's concurrency limit
+        in config.yaml. Events keep the input order.
         
         Args:
             news_items: List of news items to process
@@ -116,17 +180,18 @@ class NewsProcessingService:
             Tuple of (events, total_processed, successful, failed, 
                      success_rate, total_latency, total_tokens)
         """
+        provider = provider_config.provider if provider_config else self.provider
+        outcomes = await gather_bounded(
+            (self.aextract_crisis_event(news_item, provider_config) for news_item in news_items),
+            limit=get_max_concurrency(provider)
+        )
+        
         events = []
         successful = 0
         failed = 0
         total_latency = 0
-        total_tokens = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         
-        for news_item in news_items:
-            event, success, error, latency, usage = self.extract_crisis_event(
-                news_item, provider_config
-            )
-            
+        for event, success, error, latency, _ in outcomes:
             if success and event:
                 events.append(event)
                 successful += 1
@@ -134,12 +199,8 @@ class NewsProcessingService:
                 failed += 1
             
             total_latency += latency
-            
-            # Aggregate tokens
-            for key in total_tokens:
-                if key in usage:
-                    total_tokens[key] += usage.get(key, 0) or 0
         
+        total_tokens = aggregate_usage(usage for *_, usage in outcomes)
         total_processed = len(news_items)
         success_rate = successful / total_processed if total_processed > 0 else 0.0
         
@@ -152,4 +213,24 @@ class NewsProcessingService:
             total_latency,
             total_tokens
         )
-
+    
+    def process_news_batch(
+        self,
+        news_items: list[NewsItem],
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[list[CrisisEvent], int, int, int, float, int, dict]:
+        """
+        Process multiple news items (sync wrapper around aprocess_news_batch).
+        
+        Not for use inside a running event loop; async callers should
+        await aprocess_news_batch() directly.
+        
+        Args:
+            news_items: List of news items to process
+            provider_config: Optional provider configuration override
+        
+        Returns:
+            Tuple of (events, total_processed, successful, failed, 
+                     success_rate, total_latency, total_tokens)
+        """
+        return run_sync(self.aprocess_news_batch(news_items, provider_config))
@@ -1,15 +1,38 @@
 """
 Resource allocation service (Part 3 - CoT & ToT Reasoning).
 
-Implements priority scoring with CoT and route optimization with ToT.
+Implements priority scoring (rule-based, CoT when ambiguous) and route
+optimization over the ToT strategies.
 """
 
+import re
+import time
 from typing import Optional
 
-from ..utils.prompts import render
-from ..utils.llm_client import LLMClient
+import numpy as np
+
+from ..utils.prompts import render, render_system
+from ..utils.llm_client import get_client, run_sync
+from ..utils.concurrency import gather_bounded
+from ..utils.config_loader import get_max_concurrency
 from ..utils.logging_utils import log_llm_call
 from ..utils.router import pick_model
+from ..utils.token_utils import aggregate_usage, reconcile_usage
+from ..utils.travel_matrix import (
+    TravelMatrix,
+    build_travel_matrix,
+    route_time,
+)
+from ..utils.route_search import RoutePlan, leg_costs, search_routes
+from ..utils.scoring_kernel import (
+    NEED_CODES,
+    NEED_MEDICAL,
+    NEED_OTHER,
+    NEED_RESCUE,
+    score_kernel,
+    score_one,
+)
+from ..schemas.common import construct_trusted
 from ..schemas.resource_allocation import (
     IncidentData,
     ScoredIncident,
@@ -17,6 +40,37 @@ from ..schemas.resource_allocation import (
 )
 
 
+# Static CoT scoring prefix, rendered once so providers can cache it
+COT_SYSTEM_PROMPT = render_system(
+    "cot_reasoning_chat.v1",
+    role="Crisis Priority Analyst",
+    rules="""Score each incident using the following logic:
+
+Base Score: 5
++2 if Age > 60 or < 5 (vulnerable populations)
++3 if Need == "Rescue" (life-threatening)
++1 if Need == "Medicine" or "Insulin" (medical emergency)
+Result: Score X/10
+
+Show your reasoning step-by-step, then provide the final score.
+Answer format: Score: X/10"""
+)
+
+
+_AGE_RE = re.compile(r"\b(\d{1,3})\b")
+
+# Used when a request has no travel times (roads around the Ragama base)
+DEFAULT_TRAVEL_TIMES = {
+    "Ragama": {"Ja-Ela": 10, "Gampaha": 30},
+    "Ja-Ela": {"Gampaha": 40},
+}
+
+
+def _no_llm_usage() -> dict:
+    """Token usage for a result computed without an LLM call."""
+    return reconcile_usage({}, {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0})
+
+
 class ResourceAllocationService:
     """Service for resource allocation using CoT and ToT reasoning."""
     
@@ -29,27 +83,16 @@ class ResourceAllocationService:
         """
         self.provider = provider
     
-    def score_incident_with_cot(
+    def _build_cot_request(
         self,
         incident: IncidentData,
-        provider_config: Optional[ProviderConfig] = None
-    ) -> tuple[ScoredIncident, int, dict]:
+        provider_config: Optional[ProviderConfig]
+    ) -> tuple[str, str, list[dict], dict]:
         """
-        Score an incident using CoT reasoning.
-        
-        Scoring logic:
-        - Base Score: 5
-        - +2 if Age > 60 or < 5 (vulnerable populations)
-        - +3 if Need == "Rescue" (life-threatening)
-        - +1 if Need == "Medicine" or "Insulin" (medical emergency)
-        - Result: Score X/10
-        
-        Args:
-            incident: Incident data to score
-            provider_config: Optional provider configuration override
+        Resolve provider/model and render the CoT scoring prompt.
         
         Returns:
-            Tuple of (ScoredIncident, latency_ms, token_usage)
+            Tuple of (provider, model, messages, chat_kwargs)
         """
         # Determine provider
         provider = provider_config.provider if provider_config else self.provider
@@ -68,33 +111,111 @@ Description: {incident.description}"""
         if incident.age_info:
             incident_text += f"\nAge Information: {incident.age_info}"
         
-        # Render CoT prompt
-        prompt_text, spec = render(
-            "cot_reasoning.v1",
-            role="Crisis Priority Analyst",
-            problem=f"""Score this incident using the following logic:
-
-Base Score: 5
-+2 if Age > 60 or < 5 (vulnerable populations)
-+3 if Need == "Rescue" (life-threatening)
-+1 if Need == "Medicine" or "Insulin" (medical emergency)
-Result: Score X/10
-
-Incident:
-{incident_text}
-
-Show your reasoning step-by-step, then provide the final score.
-Answer format: Score: X/10"""
-        )
+        # Render CoT prompt (scoring rules live in the system prefix)
+        prompt_text, spec = render("cot_reasoning_chat.v1", problem=f"Incident:\n{incident_text}")
+        messages = [
+            {"role": "system", "content": COT_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt_text},
+        ]
         
-        # Create client and call
-        client = LLMClient(provider, model)
-        response = client.chat(
-            messages=[{"role": "user", "content": prompt_text}],
-            temperature=0.0,  # Deterministic for crisis
-            max_tokens=spec.max_tokens
-        )
+        chat_kwargs = {
+            "temperature": 0.0,  # Deterministic for crisis
+            "max_tokens": spec.max_tokens,
+        }
+        return provider, model, messages, chat_kwargs
+    
+    @staticmethod
+    def _rule_features(incident: IncidentData) -> Optional[tuple[Optional[int], int]]:
+        """
+        Parse the inputs of the priority scoring rule.
+        
+        Returns:
+            Tuple of (first vulnerable age or None, NEED_CODES value), or None
+            if the inputs are ambiguous (age info without a numeric age, or
+            an unrecognized need type)
+        """
+        vulnerable_age = None
+        if incident.age_info:
+            ages = [int(age) for age in _AGE_RE.findall(incident.age_info)]
+            if not ages:
+                return None
+            vulnerable_age = next((age for age in ages if age > 60 or age < 5), None)
+        
+        need_code = NEED_OTHER
+        if incident.need_type:
+            need_code = NEED_CODES.get(incident.need_type.strip().lower())
+            if need_code is None:
+                return None
+        
+        return vulnerable_age, need_code
+    
+    @staticmethod
+    def _rule_reasoning(
+        incident: IncidentData,
+        vulnerable_age: Optional[int],
+        need_code: int,
+        score: int
+    ) -> str:
+        """Spell out how the scoring rule reached score."""
+        steps = ["Base Score: 5"]
+        
+        if vulnerable_age is not None:
+            steps.append(f"Age {vulnerable_age} is > 60 or < 5 (vulnerable): +2")
+        elif incident.age_info:
+            steps.append(f"Ages {incident.age_info} not > 60 or < 5: +0")
+        else:
+            steps.append("No age information: +0")
         
+        if not incident.need_type:
+            steps.append("No need type: +0")
+        elif need_code == NEED_RESCUE:
+            steps.append("Need is Rescue (life-threatening): +3")
+        elif need_code == NEED_MEDICAL:
+            steps.append(f"Need is {incident.need_type.strip()} (medical emergency): +1")
+        else:
+            steps.append(f"Need is {incident.need_type.strip()}: +0")
+        
+        steps.append(f"Score: {score}/10")
+        return "\n".join(steps)
+    
+    def _score_rule(self, incident: IncidentData) -> Optional[tuple[int, str]]:
+        """
+        Apply the priority scoring rule to one incident.
+        
+        Returns:
+            Tuple of (score, reasoning), or None if the inputs are ambiguous
+        """
+        features = self._rule_features(incident)
+        if features is None:
+            return None
+        
+        vulnerable_age, need_code = features
+        score = score_one(vulnerable_age is not None, need_code)
+        return score, self._rule_reasoning(incident, vulnerable_age, need_code, score)
+    
+    def _rule_result(
+        self,
+        incident: IncidentData,
+        score: int,
+        reasoning: str
+    ) -> tuple[ScoredIncident, int, dict]:
+        """Wrap a rule-based score in the score_incident_with_cot() return shape."""
+        scored_incident = construct_trusted(
+            ScoredIncident,
+            incident=incident,
+            score=score,
+            reasoning=reasoning
+        )
+        return scored_incident, 0, _no_llm_usage()
+    
+    def _handle_cot_response(
+        self,
+        incident: IncidentData,
+        provider: str,
+        model: str,
+        response: dict
+    ) -> tuple[ScoredIncident, int, dict]:
+        """Log the call and extract the score from the CoT output."""
         # Log the call
         log_llm_call(
             provider=provider,
@@ -104,7 +225,8 @@ Answer format: Score: X/10"""
             usage=response["usage"],
             retry_count=response["meta"]["retry_count"],
             backoff_ms_total=response["meta"]["backoff_ms_total"],
-            overflow_handled=response["meta"]["overflow_handled"]
+            overflow_handled=response["meta"]["overflow_handled"],
+            notes="cache_hit" if response["meta"].get("cache_hit") else "",
         )
         
         # Extract score from response
@@ -121,7 +243,8 @@ Answer format: Score: X/10"""
             except:
                 pass
         
-        scored_incident = ScoredIncident(
+        scored_incident = construct_trusted(
+            ScoredIncident,
             incident=incident,
             score=score,
             reasoning=text
@@ -129,159 +252,288 @@ Answer format: Score: X/10"""
         
         return scored_incident, response["latency_ms"], response["usage"]
     
-    def score_incidents_batch(
+    def score_incident_with_cot(
+        self,
+        incident: IncidentData,
+        provider_config: Optional[ProviderConfig] = None,
+        use_llm: bool = False
+    ) -> tuple[ScoredIncident, int, dict]:
+        """
+        Score an incident, using CoT reasoning only when needed.
+        
+        Scoring logic:
+        - Base Score: 5
+        - +2 if Age > 60 or < 5 (vulnerable populations)
+        - +3 if Need == "Rescue" (life-threatening)
+        - +1 if Need == "Medicine" or "Insulin" (medical emergency)
+        - Result: Score X/10
+        
+        The rule is evaluated in Python; the LLM is only called when the
+        inputs are ambiguous or use_llm is set.
+        
+        Args:
+            incident: Incident data to score
+            provider_config: Optional provider configuration override
+            use_llm: Always score with the LLM
+        
+        Returns:
+            Tuple of (ScoredIncident, latency_ms, token_usage)
+        """
+        rule = None if use_llm else self._score_rule(incident)
+        if rule is not None:
+            return self._rule_result(incident, *rule)
+        
+        provider, model, messages, chat_kwargs = self._build_cot_request(incident, provider_config)
+        
+        # Create client and call
+        client = get_client(provider, model)
+        response = client.chat(messages=messages, **chat_kwargs)
+        
+        return self._handle_cot_response(incident, provider, model, response)
+    
+    async def ascore_incident_with_cot(
+        self,
+        incident: IncidentData,
+        provider_config: Optional[ProviderConfig] = None,
+        use_llm: bool = False
+    ) -> tuple[ScoredIncident, int, dict]:
+        """Async variant of score_incident_with_cot()."""
+        rule = None if use_llm else self._score_rule(incident)
+        if rule is not None:
+            return self._rule_result(incident, *rule)
+        
+        provider, model, messages, chat_kwargs = self._build_cot_request(incident, provider_config)
+        
+        # Create client and call
+        client = get_client(provider, model)
+        response = await client.achat(messages=messages, **chat_kwargs)
+        
+        return self._handle_cot_response(incident, provider, model, response)
+    
+    async def ascore_incidents_batch(
         self,
         incidents: list[IncidentData],
-        provider_config: Optional[ProviderConfig] = None
+        provider_config: Optional[ProviderConfig] = None,
+        use_llm: bool = False
     ) -> tuple[list[ScoredIncident], int, dict]:
         """
-        Score multiple incidents.
+        Score multiple incidents concurrently.
+        
+        Unambiguous incidents are scored by rule in one vectorized kernel
+        call (see utils/scoring_kernel.py); the rest run in parallel, bounded by the provider's concurrency limit
+        in config.yaml. Results keep the input order.
         
         Args:
             incidents: List of incidents to score
             provider_config: Optional provider configuration override
+            use_llm: Always score with the LLM
         
         Returns:
             Tuple of (scored_incidents, total_latency, total_tokens)
         """
+        provider = provider_config.provider if provider_config else self.provider
+        features = [None if use_llm else self._rule_features(incident) for incident in incidents]
+        outcomes = [None] * len(incidents)
+        
+        # Score every unambiguous incident in one kernel call
+        ruled = [i for i, feature in enumerate(features) if feature is not None]
+        scores = score_kernel(
+            np.fromiter((features[i][0] is not None for i in ruled), dtype=np.bool_, count=len(ruled)),
+            np.fromiter((features[i][1] for i in ruled), dtype=np.int8, count=len(ruled)),
+        )
+        for i, score in zip(ruled, scores.tolist()):
+            vulnerable_age, need_code = features[i]
+            reasoning = self._rule_reasoning(incidents[i], vulnerable_age, need_code, score)
+            outcomes[i] = self._rule_result(incidents[i], score, reasoning)
+        
+        # The rest need CoT reasoning
+        pending = [i for i, feature in enumerate(features) if feature is None]
+        llm_outcomes = await gather_bounded(
+            (self.ascore_incident_with_cot(incidents[i], provider_config, use_llm=True) for i in pending),
+            limit=get_max_concurrency(provider)
+        )
+        for i, outcome in zip(pending, llm_outcomes):
+            outcomes[i] = outcome
+        
         scored_incidents = []
         total_latency = 0
-        total_tokens = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         
-        for incident in incidents:
-            scored, latency, usage = self.score_incident_with_cot(incident, provider_config)
+        for scored, latency, _ in outcomes:
             scored_incidents.append(scored)
             total_latency += latency
-            
-            # Aggregate tokens
-            for key in total_tokens:
-                if key in usage:
-                    total_tokens[key] += usage.get(key, 0) or 0
         
+        total_tokens = aggregate_usage(usage for _, _, usage in outcomes)
         return scored_incidents, total_latency, total_tokens
+    
+    def score_incidents_batch(
+        self,
+        incidents: list[IncidentData],
+        provider_config: Optional[ProviderConfig] = None,
+        use_llm: bool = False
+    ) -> tuple[list[ScoredIncident], int, dict]:
+        """
+        Score multiple incidents (sync wrapper around ascore_incidents_batch).
+        
+        Not for use inside a running event loop; async callers should
+        await ascore_incidents_batch() directly.
+        
+        Args:
+            incidents: List of incidents to score
+            provider_config: Optional provider configuration override
+            use_llm: Always score with the LLM
+        
+        Returns:
+            Tuple of (scored_incidents, total_latency, total_tokens)
+        """
+        return run_sync(self.ascore_incidents_batch(incidents, provider_config, use_llm))
+
+    @staticmethod
+    def _route_costs(
+        locations: list[str],
+        starting_location: str,
+        travel_times: Optional[dict[str, dict[str, int]]],
+        travel_matrix: Optional[TravelMatrix] = None
+    ) -> tuple[TravelMatrix, np.ndarray]:
+        """Build the travel matrix (unless given) and leg costs for a set of stops."""
+        if travel_matrix is None:
+            travel_matrix = build_travel_matrix(travel_times or DEFAULT_TRAVEL_TIMES)
+        return travel_matrix, leg_costs(travel_matrix, starting_location, locations)
 
     def optimize_route_with_tot(
         self,
         scored_incidents: list[ScoredIncident],
         starting_location: str,
         travel_times: Optional[dict[str, dict[str, int]]],
-        provider_config: Optional[ProviderConfig] = None
+        provider_config: Optional[ProviderConfig] = None,
+        travel_matrix: Optional[TravelMatrix] = None,
+        costs: Optional[np.ndarray] = None
     ) -> tuple[list[str], str, str, Optional[int], int, int, dict]:
         """
-        Optimize rescue route using Tree-of-Thought reasoning.
+        Optimize rescue route by evaluating Tree-of-Thought branches.
 
-        Explores 3 distinct strategies:
+        Evaluates 3 distinct strategies in Python (no LLM call):
         1. Highest priority first (greedy approach)
         2. Closest location first (minimize travel time)
         3. Furthest location first (logistics efficiency)
 
+        With up to 8 incidents every visit order is also checked, so the
+        exact optimum is found. Routes are ranked by priority-weighted
+        response time, then total travel time.
+
         Args:
             scored_incidents: Pre-scored incidents
             starting_location: Starting location for rescue team
-            travel_times: Optional travel time matrix
-            provider_config: Optional provider configuration override
+            travel_times: Optional travel time matrix (defaults to
+                DEFAULT_TRAVEL_TIMES)
+            provider_config: Unused; kept for API compatibility
+            travel_matrix: Precomputed dense form of travel_times (built here
+                if omitted)
+            costs: Precomputed leg_costs() for these incidents' locations
+                (built here if omitted)
 
         Returns:
             Tuple of (optimal_route, strategy_used, reasoning, estimated_time,
                      total_priority_score, latency_ms, token_usage)
         """
-        # Determine provider
-        provider = provider_config.provider if provider_config else self.provider
-
-        # Select model for ToT reasoning
-        model = pick_model(provider, "tot_reasoning", tier="reason")
-
-        # Create incidents summary
-        incidents_summary = "\n".join([
-            f"Incident {i+1}: {inc.incident.location} - {inc.incident.description[:80]}... | Score: {inc.score}/10"
-            for i, inc in enumerate(scored_incidents)
-        ])
+        start_time = time.perf_counter()
 
-        # Format travel times if provided
-        travel_info = ""
-        if travel_times:
-            travel_info = "\nTravel times:\n"
-            for from_loc, to_locs in travel_times.items():
-                for to_loc, time in to_locs.items():
-                    travel_info += f"  {from_loc} → {to_loc}: {time} min\n"
-        else:
-            travel_info = "\nTravel times: Ragama → Ja-Ela (10 min), Ja-Ela → Gampaha (40 min), Ragama → Gampaha (30 min)"
+        locations = [inc.incident.location for inc in scored_incidents]
+        scores = [inc.score for inc in scored_incidents]
+        if travel_matrix is None or costs is None:
+            travel_matrix, costs = self._route_costs(
+                locations, starting_location, travel_times, travel_matrix
+            )
+        best, candidates = search_routes(costs, scores)
 
-        # Render ToT prompt
-        prompt_text, spec = render(
-            "tot_reasoning.v1",
-            role="Crisis Logistics Optimizer",
-            branches="3",
-            problem=f"""Optimize the rescue boat route to maximize total priority score within shortest time.
+        def route_of(plan: RoutePlan) -> list[str]:
+            return [starting_location] + [locations[stop] for stop in plan.order]
 
-Setup:
-- ONE rescue boat stationed at {starting_location}
-{travel_info}
+        # Summarize every branch so the choice is auditable
+        branch_lines = [
+            f"Branch {i + 1}: {plan.strategy} → {' → '.join(route_of(plan))} | "
+            f"Travel time: {plan.total_time} min | Priority-weighted response time: {plan.weighted_time}"
+            for i, plan in enumerate(candidates)
+        ]
+        reasoning = "\n".join(branch_lines) + (
+            f"\n\nSelected: {best.strategy} (lowest priority-weighted response time, "
+            f"then shortest travel time)"
+        )
 
-Incidents with scores:
-{incidents_summary}
+        optimal_route = route_of(best)
 
-Explore these 3 strategies:
-Branch 1: Highest priority first (greedy approach)
-Branch 2: Closest location first (minimize travel time)
-Branch 3: Furthest location first (logistics efficiency)
+        # Calculate total priority score
+        total_priority_score = sum(scores)
 
-For each branch:
-- Calculate total priority score achieved
-- Calculate total time taken
-- Evaluate trade-offs
+        # Estimate travel time along the route (None if any leg is unknown)
+        estimated_time = route_time(travel_matrix, optimal_route)
 
-Then select the best strategy and explain why."""
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        return (
+            optimal_route,
+            best.strategy,
+            reasoning,
+            estimated_time,
+            total_priority_score,
+            latency_ms,
+            _no_llm_usage()
         )
 
-        # Create client and call
-        client = LLMClient(provider, model)
-        response = client.chat(
-            messages=[{"role": "user", "content": prompt_text}],
-            temperature=0.0,
-            max_tokens=spec.max_tokens
+    async def aprioritize_and_route(
+        self,
+        incidents: list[IncidentData],
+        starting_location: str,
+        travel_times: Optional[dict[str, dict[str, int]]] = None,
+        provider_config: Optional[ProviderConfig] = None,
+        use_llm: bool = False,
+        travel_matrix: Optional[TravelMatrix] = None
+    ) -> tuple[list[ScoredIncident], list[str], str, str, Optional[int], int, int, dict]:
+        """
+        Score incidents and plan the rescue route in one pipeline.
+        
+        Route costs depend only on the incident locations, so they're built
+        up front (a few microseconds for a handful of stops); the route
+        search runs once the last score is in.
+        
+        Args:
+            incidents: Incidents to score and visit
+            starting_location: Starting location for rescue team
+            travel_times: Optional travel time matrix (defaults to
+                DEFAULT_TRAVEL_TIMES)
+            provider_config: Optional provider configuration override
+            use_llm: Always score with the LLM
+            travel_matrix: Precomputed dense form of travel_times
+        
+        Returns:
+            Tuple of (scored_incidents, optimal_route, strategy_used, reasoning,
+                     estimated_time, total_priority_score, total_latency_ms,
+                     total_tokens)
+        """
+        locations = [incident.location for incident in incidents]
+        travel_matrix, costs = self._route_costs(
+            locations, starting_location, travel_times, travel_matrix
         )
-
-        # Log the call
-        log_llm_call(
-            provider=provider,
-            model=model,
-            technique="tot_route_optimization",
-            latency_ms=response["latency_ms"],
-            usage=response["usage"],
-            retry_count=response["meta"]["retry_count"],
-            backoff_ms_total=response["meta"]["backoff_ms_total"],
-            overflow_handled=response["meta"]["overflow_handled"]
+        
+        scored_incidents, scoring_latency, scoring_tokens = await self.ascore_incidents_batch(
+            incidents, provider_config, use_llm
         )
-
-        # Parse response to extract route
-        reasoning = response["text"]
-
-        # Extract optimal route (simple heuristic - look for location names)
-        locations = [inc.incident.location for inc in scored_incidents]
-        optimal_route = [starting_location]
-
-        # Try to extract strategy
-        strategy_used = "Highest priority first"  # default
-        if "Branch 2" in reasoning or "closest" in reasoning.lower():
-            strategy_used = "Closest location first"
-        elif "Branch 3" in reasoning or "furthest" in reasoning.lower():
-            strategy_used = "Furthest location first"
-
-        # Sort by priority for default strategy
-        sorted_incidents = sorted(scored_incidents, key=lambda x: x.score, reverse=True)
-        optimal_route.extend([inc.incident.location for inc in sorted_incidents])
-
-        # Calculate total priority score
-        total_priority_score = sum(inc.score for inc in scored_incidents)
-
+        
+        (optimal_route, strategy, reasoning, estimated_time,
+         total_score, route_latency, route_tokens) = self.optimize_route_with_tot(
+            scored_incidents=scored_incidents,
+            starting_location=starting_location,
+            travel_times=travel_times,
+            provider_config=provider_config,
+            travel_matrix=travel_matrix,
+            costs=costs
+        )
+        
         return (
+            scored_incidents,
             optimal_route,
-            strategy_used,
+            strategy,
             reasoning,
-            None,  # estimated_time (would need actual calculation)
-            total_priority_score,
-            response["latency_ms"],
-            response["usage"]
+            estimated_time,
+            total_score,
+            scoring_latency + route_latency,
+            aggregate_usage([scoring_tokens, route_tokens])
         )
-
@@ -5,12 +5,15 @@ Demonstrates why temperature=0.0 is critical for crisis systems.
 """
 
 from typing import Optional
-import statistics
+
+import numpy as np
 
 from ..utils.prompts import render
-from ..utils.llm_client import LLMClient
+from ..utils.llm_client import get_client
 from ..utils.logging_utils import log_llm_call
 from ..utils.router import pick_model
+from ..utils.token_utils import aggregate_usage
+from ..schemas.common import construct_trusted
 from ..schemas.temperature import TemperatureTestResult, ProviderConfig
 
 
@@ -69,11 +72,13 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
         )
         
         # Create client and call
-        client = LLMClient(provider, model)
+        client = get_client(provider, model)
         response = client.chat(
             messages=[{"role": "user", "content": prompt_text}],
             temperature=temperature,
-            max_tokens=spec.max_tokens
+            max_tokens=spec.max_tokens,
+            # Repeated runs measure consistency; a cache hit would fake it
+            use_cache=False,
         )
         
         # Log the call
@@ -85,10 +90,12 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
             usage=response["usage"],
             retry_count=response["meta"]["retry_count"],
             backoff_ms_total=response["meta"]["backoff_ms_total"],
-            overflow_handled=response["meta"]["overflow_handled"]
+            overflow_handled=response["meta"]["overflow_handled"],
+            notes="cache_hit" if response["meta"].get("cache_hit") else "",
         )
         
-        return TemperatureTestResult(
+        return construct_trusted(
+            TemperatureTestResult,
             temperature=temperature,
             iteration=iteration,
             response=response["text"],
@@ -117,7 +124,6 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
         """
         results = []
         total_latency = 0
-        total_tokens = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         
         # Run tests for each temperature
         for temp in temperatures:
@@ -130,11 +136,8 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
                 )
                 results.append(result)
                 total_latency += result.latency_ms
-                
-                # Aggregate tokens
-                for key in total_tokens:
-                    if key in result.tokens_used:
-                        total_tokens[key] += result.tokens_used.get(key, 0) or 0
+        
+        total_tokens = aggregate_usage(result.tokens_used for result in results)
         
         # Analyze consistency
         analysis = self._analyze_consistency(results, temperatures)
@@ -149,25 +152,54 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
         results: list[TemperatureTestResult],
         temperatures: list[float]
     ) -> dict:
-        """Analyze consistency of responses across temperatures."""
-        analysis = {}
+        """
+        Analyze consistency of responses across temperatures.
         
-        for temp in temperatures:
-            temp_results = [r for r in results if r.temperature == temp]
-            
-            # Calculate response length variance
-            lengths = [len(r.response) for r in temp_results]
-            
-            analysis[f"temp_{temp}"] = {
-                "iterations": len(temp_results),
-                "avg_response_length": statistics.mean(lengths) if lengths else 0,
-                "response_length_variance": statistics.variance(lengths) if len(lengths) > 1 else 0,
-                "unique_responses": len(set(r.response for r in temp_results)),
-                "consistency_score": 1.0 if len(set(r.response for r in temp_results)) == 1 else 
-                                   1.0 / len(set(r.response for r in temp_results))
-            }
+        Results are grouped by temperature once and the per-group stats are
+        computed with np.bincount instead of re-scanning results per value.
+        """
+        temps = list(dict.fromkeys(temperatures))
+        n_groups = len(temps)
+        
+        # Map each result to the index of its temperature (-1 if not requested)
+        result_temps = np.fromiter((r.temperature for r in results), dtype=np.float64, count=len(results))
+        matches = result_temps[:, None] == np.asarray(temps, dtype=np.float64)[None, :]
+        group = np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+        keep = group >= 0
+        group = group[keep]
         
-        return analysis
+        lengths = np.fromiter((len(r.response) for r in results), dtype=np.float64, count=len(results))[keep]
+        counts = np.bincount(group, minlength=n_groups)
+        means = np.divide(
+            np.bincount(group, weights=lengths, minlength=n_groups),
+            counts,
+            out=np.zeros(n_groups),
+            where=counts > 0
+        )
+        # Sample variance (ddof=1), matching statistics.variance
+        squared_dev = np.bincount(group, weights=(lengths - means[group]) ** 2, minlength=n_groups)
+        variances = np.divide(squared_dev, counts - 1, out=np.zeros(n_groups), where=counts > 1)
+        
+        # Count distinct responses per group via unique (group, response) pairs
+        responses = np.array([r.response for r in results], dtype=object)[keep]
+        if responses.size:
+            distinct, response_ids = np.unique(responses, return_inverse=True)
+            pairs = np.unique(group * len(distinct) + response_ids)
+            unique_counts = np.bincount(pairs // len(distinct), minlength=n_groups)
+        else:
+            unique_counts = np.zeros(n_groups, dtype=np.int64)
+        consistency = np.divide(1.0, unique_counts, out=np.zeros(n_groups), where=unique_counts > 0)
+        
+        return {
+            f"temp_{temp}": {
+                "iterations": int(counts[i]),
+                "avg_response_length": float(means[i]),
+                "response_length_variance": float(variances[i]),
+                "unique_responses": int(unique_counts[i]),
+                "consistency_score": float(consistency[i])
+            }
+            for i, temp in enumerate(temps)
+        }
     
     def _generate_recommendation(self, analysis: dict) -> str:
         """Generate temperature recommendation based on analysis."""
@@ -215,7 +247,7 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
         """
         results_per_scenario = []
         total_latency = 0
-        total_tokens = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        scenario_tokens = []
 
         # Standard temperature test: 3 runs at 1.0, 1 run at 0.0
         temperatures = [1.0, 0.0]
@@ -256,9 +288,9 @@ Provide your reasoning step-by-step, then give a clear recommendation."""
             ))
 
             total_latency += latency
-            for key in total_tokens:
-                if key in tokens:
-                    total_tokens[key] += tokens.get(key, 0) or 0
+            scenario_tokens.append(tokens)
+
+        total_tokens = aggregate_usage(scenario_tokens)
 
         # Generate overall recommendation
         overall_recommendation = (
@@ -4,14 +4,19 @@ Token management service (Part 4 - Token Economics & Spam Prevention).
 Implements token counting, spam detection, and overflow handling.
 """
 
+import os
+import time
 from typing import Optional, Literal
 
 from ..utils.token_utils import count_text_tokens, pick_encoding
 from ..utils.router import pick_model
 from ..utils.prompts import render
-from ..utils.llm_client import LLMClient
+from ..utils.llm_client import get_client
+from ..schemas.common import construct_trusted
 from ..schemas.token_management import SpamFilterResult, ProviderConfig
 
+TRUNCATION_MARKER = "... [TRUNCATED]"
+
 
 class TokenManagementService:
     """Service for token management and spam prevention."""
@@ -44,20 +49,21 @@ class TokenManagementService:
         Returns:
             Tuple of (SpamFilterResult, latency_ms)
         """
-        import time
         start_time = time.time()
         
         # Determine provider
         provider = provider_config.provider if provider_config else self.provider
         
-        # Count tokens
+        # Count tokens (kept so truncation can slice them without re-encoding)
         model = pick_model(provider, "general", tier="general")
-        original_token_count = count_text_tokens(message, provider, model)
+        tokens = pick_encoding(provider, model).encode(message, disallowed_special=())
+        original_token_count = len(tokens)
         
         # If within limit, accept as-is
         if original_token_count <= max_tokens:
             latency_ms = int((time.time() - start_time) * 1000)
-            return SpamFilterResult(
+            return construct_trusted(
+                SpamFilterResult,
                 status="ACCEPTED",
                 original_token_count=original_token_count,
                 processed_token_count=original_token_count,
@@ -68,13 +74,15 @@ class TokenManagementService:
         
         # Message exceeds limit - apply strategy
         if strategy == "truncate":
-            result = self._truncate_message(message, max_tokens, provider, model)
+            result = self._truncate_message(
+                message, max_tokens, provider, model, original_token_count, tokens
+            )
             latency_ms = int((time.time() - start_time) * 1000)
             return result, latency_ms
         
         elif strategy == "summarize":
             result = self._summarize_message(
-                message, max_tokens, provider, model, provider_config
+                message, max_tokens, provider, model, provider_config, original_token_count
             )
             latency_ms = int((time.time() - start_time) * 1000)
             return result, latency_ms
@@ -82,23 +90,93 @@ class TokenManagementService:
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
     
+    def check_and_filter_spam_batch(
+        self,
+        messages: list[str],
+        max_tokens: int = 150,
+        strategy: Literal["truncate", "summarize"] = "truncate",
+        provider_config: Optional[ProviderConfig] = None
+    ) -> tuple[list[SpamFilterResult], int]:
+        """
+        Check and filter many messages, counting tokens in one batch.
+        
+        Token counts come from tiktoken's encode_batch, which tokenizes on
+        native threads outside the GIL.
+        
+        Args:
+            messages: Input messages to check
+            max_tokens: Maximum allowed tokens
+            strategy: Strategy for handling overflow ("truncate" or "summarize")
+            provider_config: Optional provider configuration override
+        
+        Returns:
+            Tuple of (results in input order, total latency_ms)
+        """
+        if strategy not in ("truncate", "summarize"):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        
+        start_time = time.time()
+        
+        provider = provider_config.provider if provider_config else self.provider
+        model = pick_model(provider, "general", tier="general")
+        enc = pick_encoding(provider, model)
+        token_lists = enc.encode_batch(
+            messages, num_threads=os.cpu_count() or 1, disallowed_special=()
+        )
+        
+        results = []
+        for message, tokens in zip(messages, token_lists):
+            if len(tokens) <= max_tokens:
+                results.append(construct_trusted(
+                    SpamFilterResult,
+                    status="ACCEPTED",
+                    original_token_count=len(tokens),
+                    processed_token_count=len(tokens),
+                    processed_message=message,
+                    action="None",
+                    tokens_saved=0
+                ))
+            elif strategy == "truncate":
+                results.append(self._truncate_message(
+                    message, max_tokens, provider, model, len(tokens), tokens
+                ))
+            else:
+                results.append(self._summarize_message(
+                    message, max_tokens, provider, model, provider_config, len(tokens)
+                ))
+        
+        latency_ms = int((time.time() - start_time) * 1000)
+        return results, latency_ms
+    
     def _truncate_message(
         self,
         message: str,
         max_tokens: int,
         provider: str,
-        model: str
+        model: str,
+        original_token_count: int,
+        tokens: list[int]
     ) -> SpamFilterResult:
-        """Truncate message to max_tokens."""
+        """
+        Truncate message to max_tokens.
+        
+        Args:
+            original_token_count: Token count of message, already computed
+                by the caller
+            tokens: The caller's encoding of message (sliced here rather
+                than tokenizing again)
+        """
         enc = pick_encoding(provider, model)
-        tokens = enc.encode(message, disallowed_special=())
+        
         truncated_tokens = tokens[:max_tokens]
-        truncated_message = enc.decode(truncated_tokens) + "... [TRUNCATED]"
+        truncated_message = enc.decode(truncated_tokens) + TRUNCATION_MARKER
         
-        processed_token_count = count_text_tokens(truncated_message, provider, model)
-        original_token_count = len(tokens)
+        # Count from the kept tokens instead of re-encoding the result
+        # (may differ by a token where the marker joins the text)
+        processed_token_count = len(truncated_tokens) + len(enc.encode(TRUNCATION_MARKER))
         
-        return SpamFilterResult(
+        return construct_trusted(
+            SpamFilterResult,
             status="BLOCKED/TRUNCATED",
             original_token_count=original_token_count,
             processed_token_count=processed_token_count,
@@ -113,11 +191,10 @@ class TokenManagementService:
         max_tokens: int,
         provider: str,
         model: str,
-        provider_config: Optional[ProviderConfig]
+        provider_config: Optional[ProviderConfig],
+        original_token_count: int
     ) -> SpamFilterResult:
-        """Summarize message using LLM."""
-        original_token_count = count_text_tokens(message, provider, model)
-        
+        """Summarize message using LLM (original_token_count from the caller)."""
         # Render overflow_summarize prompt
         prompt_text, spec = render(
             "overflow_summarize.v1",
@@ -127,8 +204,9 @@ class TokenManagementService:
             format="Concise summary in 2-3 sentences maximum"
         )
         
-        # Call LLM to summarize
-        client = LLMClient(provider, model)
+        # Call LLM to summarize (a short rewrite is fine for the tiny tier;
+        # model stays the one token counts are in)
+        client = get_client(provider, pick_model(provider, "summarize", tier="tiny"))
         response = client.chat(
             messages=[{"role": "user", "content": prompt_text}],
             temperature=provider_config.temperature if provider_config else spec.temperature or 0.0,
@@ -138,7 +216,8 @@ class TokenManagementService:
         summarized_message = response["text"].strip()
         processed_token_count = count_text_tokens(summarized_message, provider, model)
         
-        return SpamFilterResult(
+        return construct_trusted(
+            SpamFilterResult,
             status="SUMMARIZED",
             original_token_count=original_token_count,
             processed_token_count=processed_token_count,
@@ -11,8 +11,8 @@ This package provides:
 
 __version__ = "1.0.0"
 
-from .prompts import PromptSpec, PROMPTS, render
+from .prompts import PromptSpec, PROMPTS, render, render_system
 from .config_loader import get_config, load_config, reload_config
 
-__all__ = ["PromptSpec", "PROMPTS", "render", "get_config", "load_config", "reload_config"]
+__all__ = ["PromptSpec", "PROMPTS", "render", "render_system", "get_config", "load_config", "reload_config"]
 
@@ -0,0 +1,41 @@
+"""
+Helpers for running LLM calls concurrently.
+
+Batch services fan out one coroutine per item; these helpers bound how many
+run at once and keep results in input order.
+"""
+
+import asyncio
+from typing import Awaitable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]], limit: int) -> list[T]:
+    """
+    Await items concurrently with at most `limit` in flight.
+
+    Every item runs to completion before errors are surfaced, so one failed
+    call doesn't cancel the rest of the batch mid-request.
+
+    Args:
+        aws: Awaitables to run (not yet started)
+        limit: Max number running at the same time
+
+    Returns:
+        Results in the same order as `aws`
+
+    Raises:
+        The first exception raised by any item (in input order)
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    results = await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
@@ -153,6 +153,24 @@ def get_backoff_jitter() -> float:
     return get_config().get("retry.backoff.jitter_factor", 0.25)
 
 
+def get_max_concurrency(provider: Optional[str] = None) -> int:
+    """
+    Get max in-flight LLM calls for a batch.
+    
+    Args:
+        provider: Optional provider name for a per-provider limit
+    
+    Returns:
+        Concurrency limit (at least 1)
+    """
+    limit = None
+    if provider:
+        limit = get_config().get(f"concurrency.by_provider.{provider}")
+    if limit is None:
+        limit = get_config().get("concurrency.max_concurrent_requests", 8)
+    return max(1, int(limit))
+
+
 def get_default_temperature(task_type: Optional[str] = None) -> float:
     """
     Get default temperature for task type.
@@ -2,18 +2,97 @@
 File processing utilities for reading input files and generating output files.
 """
 
+import asyncio
+import mmap
 import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-import pandas as pd
+from types import MappingProxyType
+from typing import IO, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 import logging
 
-logger = logging.getLogger(__name__)
+import xlsxwriter
+
+from . import line_scan
 
+try:  # optional (the `arrow` extra): C++ CSV writer for classification output
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    CSV_WRITE_OPTIONS = None
+else:
+    # Explicit so the output can't drift from _csv_field() (the fallback)
+    # with a pyarrow default change
+    CSV_WRITE_OPTIONS = pacsv.WriteOptions(include_header=True, quoting_style="needed")
 
+logger = logging.getLogger(__name__)
+
+# xlsxwriter options for the Excel writers. constant_memory streams each
+# row to disk once the next one starts, so _write_xlsx() writes row by row.
+XLSX_OPTIONS = {"constant_memory": True, "strings_to_urls": False}
+
+# Header cell format (what pandas' to_excel used: bold, thin border,
+# centered)
+XLSX_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+
+# Report columns, in output order (only those present in some row are written)
+_CLASS_COLUMNS = ('message', 'district', 'intent', 'priority', 'raw_output')
+# Supports both new (flood_level_meters) and old (flood_level_m) field names
+_EVENT_COLUMNS = ('district', 'flood_level_meters', 'victim_count', 'main_need', 'status')
+_EVENT_COLUMNS_OLD = ('district', 'flood_level_m', 'victim_count', 'main_need', 'status')
+
+# Display headers for the crisis events sheet
+_EVENT_RENAME = MappingProxyType({
+    'flood_level_meters': 'Flood Level (m)',
+    'flood_level_m': 'Flood Level (m)',
+    'victim_count': 'Victim Count',
+    'district': 'District',
+    'main_need': 'Main Need',
+    'status': 'Status'
+})
+
+# Full layout of the current CrisisEvent schema, resolved once
+_EVENT_HEADERS = tuple(_EVENT_RENAME[col] for col in _EVENT_COLUMNS)
+_EVENT_COLUMN_SET = frozenset(_EVENT_COLUMNS)
+
+# Line-per-item inputs at least this big are memory-mapped rather than
+# copied into a bytes object
+MMAP_MIN_BYTES = 1 << 20
+
+# Output file buffer: a typical report goes to the kernel in one write()
+OUTPUT_BUFFER_BYTES = 4 << 20
+
+# Report writes from the *_async savers. One thread, so writes to the same
+# file land in submission order; it isn't a daemon, so a write whose request
+# was cancelled still finishes if the process exits without
+# wait_for_pending_writes()
+_report_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+_pending_writes: Set[Future] = set()
+
+# Default input files (relative to project root); the only ones cached
+_DEFAULT_INPUT_FILES = (
+    "data/Sample Messages.txt", "data/News Feed.txt", "data/Scenarios.txt", "data/Incidents.txt"
+)
+
+# Parsed default input files by path, with the (mtime_ns, size) they were
+# parsed at. A fixed set of keys, so it stays bounded whatever paths callers
+# pass; read_all_inputs() fills it at startup, and a changed file is re-read
+_parsed_inputs: Dict[Path, Tuple[Tuple[int, int], List[str]]] = {}
+
+# Whitespace around each line break, and the blank-line runs left after
+# removing it (scenario separators)
+_LINE_EDGE_WS_RE = re.compile(r"[^\S\n]*\n[^\S\n]*")
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
-    Get the project root directory.
+    Get the project root directory (computed once per process).
     
     Returns:
         Path to project root
@@ -22,41 +101,132 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent.parent
 
 
-def read_messages_from_file(file_path: str = "data/Sample Messages.txt") -> List[str]:
+def _read_bytes(full_path: Path) -> bytes:
     """
-    Read messages from a text file, one message per line.
+    Read a whole file with positional reads.
 
-    Args:
-        file_path: Path to the messages file (can be absolute or relative to project root)
+    Sized from fstat, so an input file normally takes one pread() call
+    (no buffered-reader layer, no read-until-EOF round trip).
+    """
+    if not hasattr(os, "pread"):  # Windows
+        return full_path.read_bytes()
+
+    fd = os.open(full_path, os.O_RDONLY)
+    try:
+        chunks = []
+        offset = 0
+        want = os.fstat(fd).st_size + 1  # +1 notices a file that grew since fstat
+        while True:
+            chunk = os.pread(fd, want, offset)
+            chunks.append(chunk)
+            offset += len(chunk)
+            if len(chunk) < want:
+                return b"".join(chunks)
+            want = 1 << 16
+    finally:
+        os.close(fd)
+
+
+def _nonempty_lines(buf) -> List[str]:
+    """Stripped, non-empty lines of a UTF-8 buffer (bytes or mmap)."""
+    if len(buf) >= line_scan.MIN_SCAN_BYTES and line_scan.available():
+        # Large dump: find line spans natively, decode only those
+        return line_scan.nonempty_lines(buf)
+
+    # One bulk decode; splitting, stripping and dropping empty lines then
+    # all run in C (no per-line bytecode, unlike a comprehension)
+    text = str(buf, 'utf-8')
+    return list(filter(None, map(str.strip, text.splitlines())))
+
+
+def _read_nonempty_lines(full_path: Path) -> List[str]:
+    """
+    Read a UTF-8 file in one go and return its stripped, non-empty lines.
+
+    Large files are memory-mapped (read-only, MADV_SEQUENTIAL), so decoding
+    or scanning reads the page cache directly instead of a copy of it.
+    """
+    if full_path.stat().st_size < MMAP_MIN_BYTES:
+        return _nonempty_lines(_read_bytes(full_path))
+
+    with open(full_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return _nonempty_lines(mm)
 
-    Returns:
-        List of messages (empty lines and whitespace stripped)
+
+def _resolve_input(file_path: str, description: str) -> Path:
+    """
+    Resolve an input file path (absolute, or relative to project root).
 
     Raises:
         FileNotFoundError: If the file doesn't exist
     """
-    # Handle both absolute and relative paths
     path_obj = Path(file_path)
-    if path_obj.is_absolute():
-        full_path = path_obj
-    else:
-        root = get_project_root()
-        full_path = root / file_path
+    full_path = path_obj if path_obj.is_absolute() else get_project_root() / path_obj
 
     if not full_path.exists():
-        raise FileNotFoundError(f"Messages file not found: {full_path}")
+        raise FileNotFoundError(f"{description} file not found: {full_path}")
+    return full_path
 
-    logger.info(f"Reading messages from: {full_path}")
 
-    messages = []
-    with open(full_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Skip empty lines
-                messages.append(line)
+@lru_cache(maxsize=1)
+def _default_input_paths() -> frozenset:
+    """Resolved paths of the default input files (the cacheable ones)."""
+    root = get_project_root()
+    return frozenset(root / file_path for file_path in _DEFAULT_INPUT_FILES)
 
-    logger.info(f"Read {len(messages)} messages from file")
-    return messages
+
+def _cached_parse(full_path: Path, parse: Callable[[Path], List[str]]) -> List[str]:
+    """
+    parse(full_path), reusing the last result while the file is unchanged.
+
+    Only default input files are cached; other paths are parsed every call.
+    Returns a new list each time, so callers can't alter the cached one.
+    """
+    if full_path not in _default_input_paths():
+        return parse(full_path)
+
+    stat = full_path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    entry = _parsed_inputs.get(full_path)
+    if entry is None or entry[0] != key:
+        entry = _parsed_inputs[full_path] = (key, parse(full_path))
+    return list(entry[1])
+
+
+def _read_lines(file_path: str, description: str, label: str) -> List[str]:
+    """
+    Shared body of the one-item-per-line readers.
+
+    Args:
+        file_path: Path to the file (absolute or relative to project root)
+        description: File kind for the not-found error ("Messages", ...)
+        label: Plural item name for the log lines ("messages", ...)
+    """
+    full_path = _resolve_input(file_path, description)
+    logger.info(f"Reading {label} from: {full_path}")
+
+    lines = _cached_parse(full_path, _read_nonempty_lines)
+
+    logger.info(f"Read {len(lines)} {label} from file")
+    return lines
+
+
+def read_messages_from_file(file_path: str = "data/Sample Messages.txt") -> List[str]:
+    """
+    Read messages from a text file, one message per line.
+
+    Args:
+        file_path: Path to the messages file (can be absolute or relative to project root)
+
+    Returns:
+        List of messages (empty lines and whitespace stripped)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    return _read_lines(file_path, "Messages", "messages")
 
 
 def read_news_from_file(file_path: str = "data/News Feed.txt") -> List[str]:
@@ -72,28 +242,14 @@ def read_news_from_file(file_path: str = "data/News Feed.txt") -> List[str]:
     Raises:
         FileNotFoundError: If the file doesn't exist
     """
-    # Handle both absolute and relative paths
-    path_obj = Path(file_path)
-    if path_obj.is_absolute():
-        full_path = path_obj
-    else:
-        root = get_project_root()
-        full_path = root / file_path
+    return _read_lines(file_path, "News feed", "news items")
 
-    if not full_path.exists():
-        raise FileNotFoundError(f"News feed file not found: {full_path}")
-
-    logger.info(f"Reading news items from: {full_path}")
-
-    news_items = []
-    with open(full_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Skip empty lines
-                news_items.append(line)
 
-    logger.info(f"Read {len(news_items)} news items from file")
-    return news_items
+def _parse_scenarios(full_path: Path) -> List[str]:
+    """Blank-line-separated scenarios of a UTF-8 file, each line stripped."""
+    # Strip every line in one regex pass, then split on blank lines
+    text = _LINE_EDGE_WS_RE.sub('\n', _read_bytes(full_path).decode('utf-8'))
+    return list(filter(None, map(str.strip, _BLANK_LINES_RE.split(text))))
 
 
 def read_scenarios_from_file(file_path: str = "data/Scenarios.txt") -> List[str]:
@@ -110,30 +266,10 @@ def read_scenarios_from_file(file_path: str = "data/Scenarios.txt") -> List[str]
     Raises:
         FileNotFoundError: If the file doesn't exist
     """
-    root = get_project_root()
-    full_path = root / file_path
-
-    if not full_path.exists():
-        raise FileNotFoundError(f"Scenarios file not found: {full_path}")
-
+    full_path = _resolve_input(file_path, "Scenarios")
     logger.info(f"Reading scenarios from: {full_path}")
 
-    scenarios = []
-    current_scenario = []
-
-    with open(full_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Non-empty line
-                current_scenario.append(line)
-            else:  # Empty line - scenario separator
-                if current_scenario:
-                    scenarios.append('\n'.join(current_scenario))
-                    current_scenario = []
-
-        # Add last scenario if exists
-        if current_scenario:
-            scenarios.append('\n'.join(current_scenario))
+    scenarios = _cached_parse(full_path, _parse_scenarios)
 
     logger.info(f"Read {len(scenarios)} scenarios from file")
     return scenarios
@@ -152,28 +288,178 @@ def read_incidents_from_file(file_path: str = "data/Incidents.txt") -> List[str]
     Raises:
         FileNotFoundError: If the file doesn't exist
     """
-    root = get_project_root()
-    full_path = root / file_path
+    return _read_lines(file_path, "Incidents", "incidents")
+
+
+def read_all_inputs() -> Dict[str, List[str]]:
+    """
+    Read all four default input files concurrently.
+
+    Each read runs on its own thread (pread releases the GIL), so the
+    kernel can overlap the lookups and page-cache fills instead of doing
+    them one file after another. Called at startup to prefetch: the parsed
+    files are cached, so later reads of unchanged files skip the I/O.
+
+    Returns:
+        Dict with "messages", "news", "scenarios" and "incidents" lists
+
+    Raises:
+        FileNotFoundError: If any of the files doesn't exist
+    """
+    readers = {
+        "messages": read_messages_from_file,
+        "news": read_news_from_file,
+        "scenarios": read_scenarios_from_file,
+        "incidents": read_incidents_from_file,
+    }
+    with ThreadPoolExecutor(max_workers=len(readers)) as pool:
+        futures = {name: pool.submit(reader) for name, reader in readers.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _rows_to_columns(
+    rows: List[dict], columns: Sequence[str], headers: Optional[Sequence[str]] = None
+) -> Dict[str, list]:
+    """
+    Transpose row dicts into one list per column (missing keys -> None).
+
+    Columnar input for table builders (pa.table() wraps each list as one
+    array). The result is keyed by `headers` (default: the column names) in
+    `columns` order, so the table needs no reorder or rename afterwards.
+    """
+    return {
+        header: [row.get(col) for row in rows]
+        for col, header in zip(columns, headers or columns)
+    }
+
+
+def _arrow_table(rows: List[dict], columns: List[str]):
+    """
+    Rows as a pyarrow Table of `columns`, or None when pyarrow isn't
+    installed or a column mixes types Arrow can't put in one array.
+    """
+    if pa is None:
+        return None
+    try:
+        return pa.table(_rows_to_columns(rows, columns))
+    except pa.ArrowException:
+        return None
+
+
+def _csv_field(value) -> str:
+    """
+    One CSV field formatted as Arrow's writer does with quoting_style
+    "needed": strings always quoted, nulls empty, numbers bare.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
 
-    if not full_path.exists():
-        raise FileNotFoundError(f"Incidents file not found: {full_path}")
 
-    logger.info(f"Reading incidents from: {full_path}")
+def _column_widths(rows: List[dict], columns: Sequence[str], headers: Sequence[str], cap: int) -> List[int]:
+    """
+    Excel column widths from one pass over the rows.
+
+    Each width is the longest value (or header) in the column plus 2,
+    capped at `cap`.
+    """
+    widths = [len(header) for header in headers]
+    for row in rows:
+        for idx, col in enumerate(columns):
+            length = len(str(row.get(col, '')))
+            if length > widths[idx]:
+                widths[idx] = length
+    return [min(width + 2, cap) for width in widths]
 
-    incidents = []
-    with open(full_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Skip empty lines
-                incidents.append(line)
 
-    logger.info(f"Read {len(incidents)} incidents from file")
-    return incidents
+@contextmanager
+def _open_output(file_path: Path, binary: bool = False) -> Iterator[IO]:
+    """
+    Open an output file for writing with a large explicit buffer.
 
+    Reports are written once and never read back by this process, so after
+    the final flush their pages are advised out of the page cache
+    (POSIX_FADV_DONTNEED, best effort) instead of crowding out input data.
+    O_DIRECT would skip the cache outright but needs block-aligned buffers,
+    offsets and lengths, which buffered Python writes don't guarantee.
+    """
+    if binary:
+        f = open(file_path, 'wb', buffering=OUTPUT_BUFFER_BYTES)
+    else:
+        f = open(file_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_BYTES)
+    try:
+        yield f
+        f.flush()
+        if hasattr(os, "posix_fadvise"):
+            with suppress(OSError):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        f.close()
+
+
+def _cell_writer(worksheet, sample):
+    """
+    The typed xlsxwriter method for a column whose first value is `sample`
+    (skips worksheet.write()'s isinstance chain); None for anything else.
+    """
+    if type(sample) is str:
+        return worksheet.write_string
+    if type(sample) in (int, float):
+        return worksheet.write_number
+    return None
+
+
+def _write_xlsx(
+    file_path: Path,
+    sheet_name: str,
+    columns: Sequence[str],
+    headers: Sequence[str],
+    rows: List[dict],
+    widths: List[int]
+) -> None:
+    """
+    Write rows to a single-sheet workbook straight through xlsxwriter.
 
+    Row-major, so the workbook can run in constant_memory mode; no DataFrame
+    or pandas ExcelFormatter in between. Each column's write method is
+    picked from the first row's value type; cells of any other type go
+    through worksheet.write(). Missing, None, NaN and empty-string values
+    are left empty, as to_excel did.
+    """
+    with _open_output(file_path, binary=True) as f:
+        workbook = xlsxwriter.Workbook(f, XLSX_OPTIONS)
+        worksheet = workbook.add_worksheet(sheet_name)
+        for idx, width in enumerate(widths):
+            worksheet.set_column(idx, idx, width)
+        
+        worksheet.write_row(0, 0, headers, workbook.add_format(XLSX_HEADER_FORMAT))
+        
+        first = rows[0] if rows else {}
+        writers = [
+            (col_idx, col, type(first.get(col)), _cell_writer(worksheet, first.get(col)))
+            for col_idx, col in enumerate(columns)
+        ]
+        for row_idx, row in enumerate(rows, 1):
+            for col_idx, col, kind, write in writers:
+                value = row.get(col)
+                if value is None or value != value or value == "":  # NaN != NaN
+                    continue
+                if write is not None and type(value) is kind:
+                    write(row_idx, col_idx, value)
+                else:
+                    worksheet.write(row_idx, col_idx, value)
+        
+        workbook.close()
+
+
+@lru_cache(maxsize=1)
 def ensure_output_directory() -> Path:
     """
-    Ensure the output directory exists.
+    Ensure the output directory exists (created once per process).
     
     Returns:
         Path to output directory
@@ -199,16 +485,23 @@ def save_classification_results_to_csv(results: List[dict], filename: str = "cla
     output_dir = ensure_output_directory()
     file_path = output_dir / filename
     
-    # Convert to DataFrame
-    df = pd.DataFrame(results)
+    # Reorder columns for better readability (only columns some row has)
+    present = set().union(*results)
+    existing_columns = [col for col in _CLASS_COLUMNS if col in present]
     
-    # Reorder columns for better readability
-    column_order = ['message', 'district', 'intent', 'priority', 'raw_output']
-    existing_columns = [col for col in column_order if col in df.columns]
-    df = df[existing_columns]
-    
-    # Save to CSV
-    df.to_csv(file_path, index=False, encoding='utf-8')
+    table = _arrow_table(results, existing_columns) if results else None
+    if table is not None:
+        # Format and write entirely in Arrow's CSV writer
+        with _open_output(file_path, binary=True) as f:
+            pacsv.write_csv(table, f, CSV_WRITE_OPTIONS)
+    else:
+        # Same layout in Python (no DataFrame); one flush on close
+        with _open_output(file_path) as f:
+            f.write(','.join(map(_csv_field, existing_columns)) + '\n')
+            f.writelines(
+                ','.join([_csv_field(row.get(col)) for col in existing_columns]) + '\n'
+                for row in results
+            )
     logger.info(f"Saved {len(results)} classification results to CSV: {file_path}")
     
     return str(file_path)
@@ -228,33 +521,48 @@ def save_classification_results_to_excel(results: List[dict], filename: str = "c
     output_dir = ensure_output_directory()
     file_path = output_dir / filename
     
-    # Convert to DataFrame
-    df = pd.DataFrame(results)
+    # Reorder columns for better readability (only columns some row has)
+    present = set().union(*results)
+    existing_columns = [col for col in _CLASS_COLUMNS if col in present]
     
-    # Reorder columns for better readability
-    column_order = ['message', 'district', 'intent', 'priority', 'raw_output']
-    existing_columns = [col for col in column_order if col in df.columns]
-    df = df[existing_columns]
+    # Auto-adjust column widths (cap at 50 characters for readability)
+    widths = _column_widths(results, existing_columns, existing_columns, cap=50)
     
     # Save to Excel with formatting
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Classifications')
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets['Classifications']
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).apply(len).max(),
-                len(col)
-            )
-            # Cap at 50 characters for readability
-            worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+    _write_xlsx(file_path, 'Classifications', existing_columns, existing_columns, results, widths)
     
     logger.info(f"Saved {len(results)} classification results to Excel: {file_path}")
     
     return str(file_path)
 
 
+def _event_layout(events: List[dict]) -> Tuple[Sequence[str], Sequence[str]]:
+    """
+    Columns to write for crisis events, and their display headers.
+
+    Rows from CrisisEvent.model_dump() all carry the full current schema;
+    if the first row does, that layout is the answer (every column is
+    present, the new flood field name wins) and no row is scanned. Anything
+    else - partial rows, the old flood_level_m name - takes the general
+    path over the union of row keys.
+    """
+    if events and _EVENT_COLUMN_SET <= events[0].keys():
+        return _EVENT_COLUMNS, _EVENT_HEADERS
+
+    present = set().union(*events)
+
+    # Reorder columns for better readability
+    column_order = _EVENT_COLUMNS
+    # Fallback to old name if new name doesn't exist
+    if 'flood_level_meters' not in present and 'flood_level_m' in present:
+        column_order = _EVENT_COLUMNS_OLD
+
+    existing_columns = [col for col in column_order if col in present]
+
+    # Rename columns for better presentation
+    return existing_columns, [_EVENT_RENAME[col] for col in existing_columns]
+
+
 def save_crisis_events_to_excel(events: List[dict], filename: str = "flood_report.xlsx") -> str:
     """
     Save crisis events to Excel file with formatting.
@@ -269,44 +577,73 @@ def save_crisis_events_to_excel(events: List[dict], filename: str = "flood_repor
     output_dir = ensure_output_directory()
     file_path = output_dir / filename
     
-    # Convert to DataFrame
-    df = pd.DataFrame(events)
-
-    # Reorder columns for better readability
-    # Support both old (flood_level_m) and new (flood_level_meters) field names
-    column_order = ['district', 'flood_level_meters', 'victim_count', 'main_need', 'status']
-    # Fallback to old name if new name doesn't exist
-    if 'flood_level_meters' not in df.columns and 'flood_level_m' in df.columns:
-        column_order = ['district', 'flood_level_m', 'victim_count', 'main_need', 'status']
-
-    existing_columns = [col for col in column_order if col in df.columns]
-    df = df[existing_columns]
-
-    # Rename columns for better presentation
-    rename_map = {
-        'flood_level_meters': 'Flood Level (m)',
-        'flood_level_m': 'Flood Level (m)',
-        'victim_count': 'Victim Count',
-        'district': 'District',
-        'main_need': 'Main Need',
-        'status': 'Status'
-    }
-    df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
+    existing_columns, headers = _event_layout(events)
+    
+    # Auto-adjust column widths
+    widths = _column_widths(events, existing_columns, headers, cap=30)
     
     # Save to Excel with formatting
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Crisis Events')
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets['Crisis Events']
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).apply(len).max(),
-                len(col)
-            )
-            worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 30)
+    _write_xlsx(file_path, 'Crisis Events', existing_columns, headers, events, widths)
     
     logger.info(f"Saved {len(events)} crisis events to Excel: {file_path}")
     
     return str(file_path)
 
+
+def _write_done(future: Future) -> None:
+    """Forget a finished background write; log it if it failed."""
+    _pending_writes.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Background report write failed: {future.exception()}")
+
+
+async def _run_write(save: Callable[[List[dict], str], str], rows: List[dict], filename: str) -> str:
+    """
+    Run save(rows, filename) on the report writer thread and wait for it.
+
+    Shielded: if the awaiting request is cancelled, the write still completes
+    (failures are then logged by _write_done()).
+    """
+    future = _report_writer.submit(save, rows, filename)
+    _pending_writes.add(future)
+    future.add_done_callback(_write_done)
+    return await asyncio.shield(asyncio.wrap_future(future))
+
+
+async def save_classification_results_to_excel_async(
+    results: List[dict], filename: str = "classified_messages.xlsx"
+) -> str:
+    """
+    Save classification results to Excel without blocking the event loop.
+
+    Returns:
+        Absolute path to the saved Excel file, once it is written
+    """
+    return await _run_write(save_classification_results_to_excel, results, filename)
+
+
+async def save_crisis_events_to_excel_async(
+    events: List[dict], filename: str = "flood_report.xlsx"
+) -> str:
+    """
+    Save crisis events to Excel without blocking the event loop.
+
+    Returns:
+        Absolute path to the saved Excel file, once it is written
+    """
+    return await _run_write(save_crisis_events_to_excel, events, filename)
+
+
+def wait_for_pending_writes(timeout: Optional[float] = None) -> int:
+    """
+    Block until queued report writes (including ones whose request was
+    cancelled) have finished.
+
+    Args:
+        timeout: Max seconds to wait (None = no limit)
+
+    Returns:
+        Number of writes still pending (0 unless the timeout ran out)
+    """
+    _, not_done = wait(list(_pending_writes), timeout=timeout)
+    return len(not_done)
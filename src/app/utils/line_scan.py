@@ -0,0 +1,94 @@
+"""
+Native line scanner for very large input files.
+
+Finds the non-empty lines of a byte buffer, trimmed of ASCII whitespace, as
+(start, end) offsets in a compiled Numba loop (numba is optional, the `jit`
+extra); the caller then decodes only those slices. Worth it on
+multi-megabyte message/news dumps, where the per-line Python
+strip-and-filter dominates; small files stay on the str.splitlines() path
+and never pay for the JIT (see file_utils._read_nonempty_lines).
+
+Line breaks are \\n, \\r, \\v, \\f and \\x1c-\\x1e, stripped whitespace is
+those plus \\t, \\x1f and space - the ASCII part of what str.splitlines() and
+str.strip() recognize. Non-ASCII separators (U+0085, U+2028, U+2029) and
+non-ASCII whitespace at line edges are left in place.
+"""
+
+import logging
+from typing import List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Smallest input worth the native scan (below it, splitlines() is already fast)
+MIN_SCAN_BYTES = 1 << 20
+
+
+def _scan_lines(data):
+    """
+    Spans of non-empty trimmed lines in a uint8 buffer, as an (n, 2) int64
+    array of [start, end) offsets (compiled by numba).
+
+    Two passes - count, then fill - so the output is allocated exactly once.
+    """
+    n = data.shape[0]
+    spans = np.empty((0, 2), dtype=np.int64)
+    for fill in range(2):
+        count = 0
+        i = 0
+        while i < n:
+            j = i
+            while j < n:
+                b = data[j]
+                if b == 10 or b == 13 or b == 11 or b == 12 or (b >= 28 and b <= 30):
+                    break
+                j += 1
+
+            start = i
+            end = j
+            while start < end and (data[start] == 32 or (data[start] >= 9 and data[start] <= 13)
+                                   or (data[start] >= 28 and data[start] <= 31)):
+                start += 1
+            while end > start and (data[end - 1] == 32 or (data[end - 1] >= 9 and data[end - 1] <= 13)
+                                   or (data[end - 1] >= 28 and data[end - 1] <= 31)):
+                end -= 1
+
+            if end > start:
+                if fill:
+                    spans[count, 0] = start
+                    spans[count, 1] = end
+                count += 1
+            i = j + 1
+
+        if not fill:
+            spans = np.empty((count, 2), dtype=np.int64)
+    return spans
+
+
+try:
+    from numba import njit
+except ImportError:
+    _jit_scan = None
+else:
+    _jit_scan = njit(cache=True)(_scan_lines)
+
+
+def available() -> bool:
+    """Whether the compiled scanner can be used (numba is installed)."""
+    return _jit_scan is not None
+
+
+def nonempty_lines(buf) -> List[str]:
+    """
+    Decode the non-empty, whitespace-trimmed lines of a UTF-8 buffer.
+
+    Args:
+        buf: Raw file contents (bytes, or a read-only mmap of the file)
+
+    Returns:
+        Lines in file order
+    """
+    scan = _jit_scan if _jit_scan is not None else _scan_lines
+    spans = scan(np.frombuffer(buf, dtype=np.uint8))
+    return [buf[start:end].decode('utf-8') for start, end in spans.tolist()]
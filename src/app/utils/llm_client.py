@@ -7,28 +7,47 @@ Supports:
 - Token estimation pre-call with context overflow handling
 - Usage reconciliation (estimated vs actual tokens)
 - Comprehensive error handling
+- Async variants (achat/ajson_chat) for concurrent batch fan-out
+- Exact-match response cache for deterministic (temperature=0) calls
+- Streaming with early stop (chat_until) once the caller has what it needs
+- Pooled clients (get_client) so calls reuse keep-alive connections
 """
 
+import asyncio
+import threading
 import time
 import random
-from typing import Literal, Optional, Any, Dict, List
-from openai import OpenAI, OpenAIError
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Literal, Optional, TypeVar
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI, OpenAIError
 from google import genai
 from google.genai import types
-from groq import Groq
+from groq import AsyncGroq, Groq
+from groq import DefaultAsyncHttpxClient as GroqAsyncHttpxClient
+from groq import DefaultHttpxClient as GroqHttpxClient
 from dotenv import load_dotenv
 import os
 
 from .token_utils import (
     count_messages_tokens,
+    count_text_tokens,
     reconcile_usage,
     fit_within_context,
 )
 from .router import get_context_window
+from .response_cache import get_response_cache, make_cache_key
+from .rate_limit import get_limiter
 
 # Load environment variables
 load_dotenv()
 
+# Connection pool of each provider HTTP client (connections are kept alive
+# between calls, so only the first call to a host pays for TCP + TLS)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+T = TypeVar("T")
+
 
 class LLMClient:
     """
@@ -73,31 +92,89 @@ class LLMClient:
         # Initialize provider client
         self._init_client()
 
+    def _api_key(self) -> str:
+        """Read the provider API key from the environment."""
+        env_var = {
+            "openai": "OPENAI_API_KEY",
+            "google": "GEMINI_API_KEY",
+            "groq": "GROQ_API_KEY",
+        }.get(self.provider)
+        if env_var is None:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+        api_key = os.getenv(env_var)
+        if not api_key:
+            raise ValueError(f"{env_var} not found in environment")
+        return api_key
+
+    def _google_client(self) -> genai.Client:
+        """Create a Gemini client with pooled sync and async connections."""
+        return genai.Client(
+            api_key=self._api_key(),
+            http_options=types.HttpOptions(
+                client_args={"limits": HTTP_LIMITS},
+                async_client_args={"limits": HTTP_LIMITS},
+            ),
+        )
+
     def _init_client(self) -> None:
         """Initialize provider-specific client."""
+        api_key = self._api_key()
         if self.provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY not found in environment")
-            self.client = OpenAI(
-                                api_key=api_key
-                                )
-
+            self.client = OpenAI(api_key=api_key, http_client=DefaultHttpxClient(limits=HTTP_LIMITS))
         elif self.provider == "google":
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY not found in environment")
-            self.client = genai.Client(api_key=api_key)
-
+            self.client = self._google_client()
         elif self.provider == "groq":
-            api_key = os.getenv("GROQ_API_KEY")
-            if not api_key:
-                raise ValueError("GROQ_API_KEY not found in environment")
-            self.client = Groq(
-                               api_key=api_key
-                               )
+            self.client = Groq(api_key=api_key, http_client=GroqHttpxClient(limits=HTTP_LIMITS))
+
+        # Async clients are created on first achat() call, one per event loop
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def async_client(self) -> Any:
+        """
+        Provider async client (created lazily, reused across achat calls).
+
+        Async connections belong to the event loop that opened them, so each
+        loop gets its own client (e.g. asyncio.run() in the sync batch
+        wrappers; see run_sync(), which closes it before the loop ends).
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            if self.provider == "openai":
+                client = AsyncOpenAI(
+                    api_key=self._api_key(), http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS)
+                )
+            elif self.provider == "google":
+                # google-genai exposes its async API on a client's .aio
+                client = self._google_client().aio
+            elif self.provider == "groq":
+                client = AsyncGroq(
+                    api_key=self._api_key(), http_client=GroqAsyncHttpxClient(limits=HTTP_LIMITS)
+                )
+            self._async_clients[loop] = client
+        return client
+
+    def close(self) -> None:
+        """Close the sync client's pooled connections."""
+        self.client.close()
+
+    async def aclose_async(self) -> None:
+        """Close the running loop's async client, if this client opened one."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is None:
+            return
+        if self.provider == "google":
+            await client.aclose()
         else:
-            raise ValueError(f"Unsupported provider: {self.provider}")
+            await client.close()
+
+    async def aclose(self) -> None:
+        """Close the sync client and the running loop's async client."""
+        self.client.close()
+        await self.aclose_async()
 
     def _calculate_backoff(self, attempt: int) -> float:
         """Calculate exponential backoff with jitter."""
@@ -127,27 +204,12 @@ class LLMClient:
 
         return False
 
-    def chat(
+    def _prepare_messages(
         self,
         messages: List[Dict[str, str]],
-        context_strs: Optional[List[str]] = None,
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-        **kwargs,
-    ) -> Dict[str, Any]:
-        """
-        Send chat completion request with automatic retry and token management.
-
-        Args:
-            messages: OpenAI-style messages array
-            context_strs: Optional context strings (counted separately)
-            temperature: Sampling temperature
-            max_tokens: Max completion tokens
-            **kwargs: Additional provider-specific parameters
-
-        Returns:
-            Dict with text, usage (estimated + actual), latency_ms, meta
-        """
+        context_strs: Optional[List[str]],
+    ) -> tuple[List[Dict[str, str]], Dict[str, Any], bool]:
+        """Estimate tokens and apply the hard prompt cap if configured."""
         # Pre-call token estimation
         token_counts = count_messages_tokens(
             messages, self.provider, self.model, context_strs
@@ -171,10 +233,135 @@ class LLMClient:
                 messages, self.provider, self.model, context_strs
             )
 
+        return messages, token_counts, overflow_handled
+
+    def _retry_backoff(self, error: Exception, attempt: int, overflow_handled: bool) -> float:
+        """
+        Decide whether a failed attempt is retried.
+
+        Returns:
+            Seconds to back off before the next attempt
+
+        Raises:
+            The original error (or a ValueError for context overflow) when the
+            call should not be retried
+        """
+        # Check if we should retry
+        if attempt < self.max_retries and self._is_retryable_error(error):
+            return self._calculate_backoff(attempt)
+
+        # Context overflow error - try summarization
+        error_str = str(error).lower()
+        if (
+            "context" in error_str
+            and ("length" in error_str or "too long" in error_str)
+            and not overflow_handled
+        ):
+            # This should be handled by caller using overflow_summarize prompt
+            raise ValueError(
+                "Context window exceeded. Use overflow_summarize.v1 prompt."
+            ) from error
+
+        # Non-retryable error or max retries exceeded
+        raise error
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        context_strs: Optional[List[str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        use_cache: bool,
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Return the response-cache key, or None if the call isn't cacheable."""
+        # Only deterministic calls are safe to replay
+        if not use_cache or temperature is None or temperature != 0:
+            return None
+        if get_response_cache() is None:
+            return None
+        return make_cache_key(
+            self.provider, self.model, temperature, max_tokens, messages, context_strs, **kwargs
+        )
+
+    @staticmethod
+    def _cached_result(
+        cached: Dict[str, Any],
+        token_counts: Dict[str, Any],
+        overflow_handled: bool,
+    ) -> Dict[str, Any]:
+        """Build a chat() result from a cache hit (nothing billed, no latency)."""
+        no_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        return {
+            "text": cached["text"],
+            "usage": reconcile_usage(token_counts, no_usage),
+            "latency_ms": 0,
+            "raw": None,
+            "meta": {
+                "retry_count": 0,
+                "backoff_ms_total": 0,
+                "overflow_handled": overflow_handled,
+                "cache_hit": True,
+            },
+        }
+
+    @staticmethod
+    def _build_result(
+        response: Dict[str, Any],
+        token_counts: Dict[str, Any],
+        latency_ms: int,
+        retry_count: int,
+        total_backoff_ms: int,
+        overflow_handled: bool,
+    ) -> Dict[str, Any]:
+        """Assemble the common chat()/achat() return value."""
+        return {
+            "text": response["text"],
+            "usage": reconcile_usage(token_counts, response.get("usage")),
+            "latency_ms": latency_ms,
+            "raw": response.get("raw"),
+            "meta": {
+                "retry_count": retry_count,
+                "backoff_ms_total": total_backoff_ms,
+                "overflow_handled": overflow_handled,
+            },
+        }
+
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        context_strs: Optional[List[str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Send chat completion request with automatic retry and token management.
+
+        Args:
+            messages: OpenAI-style messages array
+            context_strs: Optional context strings (counted separately)
+            temperature: Sampling temperature
+            max_tokens: Max completion tokens
+            use_cache: Reuse a cached response when temperature is 0
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Dict with text, usage (estimated + actual), latency_ms, meta
+            (meta["cache_hit"] is True when served from the response cache)
+        """
+        messages, token_counts, overflow_handled = self._prepare_messages(messages, context_strs)
+
+        cache_key = self._cache_key(messages, context_strs, temperature, max_tokens, use_cache, kwargs)
+        if cache_key is not None:
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached, token_counts, overflow_handled)
+
         # Retry loop
         retry_count = 0
         total_backoff_ms = 0
-        last_error = None
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -191,65 +378,318 @@ class LLMClient:
                     raise ValueError(f"Unsupported provider: {self.provider}")
 
                 latency_ms = int((time.time() - start_time) * 1000)
+                if cache_key is not None:
+                    get_response_cache().set(cache_key, {"text": response["text"]})
+                return self._build_result(
+                    response, token_counts, latency_ms, retry_count, total_backoff_ms, overflow_handled
+                )
+
+            except Exception as e:
+                backoff_sec = self._retry_backoff(e, attempt, overflow_handled)
+                retry_count += 1
+                total_backoff_ms += int(backoff_sec * 1000)
+                time.sleep(backoff_sec)
+
+        # Should not reach here: the last attempt either returns or raises
+        raise RuntimeError("Unknown error in LLM call")
+
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        context_strs: Optional[List[str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of chat() using the provider's async SDK.
 
-                # Extract text and usage
-                text = response["text"]
-                provider_usage = response.get("usage")
-
-                # Reconcile token usage
-                usage = reconcile_usage(token_counts, provider_usage)
-
-                return {
-                    "text": text,
-                    "usage": usage,
-                    "latency_ms": latency_ms,
-                    "raw": response.get("raw"),
-                    "meta": {
-                        "retry_count": retry_count,
-                        "backoff_ms_total": total_backoff_ms,
-                        "overflow_handled": overflow_handled,
-                    },
-                }
+        Same arguments, retry policy and return format as chat(); backoff
+        uses asyncio.sleep so other requests keep running meanwhile. Each
+        attempt waits for a slot under the provider's rate limit for this
+        event loop (utils/rate_limit.py).
+        """
+        messages, token_counts, overflow_handled = self._prepare_messages(messages, context_strs)
+
+        cache_key = self._cache_key(messages, context_strs, temperature, max_tokens, use_cache, kwargs)
+        if cache_key is not None:
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached, token_counts, overflow_handled)
+
+        # Retry loop
+        retry_count = 0
+        total_backoff_ms = 0
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with get_limiter(self.provider).slot():
+                    start_time = time.time()
+
+                    # Call provider-specific implementation
+                    if self.provider == "openai":
+                        response = await self._acall_openai(messages, temperature, max_tokens, **kwargs)
+                    elif self.provider == "google":
+                        response = await self._acall_google(messages, temperature, max_tokens, **kwargs)
+                    elif self.provider == "groq":
+                        response = await self._acall_groq(messages, temperature, max_tokens, **kwargs)
+                    else:
+                        raise ValueError(f"Unsupported provider: {self.provider}")
+
+                latency_ms = int((time.time() - start_time) * 1000)
+                if cache_key is not None:
+                    get_response_cache().set(cache_key, {"text": response["text"]})
+                return self._build_result(
+                    response, token_counts, latency_ms, retry_count, total_backoff_ms, overflow_handled
+                )
 
             except Exception as e:
-                last_error = e
-
-                # Check if we should retry
-                if attempt < self.max_retries and self._is_retryable_error(e):
-                    retry_count += 1
-                    backoff_sec = self._calculate_backoff(attempt)
-                    backoff_ms = int(backoff_sec * 1000)
-                    total_backoff_ms += backoff_ms
-
-                    time.sleep(backoff_sec)
-                    continue
-
-                # Context overflow error - try summarization
-                error_str = str(e).lower()
-                if (
-                    "context" in error_str
-                    and ("length" in error_str or "too long" in error_str)
-                    and not overflow_handled
-                ):
-                    # This should be handled by caller using overflow_summarize prompt
-                    raise ValueError(
-                        "Context window exceeded. Use overflow_summarize.v1 prompt."
-                    ) from e
-
-                # Non-retryable error or max retries exceeded
-                raise
-
-        # Should not reach here, but just in case
-        raise last_error or Exception("Unknown error in LLM call")
+                backoff_sec = self._retry_backoff(e, attempt, overflow_handled)
+                retry_count += 1
+                total_backoff_ms += int(backoff_sec * 1000)
+                await asyncio.sleep(backoff_sec)
 
-    def _call_openai(
+        # Should not reach here: the last attempt either returns or raises
+        raise RuntimeError("Unknown error in LLM call")
+
+    def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion as incremental text chunks.
+
+        No retry, caching or token accounting (see chat_until). Closing the
+        generator early closes the HTTP response, so the provider stops
+        generating the rest of the completion.
+        """
+        if self.provider in ("openai", "groq"):
+            build_params = self._openai_params if self.provider == "openai" else self._groq_params
+            params = build_params(messages, temperature, max_tokens, **kwargs)
+            stream = self.client.chat.completions.create(stream=True, **params)
+            try:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                stream.close()
+        elif self.provider == "google":
+            contents, generation_config = self._google_request(messages, temperature, max_tokens)
+            stream = self.client.models.generate_content_stream(
+                model=self.model,
+                contents=contents,
+                config=generation_config,
+            )
+            try:
+                for chunk in stream:
+                    if chunk.text:
+                        yield chunk.text
+            finally:
+                stream.close()
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+
+    async def astream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Async variant of stream_chat()."""
+        if self.provider in ("openai", "groq"):
+            build_params = self._openai_params if self.provider == "openai" else self._groq_params
+            params = build_params(messages, temperature, max_tokens, **kwargs)
+            stream = await self.async_client.chat.completions.create(stream=True, **params)
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()
+        elif self.provider == "google":
+            contents, generation_config = self._google_request(messages, temperature, max_tokens)
+            stream = await self.async_client.models.generate_content_stream(
+                model=self.model,
+                contents=contents,
+                config=generation_config,
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.text:
+                        yield chunk.text
+            finally:
+                await stream.aclose()
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+
+    def _streamed_result(
+        self,
+        text: str,
+        stopped_early: bool,
+        token_counts: Dict[str, Any],
+        latency_ms: int,
+        retry_count: int,
+        total_backoff_ms: int,
+        overflow_handled: bool,
+    ) -> Dict[str, Any]:
+        """Build a chat() result from streamed text."""
+        # Streams don't report usage (and we may never reach the final
+        # chunk), so completion tokens are counted from what was received
+        usage = reconcile_usage(token_counts, None)
+        usage["completion_tokens_actual"] = count_text_tokens(text, self.provider, self.model)
+        return {
+            "text": text,
+            "usage": usage,
+            "latency_ms": latency_ms,
+            "raw": None,
+            "meta": {
+                "retry_count": retry_count,
+                "backoff_ms_total": total_backoff_ms,
+                "overflow_handled": overflow_handled,
+                "stopped_early": stopped_early,
+            },
+        }
+
+    def chat_until(
+        self,
+        messages: List[Dict[str, str]],
+        done: Callable[[str], bool],
+        context_strs: Optional[List[str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Stream a chat completion and stop as soon as done(text) is True.
+
+        Useful when the answer comes first and the model pads it with
+        explanation. Same retry policy, response cache and return format
+        as chat(); meta["stopped_early"] is True when the stream was cut
+        off. A cut-off text is cached as is, since done() accepted it.
+
+        Args:
+            messages: OpenAI-style messages array
+            done: Called with the text received so far after each chunk
+            context_strs: Optional context strings (counted separately)
+            temperature: Sampling temperature
+            max_tokens: Max completion tokens
+            use_cache: Read/fill the response cache (temperature 0 only)
+            **kwargs: Additional provider-specific parameters
+        """
+        messages, token_counts, overflow_handled = self._prepare_messages(messages, context_strs)
+
+        cache_key = self._cache_key(messages, context_strs, temperature, max_tokens, use_cache, kwargs)
+        if cache_key is not None:
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached, token_counts, overflow_handled)
+
+        # Retry loop
+        retry_count = 0
+        total_backoff_ms = 0
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                start_time = time.time()
+                text = ""
+                stopped_early = False
+
+                stream = self.stream_chat(messages, temperature, max_tokens, **kwargs)
+                try:
+                    for chunk in stream:
+                        text += chunk
+                        if done(text):
+                            stopped_early = True
+                            break
+                finally:
+                    stream.close()
+
+                latency_ms = int((time.time() - start_time) * 1000)
+                if cache_key is not None:
+                    get_response_cache().set(cache_key, {"text": text})
+                return self._streamed_result(
+                    text, stopped_early, token_counts, latency_ms, retry_count, total_backoff_ms, overflow_handled
+                )
+
+            except Exception as e:
+                backoff_sec = self._retry_backoff(e, attempt, overflow_handled)
+                retry_count += 1
+                total_backoff_ms += int(backoff_sec * 1000)
+                time.sleep(backoff_sec)
+
+        # Should not reach here: the last attempt either returns or raises
+        raise RuntimeError("Unknown error in LLM call")
+
+    async def achat_until(
+        self,
+        messages: List[Dict[str, str]],
+        done: Callable[[str], bool],
+        context_strs: Optional[List[str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Async variant of chat_until()."""
+        messages, token_counts, overflow_handled = self._prepare_messages(messages, context_strs)
+
+        cache_key = self._cache_key(messages, context_strs, temperature, max_tokens, use_cache, kwargs)
+        if cache_key is not None:
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached, token_counts, overflow_handled)
+
+        # Retry loop
+        retry_count = 0
+        total_backoff_ms = 0
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with get_limiter(self.provider).slot():
+                    start_time = time.time()
+                    text = ""
+                    stopped_early = False
+
+                    stream = self.astream_chat(messages, temperature, max_tokens, **kwargs)
+                    try:
+                        async for chunk in stream:
+                            text += chunk
+                            if done(text):
+                                stopped_early = True
+                                break
+                    finally:
+                        await stream.aclose()
+
+                latency_ms = int((time.time() - start_time) * 1000)
+                if cache_key is not None:
+                    get_response_cache().set(cache_key, {"text": text})
+                return self._streamed_result(
+                    text, stopped_early, token_counts, latency_ms, retry_count, total_backoff_ms, overflow_handled
+                )
+
+            except Exception as e:
+                backoff_sec = self._retry_backoff(e, attempt, overflow_handled)
+                retry_count += 1
+                total_backoff_ms += int(backoff_sec * 1000)
+                await asyncio.sleep(backoff_sec)
+
+        # Should not reach here: the last attempt either returns or raises
+        raise RuntimeError("Unknown error in LLM call")
+
+    def _openai_params(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
         **kwargs,
     ) -> Dict[str, Any]:
-        """Call OpenAI API."""
+        """Build OpenAI chat.completions parameters."""
         params = {
             "model": self.model,
             "messages": messages,
@@ -272,9 +712,32 @@ class LLMClient:
                 params["max_tokens"] = max_tokens
 
         params.update(kwargs)
+        return params
 
-        response = self.client.chat.completions.create(**params)
+    def _groq_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Build Groq chat.completions parameters (OpenAI-compatible)."""
+        params = {
+            "model": self.model,
+            "messages": messages,
+        }
+
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
 
+        params.update(kwargs)
+        return params
+
+    @staticmethod
+    def _parse_chat_completion(response: Any) -> Dict[str, Any]:
+        """Normalize an OpenAI-style chat completion (OpenAI and Groq)."""
         return {
             "text": response.choices[0].message.content or "",
             "usage": {
@@ -285,15 +748,13 @@ class LLMClient:
             "raw": response,
         }
 
-    def _call_google(
+    def _google_request(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
-        **kwargs,
-    ) -> Dict[str, Any]:
-        """Call Google Gemini API using new google-genai SDK."""
-        # Convert OpenAI format to Gemini format
+    ) -> tuple[list, Optional[types.GenerateContentConfig]]:
+        """Convert OpenAI-style messages into Gemini contents and config."""
         gemini_contents = []
         system_instruction = None
 
@@ -322,14 +783,11 @@ class LLMClient:
             config_params["system_instruction"] = system_instruction
 
         generation_config = types.GenerateContentConfig(**config_params) if config_params else None
+        return gemini_contents, generation_config
 
-        # Generate content using new client API
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=gemini_contents,
-            config=generation_config,
-        )
-
+    @staticmethod
+    def _parse_google_response(response: Any) -> Dict[str, Any]:
+        """Normalize a Gemini generate_content response."""
         # Extract usage metadata
         usage = {}
         if hasattr(response, "usage_metadata") and response.usage_metadata:
@@ -344,37 +802,85 @@ class LLMClient:
             "raw": response,
         }
 
-    def _call_groq(
+    def _call_openai(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
         **kwargs,
     ) -> Dict[str, Any]:
-        """Call Groq API (OpenAI-compatible)."""
-        params = {
-            "model": self.model,
-            "messages": messages,
-        }
+        """Call OpenAI API."""
+        params = self._openai_params(messages, temperature, max_tokens, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._parse_chat_completion(response)
 
-        if temperature is not None:
-            params["temperature"] = temperature
-        if max_tokens is not None:
-            params["max_tokens"] = max_tokens
+    async def _acall_openai(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call OpenAI API (async)."""
+        params = self._openai_params(messages, temperature, max_tokens, **kwargs)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_chat_completion(response)
 
-        params.update(kwargs)
+    def _call_google(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Google Gemini API using new google-genai SDK."""
+        contents, generation_config = self._google_request(messages, temperature, max_tokens)
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=generation_config,
+        )
+        return self._parse_google_response(response)
 
+    async def _acall_google(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Google Gemini API (async)."""
+        contents, generation_config = self._google_request(messages, temperature, max_tokens)
+        response = await self.async_client.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=generation_config,
+        )
+        return self._parse_google_response(response)
+
+    def _call_groq(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Groq API (OpenAI-compatible)."""
+        params = self._groq_params(messages, temperature, max_tokens, **kwargs)
         response = self.client.chat.completions.create(**params)
+        return self._parse_chat_completion(response)
 
-        return {
-            "text": response.choices[0].message.content or "",
-            "usage": {
-                "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                "completion_tokens": response.usage.completion_tokens if response.usage else None,
-                "total_tokens": response.usage.total_tokens if response.usage else None,
-            },
-            "raw": response,
-        }
+    async def _acall_groq(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Groq API (async)."""
+        params = self._groq_params(messages, temperature, max_tokens, **kwargs)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_chat_completion(response)
 
     def json_chat(
         self,
@@ -395,6 +901,18 @@ class LLMClient:
 
         return self.chat(messages, temperature=temperature, **kwargs)
 
+    async def ajson_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = 0.0,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Async variant of json_chat()."""
+        if self.provider == "openai":
+            kwargs["response_format"] = {"type": "json_object"}
+
+        return await self.achat(messages, temperature=temperature, **kwargs)
+
     def tool_chat(
         self,
         messages: List[Dict[str, str]],
@@ -427,3 +945,57 @@ class LLMClient:
 
         return self.chat(messages, temperature=temperature, **kwargs)
 
+
+_clients: Dict[tuple[str, str], LLMClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(provider: Literal["openai", "google", "groq"], model: str) -> LLMClient:
+    """
+    Get the shared LLMClient for a provider and model.
+
+    Services call this instead of constructing LLMClient per call, so
+    requests reuse the client's keep-alive connections. Clients use the
+    config defaults for retries and backoff.
+    """
+    client = _clients.get((provider, model))
+    if client is None:
+        with _clients_lock:
+            client = _clients.get((provider, model))
+            if client is None:
+                client = _clients[(provider, model)] = LLMClient(provider, model)
+    return client
+
+
+async def aclose_loop_clients() -> None:
+    """Close the async connections the shared clients opened on the running loop."""
+    with _clients_lock:
+        clients = list(_clients.values())
+    for client in clients:
+        await client.aclose_async()
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    asyncio.run() for the services' sync batch wrappers.
+
+    Each asyncio.run() is a new event loop, and the shared clients open an
+    async connection pool per loop; those pools are closed before the loop
+    ends rather than left open on a dead loop.
+    """
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose_loop_clients()
+
+    return asyncio.run(main())
+
+
+async def aclose_clients() -> None:
+    """Close and drop every shared client (on application shutdown)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -16,6 +16,7 @@ Usage:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from string import Template
 from typing import Optional, List, Dict, Tuple
 
@@ -32,6 +33,7 @@ class PromptSpec:
         stop: Optional stop sequences
         max_tokens: Suggested max output tokens
         temperature: Suggested temperature (0.0-1.0)
+        system: Optional static system template (see render_system)
     """
 
     id: str
@@ -40,6 +42,7 @@ class PromptSpec:
     stop: Optional[List[str]] = None
     max_tokens: Optional[int] = None
     temperature: Optional[float] = None
+    system: Optional[str] = None
 
 
 # Central prompt registry
@@ -182,9 +185,71 @@ PROMPTS: Dict[str, PromptSpec] = {
         temperature=0.0,
         max_tokens=20,
     ),
+    # Chat variants: the static instructions live in a system message rendered
+    # once, and only the per-call input goes in the user message. Keeping the
+    # prefix byte-identical lets providers reuse their prompt cache.
+    "few_shot_chat.v1": PromptSpec(
+        id="few_shot_chat.v1",
+        purpose="Few-shot with examples in a static system prefix",
+        system=(
+            "You are ${role}. Learn from the examples, then answer for the input.\n\n"
+            "Examples:\n${examples}\n\n"
+            "Constraints: ${constraints}\n"
+            "Output format: ${format}\n"
+        ),
+        template='Input: "${query}"\nOutput:',
+        temperature=0.2,
+    ),
+    "few_shot_batch_chat.v1": PromptSpec(
+        id="few_shot_batch_chat.v1",
+        purpose="Few-shot over a numbered list of inputs, one answer line each",
+        system=(
+            "You are ${role}. Learn from the examples, then answer for each numbered input.\n\n"
+            "Examples:\n${examples}\n\n"
+            "Constraints: ${constraints}\n"
+            "Output format: one line per input, prefixed by its number: <number>. ${format}\n"
+        ),
+        template=(
+            "Classify each of the following crisis messages. "
+            "Answer on a separate line per input, prefixed by its number:\n${items}"
+        ),
+        temperature=0.2,
+    ),
+    "json_extract_chat.v1": PromptSpec(
+        id="json_extract_chat.v1",
+        purpose="Schema-first JSON extraction with the schema in a static system prefix",
+        system=(
+            "Extract the requested fields and return ONLY valid JSON matching this schema:\n"
+            "${schema}\n\n"
+            "Return ONLY JSON, no extra text."
+        ),
+        template="Text:\n${text}",
+        temperature=0.0,
+        max_tokens=400,
+    ),
+    "cot_reasoning_chat.v1": PromptSpec(
+        id="cot_reasoning_chat.v1",
+        purpose="Chain-of-thought with fixed rules in a static system prefix",
+        system=(
+            "You are ${role}. Solve the problem carefully.\n"
+            "${rules}\n\n"
+            "First, outline your reasoning steps briefly.\n"
+            "Then provide the final answer clearly marked under 'Answer:'.\n"
+            "Keep reasoning concise; avoid unnecessary prose.\n"
+        ),
+        template="Problem:\n${problem}",
+        temperature=0.3,
+        max_tokens=4096,
+    ),
 }
 
 
+@lru_cache(maxsize=None)
+def _compile(template: str) -> Template:
+    """Build (and reuse) the Template for a template string."""
+    return Template(template)
+
+
 def render(prompt_id: str, **vars) -> Tuple[str, PromptSpec]:
     """
     Render a prompt template with variables.
@@ -213,10 +278,40 @@ def render(prompt_id: str, **vars) -> Tuple[str, PromptSpec]:
         )
 
     spec = PROMPTS[prompt_id]
-    text = Template(spec.template).safe_substitute(**vars)
+    text = _compile(spec.template).safe_substitute(**vars)
     return text, spec
 
 
+def render_system(prompt_id: str, **vars) -> str:
+    """
+    Render the static system template of a chat prompt.
+
+    Call once (e.g. at import time) and reuse the result, so every request
+    shares a byte-identical prefix.
+
+    Args:
+        prompt_id: Prompt identifier from PROMPTS registry
+        **vars: Variables to substitute in the system template
+
+    Returns:
+        Rendered system text
+
+    Raises:
+        KeyError: If prompt_id not found in registry
+        ValueError: If the prompt has no system template
+    """
+    if prompt_id not in PROMPTS:
+        raise KeyError(
+            f"Prompt '{prompt_id}' not found. "
+            f"Available: {', '.join(PROMPTS.keys())}"
+        )
+
+    spec = PROMPTS[prompt_id]
+    if spec.system is None:
+        raise ValueError(f"Prompt '{prompt_id}' has no system template")
+    return _compile(spec.system).safe_substitute(**vars)
+
+
 def list_prompts() -> List[str]:
     """
     List all available prompt IDs.
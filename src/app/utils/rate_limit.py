@@ -0,0 +1,160 @@
+"""
+Limits on async LLM calls, per provider and event loop.
+
+gather_bounded() caps concurrency within one batch; these limits hold across
+every async request served on the same event loop (the API server's), so
+several batches at once don't trip the provider's rate limit (429s, then
+latency dominated by backoff).
+
+Scope:
+- Async calls only (achat/achat_until); the sync chat()/chat_until() paths
+  don't take a slot.
+- One limiter per event loop: asyncio primitives belong to a loop, so a call
+  from a new loop (each run_sync() batch) starts a fresh limiter and
+  replaces the stored one.
+- Limits are configured for the whole server and split evenly across the
+  API worker processes (APIConfig.workers), since each worker has its own.
+
+Each provider gets (config.yaml rate_limits.<provider>):
+- max_in_flight: semaphore on concurrent calls
+- rpm: token bucket on calls started per minute (null = unlimited)
+
+Time spent waiting for a slot is tracked per provider (see
+rate_limit_stats()) so the limits can be tuned against real traffic.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from .config_loader import get_config
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate_per_minute` acquisitions per minute.
+
+    Bursts up to `capacity` (default: a full minute's worth, matching
+    providers' per-minute windows).
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, float(rate_per_minute))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ProviderLimiter:
+    """Concurrency cap plus optional request-rate cap for one provider."""
+
+    def __init__(self, max_in_flight: int, rpm: Optional[float] = None):
+        """
+        Initialize provider limiter.
+
+        Args:
+            max_in_flight: Max concurrent calls
+            rpm: Max calls started per minute (None = unlimited)
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._bucket = TokenBucket(rpm) if rpm else None
+        self.in_flight = 0
+        self.calls = 0
+        self.waited_calls = 0
+        self.wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """
+        Hold one call slot for the duration of the block.
+
+        Yields:
+            Seconds spent waiting for the slot
+        """
+        start = time.perf_counter()
+        async with self._semaphore:
+            if self._bucket is not None:
+                await self._bucket.acquire()
+
+            waited = time.perf_counter() - start
+            self.calls += 1
+            if waited >= 0.001:
+                self.waited_calls += 1
+                self.wait_seconds += waited
+
+            self.in_flight += 1
+            try:
+                yield waited
+            finally:
+                self.in_flight -= 1
+
+
+# provider -> (event loop, limiter); asyncio primitives belong to one loop,
+# so a call from a new loop (e.g. asyncio.run in a sync wrapper) starts fresh
+_limiters: dict[str, tuple[asyncio.AbstractEventLoop, ProviderLimiter]] = {}
+
+
+def _worker_limits(max_in_flight: int, rpm: Optional[float], workers: int) -> tuple[int, Optional[float]]:
+    """
+    One worker's share of the server-wide limits.
+
+    Returns:
+        Tuple of (max_in_flight, rpm); at least one call in flight
+    """
+    workers = max(1, workers)
+    return max(1, max_in_flight // workers), (rpm / workers if rpm else None)
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """Get the limiter for a provider on the running event loop."""
+    from ..config import load_config
+
+    loop = asyncio.get_running_loop()
+    entry = _limiters.get(provider)
+    if entry is None or entry[0] is not loop:
+        settings = get_config().get(f"rate_limits.{provider}") or {}
+        max_in_flight, rpm = _worker_limits(
+            int(settings.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)),
+            settings.get("rpm"),
+            load_config().api.workers,
+        )
+        limiter = ProviderLimiter(max_in_flight=max_in_flight, rpm=rpm)
+        entry = _limiters[provider] = (loop, limiter)
+    return entry[1]
+
+
+def rate_limit_stats() -> dict[str, dict]:
+    """
+    Saturation per provider since the limiter was created (this worker,
+    latest event loop).
+
+    Returns:
+        Mapping of provider -> calls, calls that had to wait, total and
+        mean wait (ms), calls in flight and the concurrency cap
+    """
+    stats = {}
+    for provider, (_, limiter) in _limiters.items():
+        stats[provider] = {
+            "calls": limiter.calls,
+            "waited_calls": limiter.waited_calls,
+            "wait_ms_total": int(limiter.wait_seconds * 1000),
+            "wait_ms_mean": int(limiter.wait_seconds * 1000 / limiter.calls) if limiter.calls else 0,
+            "in_flight": limiter.in_flight,
+            "max_in_flight": limiter.max_in_flight,
+        }
+    return stats
@@ -0,0 +1,142 @@
+"""
+Exact-match cache for deterministic LLM responses.
+
+LLMClient consults this cache before calling a provider when a request is
+deterministic (temperature == 0). Keys hash everything that affects the
+completion: provider, model, sampling params, messages and extra kwargs.
+
+Backends:
+- In-process LRU (default, per worker)
+- Redis, when SHARED_CACHE_URL is set and the `redis` package is installed,
+  so all uvicorn workers share hits
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from .config_loader import get_config
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "llm:response:"
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+    messages: list[dict[str, str]],
+    context_strs: Optional[list[str]] = None,
+    **kwargs: Any,
+) -> str:
+    """
+    Build a stable cache key for an LLM request.
+
+    Returns:
+        Hex digest (blake2b, 128-bit) of the canonical request
+    """
+    payload = json.dumps(
+        [provider, model, temperature, max_tokens, messages, context_strs, kwargs],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU of cached responses, optionally backed by Redis."""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: int = 3600, redis_url: str = ""):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Max entries kept in the in-process LRU
+            ttl_seconds: Expiry for Redis entries (the LRU evicts by size only)
+            redis_url: Optional Redis URL for a cache shared across workers
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = self._connect_redis(redis_url) if redis_url else None
+
+    @staticmethod
+    def _connect_redis(redis_url: str) -> Any:
+        """Create a Redis client, or None if redis isn't installed."""
+        try:
+            import redis
+        except ImportError:
+            logger.warning("SHARED_CACHE_URL is set but 'redis' is not installed; using in-process cache")
+            return None
+        return redis.Redis.from_url(redis_url)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(_KEY_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Response cache read failed: {e}")
+                return None
+            if raw is not None:
+                value = json.loads(raw)
+                self._store_local(key, value)
+                return value
+
+        return None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store a JSON-serializable value under key."""
+        self._store_local(key, value)
+        if self._redis is not None:
+            try:
+                self._redis.set(_KEY_PREFIX + key, json.dumps(value), ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Response cache write failed: {e}")
+
+    def _store_local(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire on their own)."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache.
+
+    Returns:
+        ResponseCache, or None if disabled in config.yaml
+    """
+    from ..config import load_config
+
+    config = get_config()
+    if not config.get("cache.response.enabled", True):
+        return None
+
+    return ResponseCache(
+        max_entries=config.get("cache.response.max_entries", 10_000),
+        ttl_seconds=config.get("cache.response.ttl_seconds", 3600),
+        redis_url=load_config().api.shared_cache_url,
+    )
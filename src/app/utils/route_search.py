@@ -0,0 +1,145 @@
+"""
+Deterministic rescue route search.
+
+Replaces the LLM Tree-of-Thought step for route optimization. The three
+ToT branches are evaluated analytically, and for small problems every visit
+order is enumerated with numpy to find the exact optimum.
+
+Routes are ranked by priority-weighted response time (sum of score x arrival
+minute), so high-priority incidents are reached early, then by total time.
+Every route visits every incident, so total priority score is the same for
+all of them.
+
+Layout:
+    node 0 -> starting location
+    node i + 1 -> stop i (incident i's location)
+"""
+
+from itertools import permutations
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .travel_matrix import TravelMatrix
+
+PRIORITY_FIRST = "Highest priority first"
+CLOSEST_FIRST = "Closest location first"
+FURTHEST_FIRST = "Furthest location first"
+EXHAUSTIVE = "Exhaustive search"
+
+# Largest stop count solved exactly (8! = 40320 orders)
+EXHAUSTIVE_MAX_STOPS = 8
+
+
+class RoutePlan(NamedTuple):
+    """One candidate visit order and its cost."""
+
+    strategy: str
+    order: tuple[int, ...]
+    total_time: int
+    weighted_time: int
+
+
+def leg_costs(
+    travel_matrix: Optional[TravelMatrix],
+    start: str,
+    locations: list[str],
+) -> np.ndarray:
+    """
+    Build the (N+1)x(N+1) leg-time matrix for a start point and N stops.
+
+    Legs between the same location cost 0. Unknown legs cost the longest
+    known leg, so routes through them are never assumed to be cheap.
+
+    Args:
+        travel_matrix: Known travel times (None if there are none)
+        start: Starting location
+        locations: Location of each stop
+
+    Returns:
+        int64 matrix of minutes between nodes
+    """
+    names = [start, *locations]
+    if travel_matrix is None:
+        costs = np.full((len(names), len(names)), np.nan)
+    else:
+        costs = travel_matrix.times(names)
+
+    name_arr = np.array(names, dtype=object)
+    costs[name_arr[:, None] == name_arr[None, :]] = 0
+
+    known = costs[~np.isnan(costs)]
+    fill = known.max() if known.size else 0
+    return np.nan_to_num(costs, nan=fill).astype(np.int64)
+
+
+def evaluate(strategy: str, order: tuple[int, ...], costs: np.ndarray, scores: np.ndarray) -> RoutePlan:
+    """Cost out a visit order (stop indices) as a RoutePlan."""
+    if not order:
+        return RoutePlan(strategy=strategy, order=order, total_time=0, weighted_time=0)
+
+    nodes = np.asarray(order, dtype=np.int64) + 1
+    arrivals = np.cumsum(costs[np.concatenate(([0], nodes[:-1])), nodes])
+    return RoutePlan(
+        strategy=strategy,
+        order=order,
+        total_time=int(arrivals[-1]),
+        weighted_time=int(scores[nodes - 1] @ arrivals),
+    )
+
+
+def _neighbour_order(costs: np.ndarray, furthest: bool) -> tuple[int, ...]:
+    """Greedy order: repeatedly go to the closest (or furthest) unvisited stop."""
+    remaining = list(range(costs.shape[0] - 1))
+    order = []
+    current = 0
+    while remaining:
+        legs = costs[current, [stop + 1 for stop in remaining]]
+        pick = int(np.argmax(legs) if furthest else np.argmin(legs))
+        current = remaining.pop(pick) + 1
+        order.append(current - 1)
+    return tuple(order)
+
+
+def _exhaustive_plan(costs: np.ndarray, scores: np.ndarray) -> RoutePlan:
+    """Exact optimum over all visit orders (vectorized over permutations)."""
+    n = len(scores)
+    orders = np.array(list(permutations(range(n))), dtype=np.int64)
+    nodes = orders + 1
+    previous = np.concatenate((np.zeros((len(orders), 1), dtype=np.int64), nodes[:, :-1]), axis=1)
+    arrivals = np.cumsum(costs[previous, nodes], axis=1)
+    weighted = (scores[orders] * arrivals).sum(axis=1)
+    best = int(np.lexsort((arrivals[:, -1], weighted))[0])
+    return RoutePlan(
+        strategy=EXHAUSTIVE,
+        order=tuple(int(stop) for stop in orders[best]),
+        total_time=int(arrivals[best, -1]),
+        weighted_time=int(weighted[best]),
+    )
+
+
+def search_routes(costs: np.ndarray, scores: list[int]) -> tuple[RoutePlan, list[RoutePlan]]:
+    """
+    Evaluate the ToT branches (plus exhaustive search when small) and pick one.
+
+    Args:
+        costs: Leg-time matrix from leg_costs()
+        scores: Priority score of each stop
+
+    Returns:
+        Tuple of (best plan, all candidate plans in branch order)
+    """
+    score_arr = np.asarray(scores, dtype=np.int64)
+    priority_order = tuple(int(stop) for stop in np.argsort(-score_arr, kind="stable"))
+
+    candidates = [
+        evaluate(PRIORITY_FIRST, priority_order, costs, score_arr),
+        evaluate(CLOSEST_FIRST, _neighbour_order(costs, furthest=False), costs, score_arr),
+        evaluate(FURTHEST_FIRST, _neighbour_order(costs, furthest=True), costs, score_arr),
+    ]
+    if 0 < len(scores) <= EXHAUSTIVE_MAX_STOPS:
+        candidates.append(_exhaustive_plan(costs, score_arr))
+
+    # min() keeps the first of equal plans, so a named branch wins ties
+    best = min(candidates, key=lambda plan: (plan.weighted_time, plan.total_time))
+    return best, candidates
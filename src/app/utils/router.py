@@ -4,17 +4,20 @@ Model routing utilities.
 Automatically selects appropriate model tier based on prompt technique:
 - Reasoning techniques (cot, tot) → reasoning models
 - General techniques → general models
+- Simple labelling tasks can ask for the tiny tier explicitly
 """
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
 
+@lru_cache(maxsize=64)
 def pick_model(
     provider: Literal["openai", "google", "groq"],
     technique: str,
-    tier: Optional[Literal["general", "strong", "reason"]] = None,
+    tier: Optional[Literal["tiny", "general", "strong", "reason"]] = None,
     config_path: str = "config/models.yaml",
 ) -> str:
     """
@@ -24,7 +27,11 @@ def pick_model(
     - technique in {"cot", "tot", "cot_reasoning", "tot_reasoning"} → reason tier
     - technique in {"strong", "complex"} → strong tier
     - Otherwise → general tier
-    - Explicit tier parameter overrides automatic routing
+    - Explicit tier parameter overrides automatic routing (the "tiny"
+      tier is only used when requested)
+
+    Results are memoized per argument tuple, so models.yaml is read once
+    per combination; call pick_model.cache_clear() after editing it.
 
     Args:
         provider: API provider (openai, google, groq)
@@ -0,0 +1,95 @@
+"""
+Vectorized incident priority scoring.
+
+Evaluates the priority rule (base 5, +2 vulnerable age, +3 Rescue,
++1 Medicine/Insulin, capped at 10) over struct-of-arrays inputs in a single
+call. Uses a parallel Numba kernel when numba is installed (optional) and
+an equivalent NumPy expression otherwise.
+
+Inputs:
+    vulnerable[i] -> incident i has an age > 60 or < 5
+    need_codes[i] -> NEED_CODES value for incident i's need type
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BASE_SCORE = 5
+VULNERABLE_BONUS = 2
+MAX_SCORE = 10
+
+NEED_OTHER = 0
+NEED_RESCUE = 1
+NEED_MEDICAL = 2
+
+# Need types the rule understands (lowercase); anything else is ambiguous
+NEED_CODES = {
+    "rescue": NEED_RESCUE,
+    "medicine": NEED_MEDICAL,
+    "insulin": NEED_MEDICAL,
+    "supply": NEED_OTHER,
+    "water": NEED_OTHER,
+    "food": NEED_OTHER,
+    "shelter": NEED_OTHER,
+}
+
+# Bonus per need code
+NEED_BONUS = np.array([0, 3, 1], dtype=np.int8)
+
+
+def score_one(vulnerable: bool, need_code: int) -> int:
+    """Score a single incident (same rule as score_kernel)."""
+    return min(MAX_SCORE, BASE_SCORE + VULNERABLE_BONUS * vulnerable + int(NEED_BONUS[need_code]))
+
+
+def _score_numpy(vulnerable: np.ndarray, need_codes: np.ndarray) -> np.ndarray:
+    """NumPy implementation of score_kernel."""
+    scores = BASE_SCORE + VULNERABLE_BONUS * vulnerable.astype(np.int8) + NEED_BONUS[need_codes]
+    return np.minimum(scores, MAX_SCORE).astype(np.int8)
+
+
+def _score_loop(vulnerable, need_codes, need_bonus):
+    """Per-incident loop compiled by numba (prange runs in parallel)."""
+    scores = np.empty(vulnerable.shape[0], dtype=np.int8)
+    for i in prange(vulnerable.shape[0]):
+        score = BASE_SCORE + need_bonus[need_codes[i]]
+        if vulnerable[i]:
+            score += VULNERABLE_BONUS
+        scores[i] = min(score, MAX_SCORE)
+    return scores
+
+
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+    _jit_loop = None
+else:
+    _jit_loop = njit(parallel=True, cache=True)(_score_loop)
+
+
+def score_kernel(vulnerable: np.ndarray, need_codes: np.ndarray) -> np.ndarray:
+    """
+    Score many incidents at once.
+
+    Args:
+        vulnerable: bool array, True where an age is > 60 or < 5
+        need_codes: int8 array of NEED_CODES values
+
+    Returns:
+        int8 array of scores (0-10)
+    """
+    if _jit_loop is not None:
+        return _jit_loop(vulnerable, need_codes, NEED_BONUS)
+    return _score_numpy(vulnerable, need_codes)
+
+
+def warm_up() -> None:
+    """Compile (or load the cached) numba kernel so requests don't pay for it."""
+    if _jit_loop is None:
+        return
+    score_kernel(np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.int8))
+    logger.info("Scoring kernel compiled")
@@ -0,0 +1,128 @@
+"""
+Embedding-based cache for near-duplicate prompts.
+
+Crisis feeds repeat the same event in different words ("5 trapped in Ja-Ela
+roof" vs "Ja-Ela rooftop rescue 5 people"). Services embed the input, look
+for a stored result with cosine similarity above the technique's threshold,
+and only call the LLM on a miss. This sits behind the exact-match response
+cache in LLMClient and, like it, only serves deterministic (temperature 0)
+calls. Caches are per technique, provider and model.
+
+Disabled by default; needs the optional `sentence-transformers` package.
+Embeddings are L2-normalized, so a flat inner-product scan over a float32
+matrix gives cosine similarity (fast enough for a few thousand entries).
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Optional
+
+import numpy as np
+
+from .config_loader import get_config
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def _load_embedder(model_name: str, backend: str) -> Any:
+    """Load a SentenceTransformer once per process, or None if unavailable."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning("Semantic cache enabled but 'sentence-transformers' is not installed; disabling it")
+        return None
+    return SentenceTransformer(model_name, backend=backend)
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of results keyed by input embedding."""
+
+    def __init__(self, embedder: Any, threshold: float, max_entries: int = 5000):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embedder: SentenceTransformer-compatible model (has .encode())
+            threshold: Min cosine similarity for a hit
+            max_entries: Max stored entries (oldest overwritten first)
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embeddings: Optional[np.ndarray] = None
+        self._values: list[Any] = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed text as a normalized float32 vector."""
+        return np.asarray(
+            self.embedder.encode(text, normalize_embeddings=True), dtype=np.float32
+        )
+
+    def search(self, embedding: np.ndarray) -> tuple[Optional[Any], float]:
+        """
+        Find the most similar stored entry.
+
+        Returns:
+            Tuple of (value or None if below threshold, best similarity)
+        """
+        with self._lock:
+            if not self._values:
+                return None, 0.0
+            scores = self._embeddings[: len(self._values)] @ embedding
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            value = self._values[best]
+
+        return (value if similarity >= self.threshold else None), similarity
+
+    def add(self, embedding: np.ndarray, value: Any) -> None:
+        """Store a value under its input embedding."""
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = np.empty((self.max_entries, embedding.shape[0]), dtype=np.float32)
+
+            slot = self._next
+            self._embeddings[slot] = embedding
+            if slot < len(self._values):
+                self._values[slot] = value
+            else:
+                self._values.append(value)
+            self._next = (slot + 1) % self.max_entries
+
+
+@lru_cache(maxsize=32)
+def get_semantic_cache(technique: str, provider: str, model: str) -> Optional[SemanticCache]:
+    """
+    Get the semantic cache for a technique and model.
+
+    Entries aren't shared across models, since their outputs differ.
+
+    Args:
+        technique: Technique name used for the threshold lookup
+        provider: Provider the cached results came from
+        model: Model the cached results came from
+
+    Returns:
+        SemanticCache, or None if disabled or sentence-transformers is missing
+    """
+    config = get_config()
+    if not config.get("cache.semantic.enabled", False):
+        return None
+
+    embedder = _load_embedder(
+        config.get("cache.semantic.model", "sentence-transformers/all-MiniLM-L6-v2"),
+        config.get("cache.semantic.backend", "torch"),
+    )
+    if embedder is None:
+        return None
+
+    thresholds = config.get("cache.semantic.thresholds", {}) or {}
+    return SemanticCache(
+        embedder,
+        threshold=thresholds.get(technique, config.get("cache.semantic.threshold", 0.92)),
+        max_entries=config.get("cache.semantic.max_entries", 5000),
+    )
@@ -5,13 +5,18 @@ This module provides:
 - Encoding selection per provider/model
 - Token counting for text and messages
 - Reconciliation of estimated vs actual token usage
+- Aggregation of per-call usage for batch endpoints
 - Context-fit guards with summarize/truncate strategies
 """
 
 import tiktoken
+from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Literal, Optional, Any
 
 
+@lru_cache(maxsize=32)
 def pick_encoding(
     provider: Literal["openai", "google", "groq"], model: str
 ) -> tiktoken.Encoding:
@@ -21,6 +26,8 @@ def pick_encoding(
     OpenAI: Use o200k_base for 4.x/o3 models, cl100k_base as fallback
     Google/Groq: Use o200k_base as approximation (caveat: not exact)
 
+    Memoized per (provider, model), so every caller shares one Encoding.
+
     Args:
         provider: API provider name
         model: Model identifier
@@ -155,6 +162,62 @@ def reconcile_usage(
     return result
 
 
+def merge_usage(*usages: dict[str, Any]) -> dict[str, Any]:
+    """
+    Sum reconcile_usage() dicts field by field, for one result that took
+    several calls.
+
+    Fields stay None only if no call reported them.
+    """
+    merged: dict[str, Any] = {}
+    for usage in usages:
+        for key, value in usage.items():
+            if value is None:
+                merged.setdefault(key, None)
+            else:
+                merged[key] = (merged.get(key) or 0) + value
+    return merged
+
+
+# Keys of an aggregate usage dict (see aggregate_usage)
+USAGE_TOTAL_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def _billed_tokens(usage: dict[str, Any]) -> dict[str, int]:
+    """Prompt/completion/total tokens of a reconcile_usage() dict or an aggregate."""
+    if "prompt_tokens" in usage:
+        return usage
+
+    # Prefer provider counts; fall back to the estimate when none were
+    # reported (e.g. streamed responses)
+    prompt = usage.get("prompt_tokens_actual")
+    if prompt is None:
+        prompt = usage.get("total_est", 0)
+    completion = usage.get("completion_tokens_actual") or 0
+    total = usage.get("total_tokens_actual")
+    if total is None:
+        total = prompt + completion
+    return {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": total}
+
+
+def aggregate_usage(usages: Iterable[Optional[dict[str, Any]]]) -> dict[str, int]:
+    """
+    Sum token usage across calls.
+
+    Args:
+        usages: reconcile_usage() dicts and/or earlier aggregates (None/empty
+            entries are skipped)
+
+    Returns:
+        Dict with prompt_tokens, completion_tokens and total_tokens
+    """
+    totals = Counter()
+    for usage in usages:
+        if usage:
+            totals.update(_billed_tokens(usage))
+    return {key: totals[key] for key in USAGE_TOTAL_KEYS}
+
+
 def estimate_prompt_tokens(
     messages: list[dict[str, str]],
     provider: Literal["openai", "google", "groq"],
@@ -0,0 +1,119 @@
+"""
+Dense travel-time matrix for route optimization.
+
+The API accepts travel times as a nested dict (from -> to -> minutes). Route
+code converts it once into an int32 matrix plus a location index, so each
+edge lookup is an array read instead of two dict probes.
+
+Layout:
+    index[name] -> row/column of that location (first-seen order)
+    matrix[index[a], index[b]] -> minutes from a to b, or NO_EDGE if unknown
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+NO_EDGE = -1
+
+
+class TravelMatrix(NamedTuple):
+    """Travel times as a square int32 matrix plus a location index."""
+
+    matrix: np.ndarray
+    index: dict[str, int]
+
+    @property
+    def locations(self) -> list[str]:
+        """Location names in row/column order."""
+        return list(self.index)
+
+    def time(self, origin: str, destination: str) -> Optional[int]:
+        """
+        Minutes from origin to destination.
+
+        Falls back to the reverse edge, since the matrices supplied to the
+        API usually list each road once.
+
+        Returns:
+            Travel time, or None if neither direction is known
+        """
+        i = self.index.get(origin)
+        j = self.index.get(destination)
+        if i is None or j is None:
+            return None
+        minutes = self.matrix[i, j]
+        if minutes == NO_EDGE:
+            minutes = self.matrix[j, i]
+        return None if minutes == NO_EDGE else int(minutes)
+
+    def times(self, names: list[str]) -> np.ndarray:
+        """
+        Minutes between every pair of names, as one array gather.
+
+        Same fallback as time(): a missing edge uses the reverse direction.
+
+        Returns:
+            float64 matrix (len(names) x len(names)), NaN where unknown
+        """
+        if not self.index:
+            return np.full((len(names), len(names)), np.nan)
+
+        ix = np.array([self.index.get(name, -1) for name in names], dtype=np.intp)
+        minutes = self.matrix[np.ix_(ix, ix)]
+        minutes = np.where(minutes == NO_EDGE, minutes.T, minutes).astype(np.float64)
+        minutes[minutes == NO_EDGE] = np.nan
+
+        # Index -1 gathered the last location; blank out unknown names
+        unknown = ix < 0
+        minutes[unknown, :] = np.nan
+        minutes[:, unknown] = np.nan
+        return minutes
+
+
+def build_travel_matrix(travel_times: dict[str, dict[str, int]]) -> TravelMatrix:
+    """
+    Convert a nested travel-time dict into a TravelMatrix.
+
+    Args:
+        travel_times: Mapping of origin -> destination -> minutes
+
+    Returns:
+        TravelMatrix with NO_EDGE for pairs not in the input
+    """
+    index: dict[str, int] = {}
+    for origin, destinations in travel_times.items():
+        index.setdefault(origin, len(index))
+        for destination in destinations:
+            index.setdefault(destination, len(index))
+
+    matrix = np.full((len(index), len(index)), NO_EDGE, dtype=np.int32)
+    for origin, destinations in travel_times.items():
+        i = index[origin]
+        for destination, minutes in destinations.items():
+            matrix[i, index[destination]] = minutes
+
+    return TravelMatrix(matrix=matrix, index=index)
+
+
+def route_time(travel_matrix: TravelMatrix, route: list[str]) -> Optional[int]:
+    """
+    Total travel time along a route.
+
+    Args:
+        travel_matrix: Precomputed travel matrix
+        route: Ordered location names, starting point first
+
+    Returns:
+        Total minutes, or None if any leg is unknown
+    """
+    total = 0
+    for origin, destination in zip(route, route[1:]):
+        if origin == destination:
+            continue
+        minutes = travel_matrix.time(origin, destination)
+        if minutes is None:
+            return None
+        total += minutes
+    return total
+
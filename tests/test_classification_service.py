@@ -0,0 +1,150 @@
+"""Classification service: streamed early stop and response caching."""
+
+import asyncio
+
+import pytest
+
+from app.services import classification_service
+from app.services.classification_service import ClassificationService, _fields_complete
+from app.schemas.classification import ProviderConfig
+from app.utils import llm_client
+from app.utils.llm_client import LLMClient
+from app.utils.response_cache import get_response_cache
+
+ANSWER = ["District: Gam", "paha | Intent: Rescue", " | Priority: High", "\n", "Explanation: ", "people are trapped."]
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """Fake groq streams; records each streamed call and the chunks it consumed."""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    # Token estimates don't matter here and tiktoken may not have its files offline
+    monkeypatch.setattr(
+        llm_client,
+        "count_messages_tokens",
+        lambda *args, **kwargs: {"input_tokens": 10, "context_tokens": 0, "estimated_total": 10},
+    )
+    monkeypatch.setattr(llm_client, "count_text_tokens", lambda text, *args, **kwargs: len(text.split()))
+    monkeypatch.setattr(classification_service, "log_llm_call", lambda **kwargs: provider.logged.append(kwargs))
+    get_response_cache.cache_clear()
+
+    def stream_chat(self, messages, temperature=None, max_tokens=None, **kwargs):
+        consumed = []
+        provider.streams.append(consumed)
+        for chunk in provider.chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    async def astream_chat(self, messages, temperature=None, max_tokens=None, **kwargs):
+        for chunk in stream_chat(self, messages, temperature, max_tokens, **kwargs):
+            yield chunk
+
+    monkeypatch.setattr(LLMClient, "stream_chat", stream_chat)
+    monkeypatch.setattr(LLMClient, "astream_chat", astream_chat)
+    provider.chunks = ANSWER
+    provider.streams = []
+    provider.logged = []
+    yield provider
+    get_response_cache.cache_clear()
+
+
+def _config(temperature):
+    return ProviderConfig(provider="groq", temperature=temperature)
+
+
+@pytest.mark.parametrize(
+    "text, complete",
+    [
+        ("District: Colombo | Intent: Rescue | Priority: High\n", True),
+        ("District: Colombo | Intent: Rescue | Priority: High", False),
+        ("District: Colombo | Intent: Rescue | Priority: Hi", False),
+        ("District: Colombo | Intent: Rescue |", False),
+        ("District: | Intent: Rescue | Priority: High\n", False),
+        ("intent: info | district: None | priority: low |", True),
+    ],
+)
+def test_fields_complete(text, complete):
+    assert _fields_complete(text) is complete
+
+
+def test_stream_stops_once_fields_are_complete(provider):
+    client = LLMClient("groq", "llama-3.1-8b-instant", max_retries=0)
+
+    response = client.chat_until([{"role": "user", "content": "x"}], _fields_complete, temperature=0.5)
+
+    assert response["text"] == "".join(ANSWER[:4])
+    assert response["meta"]["stopped_early"] is True
+    assert provider.streams == [ANSWER[:4]]
+
+
+def test_stream_without_complete_answer_reads_to_the_end(provider):
+    provider.chunks = ["District: Colombo | Intent: ", "Info"]
+    client = LLMClient("groq", "llama-3.1-8b-instant", max_retries=0)
+
+    response = client.chat_until([{"role": "user", "content": "x"}], _fields_complete, temperature=0.5)
+
+    assert response["text"] == "District: Colombo | Intent: Info"
+    assert response["meta"]["stopped_early"] is False
+
+
+def test_repeated_classification_is_served_from_cache(provider):
+    service = ClassificationService()
+
+    first, _, _ = service.classify_message("Family trapped in Ja-Ela", _config(0))
+    second, latency_ms, _ = service.classify_message("Family trapped in Ja-Ela", _config(0))
+
+    assert len(provider.streams) == 1
+    assert (second.district, second.intent, second.priority) == ("Gampaha", "Rescue", "High")
+    assert second.raw_output == first.raw_output
+    assert latency_ms == 0
+    assert [call["notes"] for call in provider.logged] == ["stopped_early", "cache_hit"]
+
+
+def test_async_classification_shares_the_cache(provider):
+    service = ClassificationService()
+
+    service.classify_message("Family trapped in Ja-Ela", _config(0))
+    result, _, _ = asyncio.run(service.aclassify_message("Family trapped in Ja-Ela", _config(0)))
+
+    assert len(provider.streams) == 1
+    assert result.intent == "Rescue"
+    assert provider.logged[-1]["notes"] == "cache_hit"
+
+
+def test_sampled_classification_is_not_cached(provider):
+    service = ClassificationService()
+
+    service.classify_message("Family trapped in Ja-Ela", _config(0.7))
+    service.classify_message("Family trapped in Ja-Ela", _config(0.7))
+
+    assert len(provider.streams) == 2
+
+
+def test_packed_partial_answers_fall_back_to_single_calls(provider, monkeypatch):
+    packed_text = (
+        "1. District: Colombo | Intent: Info | Priority: Low\n"
+        "2.\n"
+        "3. I cannot classify this message\n"
+        "4. District: Galle | Intent: Rescue\n"
+    )
+
+    async def achat(self, messages, **kwargs):
+        return {
+            "text": packed_text,
+            "usage": llm_client.reconcile_usage({}, None),
+            "latency_ms": 5,
+            "raw": None,
+            "meta": {"retry_count": 0, "backoff_ms_total": 0, "overflow_handled": False},
+        }
+
+    monkeypatch.setattr(LLMClient, "achat", achat)
+    messages = ["Kelani river at 9m", "Help!!", "asdf", "Boat needed in Galle", "Trapped in Ja-Ela"]
+
+    results, _, _ = ClassificationService().classify_batch_packed(messages, pack_size=5, provider_config=_config(0.5))
+
+    assert [result.message for result in results] == messages
+    assert (results[0].district, results[0].intent, results[0].priority) == ("Colombo", "Info", "Low")
+    # Items 2-5 had no complete answer and were each classified on their own
+    assert len(provider.streams) == 4
+    for result in results[1:]:
+        assert (result.district, result.intent, result.priority) == ("Gampaha", "Rescue", "High")
@@ -0,0 +1,99 @@
+"""Report writers: column layout and xlsx/CSV round-trips."""
+
+import csv
+
+import pytest
+from openpyxl import load_workbook
+
+from app.utils import file_utils
+
+EVENTS = [
+    {"district": "Colombo", "flood_level_meters": 2.5, "victim_count": 12, "main_need": "Rescue", "status": "Critical"},
+    {"district": "Gampaha", "flood_level_meters": None, "victim_count": 3, "main_need": "Water", "status": "Stable"},
+]
+
+RESULTS = [
+    {"message": 'SOS, "urgent"\nsecond line', "district": "Kandy", "intent": "Rescue", "priority": "High"},
+    {"message": "Need water", "district": None, "intent": "Supply", "priority": "Low"},
+]
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_utils, "ensure_output_directory", lambda: tmp_path)
+    return tmp_path
+
+
+def _sheet_rows(path):
+    workbook = load_workbook(path)
+    return [list(row) for row in workbook.active.iter_rows(values_only=True)]
+
+
+def test_event_layout_full_schema():
+    columns, headers = file_utils._event_layout(EVENTS)
+
+    assert list(columns) == ["district", "flood_level_meters", "victim_count", "main_need", "status"]
+    assert list(headers) == ["District", "Flood Level (m)", "Victim Count", "Main Need", "Status"]
+
+
+def test_event_layout_old_flood_name():
+    events = [{"district": "Galle", "flood_level_m": 1.0, "status": "Warning"}]
+
+    columns, headers = file_utils._event_layout(events)
+
+    assert list(columns) == ["district", "flood_level_m", "status"]
+    assert list(headers) == ["District", "Flood Level (m)", "Status"]
+
+
+def test_event_layout_partial_rows_use_union():
+    events = [{"district": "Matara"}, {"victim_count": 4, "flood_level_m": 0.5, "flood_level_meters": 0.5}]
+
+    columns, headers = file_utils._event_layout(events)
+
+    assert list(columns) == ["district", "flood_level_meters", "victim_count"]
+    assert list(headers) == ["District", "Flood Level (m)", "Victim Count"]
+
+
+def test_crisis_events_xlsx_round_trip(output_dir):
+    path = file_utils.save_crisis_events_to_excel(EVENTS, "events.xlsx")
+
+    rows = _sheet_rows(path)
+    columns, headers = file_utils._event_layout(EVENTS)
+    assert rows[0] == list(headers)
+    assert rows[1:] == [[event[col] for col in columns] for event in EVENTS]
+
+
+def test_classification_xlsx_round_trip(output_dir):
+    path = file_utils.save_classification_results_to_excel(RESULTS, "classified.xlsx")
+
+    rows = _sheet_rows(path)
+    assert rows[0] == ["message", "district", "intent", "priority"]
+    assert rows[1:] == [[row[col] for col in rows[0]] for row in RESULTS]
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _expected_csv_rows():
+    return [{col: "" if value is None else value for col, value in row.items()} for row in RESULTS]
+
+
+def test_classification_csv_round_trip_without_arrow(output_dir, monkeypatch):
+    monkeypatch.setattr(file_utils, "pa", None)
+
+    path = file_utils.save_classification_results_to_csv(RESULTS, "classified.csv")
+
+    assert _read_csv(path) == _expected_csv_rows()
+
+
+def test_classification_csv_matches_arrow_writer(output_dir, monkeypatch):
+    pytest.importorskip("pyarrow")
+    arrow_path = file_utils.save_classification_results_to_csv(RESULTS, "arrow.csv")
+    monkeypatch.setattr(file_utils, "pa", None)
+    python_path = file_utils.save_classification_results_to_csv(RESULTS, "python.csv")
+
+    assert _read_csv(arrow_path) == _expected_csv_rows()
+    with open(arrow_path, "rb") as arrow, open(python_path, "rb") as python:
+        assert arrow.read() == python.read()
@@ -0,0 +1,65 @@
+"""Line scanner: the byte scan agrees with str.splitlines() + strip()."""
+
+import mmap
+
+import numpy as np
+import pytest
+
+from app.utils import file_utils, line_scan
+
+SAMPLES = [
+    b"",
+    b"\n\n  \n",
+    b"one line",
+    b"  SOS Ja-Ela  \n\nNeed water\r\nBoat!\rLast",
+    b"\tleading tab\n trailing space \n\x0bvt\x0cff\x1cfs\x1dgs\x1ers\n\x1funit sep\x1f",
+    "Kelani ගංගාව 9.5m\n  வெள்ளம் alert  \n".encode("utf-8"),
+    b"crlf only\r\n\r\n\r\n",
+]
+
+
+def _expected(buf: bytes) -> list[str]:
+    return [line.strip() for line in buf.decode("utf-8").splitlines() if line.strip()]
+
+
+@pytest.mark.parametrize("buf", SAMPLES)
+def test_python_scan_matches_splitlines(buf, monkeypatch):
+    monkeypatch.setattr(line_scan, "_jit_scan", None)
+
+    assert line_scan.nonempty_lines(buf) == _expected(buf)
+
+
+@pytest.mark.parametrize("buf", SAMPLES)
+def test_numba_scan_matches_python_scan(buf):
+    pytest.importorskip("numba")
+    data = np.frombuffer(buf, dtype=np.uint8)
+
+    np.testing.assert_array_equal(line_scan._jit_scan(data), line_scan._scan_lines(data))
+
+
+def test_scan_reads_mmap(tmp_path):
+    path = tmp_path / "messages.txt"
+    buf = b"\n".join(SAMPLES)
+    path.write_bytes(buf)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert line_scan.nonempty_lines(mm) == _expected(buf)
+
+
+def test_file_reader_uses_scanner_for_large_inputs(monkeypatch):
+    buf = b"\n".join(SAMPLES)
+    calls = []
+    nonempty_lines = line_scan.nonempty_lines
+
+    def scan(data):
+        calls.append(len(data))
+        return nonempty_lines(data)
+
+    monkeypatch.setattr(line_scan, "MIN_SCAN_BYTES", len(buf))
+    monkeypatch.setattr(line_scan, "available", lambda: True)
+    monkeypatch.setattr(line_scan, "_jit_scan", None)
+    monkeypatch.setattr(line_scan, "nonempty_lines", scan)
+
+    assert file_utils._nonempty_lines(buf) == _expected(buf)
+    assert file_utils._nonempty_lines(buf[:-1]) == _expected(buf[:-1])
+    assert calls == [len(buf)]
@@ -0,0 +1,85 @@
+"""Provider rate limiter: concurrency cap, request rate and per-worker share."""
+
+import asyncio
+
+import pytest
+
+from app.config import load_config
+from app.utils import rate_limit
+from app.utils.rate_limit import ProviderLimiter, TokenBucket, get_limiter
+
+
+@pytest.mark.parametrize(
+    "max_in_flight, rpm, workers, expected",
+    [
+        (30, 30, 1, (30, 30)),
+        (30, 30, 4, (7, 7.5)),
+        (2, None, 4, (1, None)),
+        (16, 500, 0, (16, 500)),
+    ],
+)
+def test_worker_limits(max_in_flight, rpm, workers, expected):
+    assert rate_limit._worker_limits(max_in_flight, rpm, workers) == expected
+
+
+def test_slot_caps_concurrency():
+    limiter = ProviderLimiter(max_in_flight=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+    assert limiter.calls == 6
+    assert limiter.in_flight == 0
+    assert limiter.waited_calls >= 4
+
+
+def test_token_bucket_waits_once_burst_is_spent(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        bucket._updated -= seconds
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate_per_minute=60, capacity=2)
+
+    async def main():
+        for _ in range(3):
+            await bucket.acquire()
+
+    asyncio.run(main())
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(1.0, abs=0.01)
+
+
+def test_limiter_is_per_loop_and_split_across_workers(monkeypatch):
+    monkeypatch.setenv("API_WORKERS", "4")
+    load_config.cache_clear()
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+
+    async def limiter():
+        return get_limiter("groq"), get_limiter("groq")
+
+    try:
+        first, same = asyncio.run(limiter())
+        second, _ = asyncio.run(limiter())
+    finally:
+        load_config.cache_clear()
+
+    assert first is same
+    assert second is not first
+    assert rate_limit._limiters["groq"][1] is second
+    # config.yaml: groq max_in_flight 30, rpm 30
+    assert second.max_in_flight == 7
+    assert second._bucket.rate == pytest.approx(7.5 / 60)
@@ -0,0 +1,115 @@
+"""Priority scoring: the Python rule, and the CoT fallback for ambiguous inputs."""
+
+import pytest
+
+from app.services import resource_allocation_service
+from app.services.resource_allocation_service import ResourceAllocationService
+from app.schemas.resource_allocation import IncidentData
+from app.utils.scoring_kernel import NEED_MEDICAL, NEED_OTHER, NEED_RESCUE
+from app.utils.token_utils import reconcile_usage
+
+
+def _incident(need_type=None, age_info=None):
+    return IncidentData(location="Ja-Ela", description="Flooded house", need_type=need_type, age_info=age_info)
+
+
+class FakeClient:
+    """Stands in for the pooled LLMClient; answers every CoT prompt with one score."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _response(self):
+        self.calls += 1
+        return {
+            "text": "Step 1: ...\nScore: 8/10",
+            "usage": reconcile_usage({}, {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}),
+            "latency_ms": 7,
+            "raw": None,
+            "meta": {"retry_count": 0, "backoff_ms_total": 0, "overflow_handled": False},
+        }
+
+    def chat(self, messages, **kwargs):
+        return self._response()
+
+    async def achat(self, messages, **kwargs):
+        return self._response()
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(resource_allocation_service, "get_client", lambda provider, model: client)
+    monkeypatch.setattr(resource_allocation_service, "log_llm_call", lambda **kwargs: None)
+    return client
+
+
+@pytest.mark.parametrize(
+    "need_type, age_info, features",
+    [
+        (None, None, (None, NEED_OTHER)),
+        ("Rescue", "70 years old", (70, NEED_RESCUE)),
+        (" insulin ", "Child aged 3 and mother 30", (3, NEED_MEDICAL)),
+        ("Water", "ages 30, 40", (None, NEED_OTHER)),
+        ("Medicine", None, (None, NEED_MEDICAL)),
+        # Ambiguous: age info without a number, or an unknown need
+        ("Rescue", "elderly", None),
+        ("Boat", "70", None),
+    ],
+)
+def test_rule_features(need_type, age_info, features):
+    assert ResourceAllocationService._rule_features(_incident(need_type, age_info)) == features
+
+
+@pytest.mark.parametrize(
+    "need_type, age_info, score",
+    [
+        (None, None, 5),
+        ("Supply", "25", 5),
+        ("Medicine", None, 6),
+        ("Rescue", None, 8),
+        ("Insulin", "4", 8),
+        ("Rescue", "82", 10),
+    ],
+)
+def test_score_rule(need_type, age_info, score):
+    rule_score, reasoning = ResourceAllocationService()._score_rule(_incident(need_type, age_info))
+
+    assert rule_score == score
+    assert reasoning.startswith("Base Score: 5")
+    assert reasoning.endswith(f"Score: {score}/10")
+
+
+def test_unambiguous_incident_skips_llm(llm):
+    scored, latency_ms, usage = ResourceAllocationService().score_incident_with_cot(_incident("Rescue", "82"))
+
+    assert scored.score == 10
+    assert latency_ms == 0
+    assert usage["total_tokens_actual"] == 0
+    assert llm.calls == 0
+
+
+def test_ambiguous_incident_falls_back_to_llm(llm):
+    scored, latency_ms, _ = ResourceAllocationService().score_incident_with_cot(_incident("Rescue", "elderly"))
+
+    assert scored.score == 8
+    assert latency_ms == 7
+    assert llm.calls == 1
+
+
+def test_use_llm_always_calls_llm(llm):
+    scored, _, _ = ResourceAllocationService().score_incident_with_cot(_incident("Rescue", "82"), use_llm=True)
+
+    assert scored.score == 8
+    assert llm.calls == 1
+
+
+def test_batch_mixes_rule_and_llm_scores_in_order(llm):
+    incidents = [_incident("Rescue", "82"), _incident("Boat"), _incident("Medicine"), _incident(age_info="infant")]
+
+    scored, latency_ms, _ = ResourceAllocationService().score_incidents_batch(incidents)
+
+    assert [item.incident for item in scored] == incidents
+    assert [item.score for item in scored] == [10, 8, 6, 8]
+    assert latency_ms == 14
+    assert llm.calls == 2
@@ -0,0 +1,76 @@
+"""LLMClient response cache: only temperature-0 calls are cached."""
+
+import pytest
+
+from app.utils import llm_client
+from app.utils.llm_client import LLMClient
+from app.utils.response_cache import get_response_cache
+
+MESSAGES = [{"role": "user", "content": "Classify: need water in Galle"}]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    # Token estimates don't matter here and tiktoken may not have its files offline
+    monkeypatch.setattr(
+        llm_client,
+        "count_messages_tokens",
+        lambda *args, **kwargs: {"input_tokens": 10, "context_tokens": 0, "estimated_total": 10},
+    )
+    get_response_cache.cache_clear()
+    client = LLMClient("groq", "llama-3.1-8b-instant", max_retries=0)
+    calls = []
+
+    def fake_call(messages, temperature, max_tokens, **kwargs):
+        calls.append(temperature)
+        return {
+            "text": f"reply {len(calls)}",
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            "raw": None,
+        }
+
+    monkeypatch.setattr(client, "_call_groq", fake_call)
+    client.calls = calls
+    yield client
+    client.close()
+    get_response_cache.cache_clear()
+
+
+@pytest.mark.parametrize("temperature", [None, 0.2, 0.7, 1.0])
+def test_non_zero_temperature_has_no_key(client, temperature):
+    assert client._cache_key(MESSAGES, None, temperature, 64, True, {}) is None
+
+
+def test_zero_temperature_key(client):
+    key = client._cache_key(MESSAGES, None, 0, 64, True, {})
+
+    assert isinstance(key, str)
+    assert client._cache_key(MESSAGES, None, 0, 128, True, {}) != key
+    assert client._cache_key(MESSAGES, None, 0, 64, False, {}) is None
+
+
+def test_zero_temperature_is_served_from_cache(client):
+    first = client.chat(MESSAGES, temperature=0, max_tokens=64)
+    second = client.chat(MESSAGES, temperature=0, max_tokens=64)
+
+    assert client.calls == [0]
+    assert second["text"] == first["text"]
+    assert second["meta"]["cache_hit"] is True
+    assert "cache_hit" not in first["meta"]
+
+
+@pytest.mark.parametrize("temperature", [None, 0.7])
+def test_sampled_calls_always_reach_provider(client, temperature):
+    first = client.chat(MESSAGES, temperature=temperature, max_tokens=64)
+    second = client.chat(MESSAGES, temperature=temperature, max_tokens=64)
+
+    assert client.calls == [temperature, temperature]
+    assert first["text"] != second["text"]
+
+
+def test_use_cache_false_bypasses_cache(client):
+    client.chat(MESSAGES, temperature=0, max_tokens=64)
+    client.chat(MESSAGES, temperature=0, max_tokens=64, use_cache=False)
+
+    assert client.calls == [0, 0]
@@ -0,0 +1,71 @@
+"""Route search: the chosen plan is optimal for small stop counts."""
+
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from app.utils import route_search
+from app.utils.route_search import EXHAUSTIVE, EXHAUSTIVE_MAX_STOPS, evaluate, search_routes
+
+
+def _random_case(n: int, seed: int) -> tuple[np.ndarray, list[int]]:
+    rng = np.random.default_rng(seed)
+    costs = rng.integers(1, 120, size=(n + 1, n + 1)).astype(np.int64)
+    np.fill_diagonal(costs, 0)
+    scores = rng.integers(5, 11, size=n).tolist()
+    return costs, scores
+
+
+def _brute_force(costs: np.ndarray, scores: list[int]) -> tuple[int, int]:
+    score_arr = np.asarray(scores, dtype=np.int64)
+    plans = [evaluate("brute", order, costs, score_arr) for order in permutations(range(len(scores)))]
+    return min((plan.weighted_time, plan.total_time) for plan in plans)
+
+
+@pytest.mark.parametrize("n", range(1, 7))
+@pytest.mark.parametrize("seed", range(5))
+def test_best_plan_is_optimal(n, seed):
+    costs, scores = _random_case(n, seed)
+
+    best, candidates = search_routes(costs, scores)
+
+    assert (best.weighted_time, best.total_time) == _brute_force(costs, scores)
+    assert sorted(best.order) == list(range(n))
+    assert candidates[-1].strategy == EXHAUSTIVE
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_heuristics_never_beat_exhaustive(seed):
+    costs, scores = _random_case(6, seed)
+
+    _, candidates = search_routes(costs, scores)
+    exhaustive = candidates[-1]
+
+    for plan in candidates[:-1]:
+        assert plan.weighted_time >= exhaustive.weighted_time
+        assert evaluate(plan.strategy, plan.order, costs, np.asarray(scores)) == plan
+
+
+def test_exhaustive_plan_matches_its_order():
+    costs, scores = _random_case(5, 42)
+    plan = route_search._exhaustive_plan(costs, np.asarray(scores, dtype=np.int64))
+
+    assert evaluate(EXHAUSTIVE, plan.order, costs, np.asarray(scores)) == plan
+
+
+def test_large_inputs_skip_exhaustive():
+    costs, scores = _random_case(EXHAUSTIVE_MAX_STOPS + 1, 0)
+
+    best, candidates = search_routes(costs, scores)
+
+    assert EXHAUSTIVE not in [plan.strategy for plan in candidates]
+    assert best in candidates
+
+
+def test_no_stops():
+    best, candidates = search_routes(np.zeros((1, 1), dtype=np.int64), [])
+
+    assert best.order == ()
+    assert best.weighted_time == 0
+    assert len(candidates) == 3
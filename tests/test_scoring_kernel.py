@@ -0,0 +1,53 @@
+"""Scoring kernel: compiled, NumPy and pure-Python paths agree."""
+
+import numpy as np
+import pytest
+
+from app.utils import scoring_kernel
+from app.utils.scoring_kernel import NEED_BONUS, NEED_CODES, score_kernel, score_one
+
+
+def _inputs(size: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    vulnerable = rng.random(size) < 0.3
+    need_codes = rng.integers(0, len(NEED_BONUS), size=size).astype(np.int8)
+    return vulnerable, need_codes
+
+
+def _python_loop(vulnerable: np.ndarray, need_codes: np.ndarray) -> np.ndarray:
+    # The uncompiled loop (.py_func when numba wrapped it)
+    loop = getattr(scoring_kernel._jit_loop, "py_func", scoring_kernel._score_loop)
+    return loop(vulnerable, need_codes, NEED_BONUS)
+
+
+def test_every_combination_matches_score_one():
+    combos = [(v, code) for v in (False, True) for code in set(NEED_CODES.values())]
+    vulnerable = np.array([v for v, _ in combos], dtype=np.bool_)
+    need_codes = np.array([code for _, code in combos], dtype=np.int8)
+    expected = [score_one(v, code) for v, code in combos]
+
+    assert scoring_kernel._score_numpy(vulnerable, need_codes).tolist() == expected
+    assert _python_loop(vulnerable, need_codes).tolist() == expected
+    assert score_kernel(vulnerable, need_codes).tolist() == expected
+
+
+@pytest.mark.parametrize("size", [0, 1, 17, 1000])
+def test_python_loop_matches_numpy(size):
+    vulnerable, need_codes = _inputs(size, size)
+
+    np.testing.assert_array_equal(
+        _python_loop(vulnerable, need_codes),
+        scoring_kernel._score_numpy(vulnerable, need_codes),
+    )
+
+
+@pytest.mark.parametrize("size", [1, 17, 1000])
+def test_numba_kernel_matches_fallback(size):
+    pytest.importorskip("numba")
+    vulnerable, need_codes = _inputs(size, size)
+
+    compiled = scoring_kernel._jit_loop(vulnerable, need_codes, NEED_BONUS)
+
+    assert compiled.dtype == np.int8
+    np.testing.assert_array_equal(compiled, _python_loop(vulnerable, need_codes))
+    np.testing.assert_array_equal(compiled, scoring_kernel._score_numpy(vulnerable, need_codes))
@@ -0,0 +1,98 @@
+"""Spam filter: batched checks match per-message checks."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import token_management_service
+from app.services.token_management_service import TokenManagementService
+
+
+class FakeEncoding:
+    """Four characters per token; stands in for tiktoken (no encoding files offline)."""
+
+    def __init__(self):
+        self.vocab = {}
+        self.chunks = []
+
+    def encode(self, text, disallowed_special=()):
+        tokens = []
+        for i in range(0, len(text), 4):
+            chunk = text[i:i + 4]
+            if chunk not in self.vocab:
+                self.vocab[chunk] = len(self.chunks)
+                self.chunks.append(chunk)
+            tokens.append(self.vocab[chunk])
+        return tokens
+
+    def encode_batch(self, texts, num_threads=1, disallowed_special=()):
+        return [self.encode(text) for text in texts]
+
+    def decode(self, tokens):
+        return "".join(self.chunks[token] for token in tokens)
+
+
+class FakeClient:
+    def chat(self, messages, **kwargs):
+        return {"text": " Flood in Ja-Ela, 5 trapped. ", "usage": {}, "latency_ms": 3, "raw": None, "meta": {}}
+
+
+@pytest.fixture(autouse=True)
+def fake_llm(monkeypatch):
+    enc = FakeEncoding()
+    monkeypatch.setattr(token_management_service, "pick_encoding", lambda provider, model: enc)
+    monkeypatch.setattr(
+        token_management_service, "count_text_tokens", lambda text, provider, model: len(enc.encode(text))
+    )
+    monkeypatch.setattr(token_management_service, "get_client", lambda provider, model: FakeClient())
+
+
+MAX_TOKENS = 10
+
+MESSAGES = [
+    "Need water",
+    "x" * (4 * MAX_TOKENS),          # exactly max_tokens: accepted
+    "x" * (4 * MAX_TOKENS + 1),      # one token over: filtered
+    "URGENT!!! " * 20 + "Family trapped on a roof in Ja-Ela, please forward",
+]
+
+
+@pytest.mark.parametrize("strategy", ["truncate", "summarize"])
+def test_batch_matches_single_checks(strategy):
+    service = TokenManagementService()
+
+    results, _ = service.check_and_filter_spam_batch(MESSAGES, MAX_TOKENS, strategy)
+    singles = [service.check_and_filter_spam(message, MAX_TOKENS, strategy)[0] for message in MESSAGES]
+
+    assert [result.model_dump() for result in results] == [result.model_dump() for result in singles]
+    filtered = "BLOCKED/TRUNCATED" if strategy == "truncate" else "SUMMARIZED"
+    assert [result.status for result in results] == ["ACCEPTED", "ACCEPTED", filtered, filtered]
+    assert results[1].original_token_count == MAX_TOKENS
+    assert results[2].original_token_count == MAX_TOKENS + 1
+
+
+def test_truncated_message_keeps_max_tokens():
+    results, _ = TokenManagementService().check_and_filter_spam_batch(MESSAGES, MAX_TOKENS, "truncate")
+
+    assert results[3].processed_message == MESSAGES[3][:4 * MAX_TOKENS] + token_management_service.TRUNCATION_MARKER
+    assert results[3].tokens_saved == results[3].original_token_count - results[3].processed_token_count
+
+
+def test_batch_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        TokenManagementService().check_and_filter_spam_batch(MESSAGES, MAX_TOKENS, "drop")
+
+
+def test_batch_endpoint():
+    from app.main import app
+
+    response = TestClient(app).post(
+        "/api/v1/tokens/check/batch",
+        json={"messages": MESSAGES, "max_tokens": MAX_TOKENS, "strategy": "truncate"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["status"] for result in body["results"]] == [
+        "ACCEPTED", "ACCEPTED", "BLOCKED/TRUNCATED", "BLOCKED/TRUNCATED"
+    ]
+    assert body["results"][0]["processed_message"] == "Need water"